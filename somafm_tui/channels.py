@@ -1,24 +1,37 @@
 """SomaFM channels module"""
 
-import json
 import logging
 import os
 import time
+from array import array
 from concurrent.futures import Future
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Set, Optional, Callable
+from typing import AbstractSet, Any, Dict, FrozenSet, Iterable, List, Optional, Callable
 
 import requests
 
 from .models import Channel
-from .http_client import fetch_json, fetch_json_async
+from .http_client import NOT_MODIFIED, fetch_json
+from .json_utils import (
+    BackgroundJsonWriter,
+    JSONDecodeError,
+    ensure_parent_dir,
+    read_json,
+    write_json_atomic,
+)
 
 API_URL = "https://api.somafm.com/channels.json"
 DEFAULT_TIMEOUT = 10  # seconds
 CACHE_MAX_AGE = 3600  # 1 hour in seconds
 
 
+def _load_cached_channels(cache_file: str) -> List[Channel]:
+    """Parse channels from the on-disk API response cache."""
+    data = read_json(cache_file)
+    channels_data = data.get("channels", [])
+    return [Channel.from_api_response(ch) for ch in channels_data]
+
+
 def fetch_channels(
     timeout: int = DEFAULT_TIMEOUT,
     cache_file: Optional[str] = None,
@@ -26,43 +39,54 @@ def fetch_channels(
 ) -> List[Channel]:
     """
     Fetch channels from SomaFM API.
-    Uses caching to reduce API load.
+    Uses caching to reduce API load; an expired cache is revalidated with
+    If-Modified-Since so an unchanged list is not downloaded again.
     """
     # Try to use cache first
+    cache_mtime: Optional[float] = None
     if cache_file and os.path.exists(cache_file):
         try:
-            cache_age = time.time() - os.path.getmtime(cache_file)
+            cache_mtime = os.path.getmtime(cache_file)
+            cache_age = time.time() - cache_mtime
             if cache_age < cache_max_age:
                 logging.debug(f"Using cached channels (age: {cache_age:.0f}s)")
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-                    channels_data = data.get("channels", [])
-                    return [Channel.from_api_response(ch) for ch in channels_data]
-        except (json.JSONDecodeError, IOError) as e:
+                return _load_cached_channels(cache_file)
+        except (JSONDecodeError, IOError) as e:
             logging.warning(f"Failed to read cache: {e}")
+            # Never revalidate a cache we cannot read
+            cache_mtime = None
 
     # Fetch from API
-    data = fetch_json(API_URL, timeout=timeout)
+    if cache_mtime is None:
+        data = fetch_json(API_URL, timeout=timeout)
+    else:
+        data = fetch_json(API_URL, timeout=timeout, if_modified_since=cache_mtime)
+        if data is NOT_MODIFIED:
+            try:
+                channels = _load_cached_channels(cache_file)
+                # Restart the cache lifetime
+                os.utime(cache_file)
+                logging.debug("Channel list not modified, cache refreshed")
+                return channels
+            except (JSONDecodeError, IOError) as e:
+                logging.warning(f"Failed to read cache: {e}")
+                data = fetch_json(API_URL, timeout=timeout)
 
     if data is None:
         # Try to use stale cache if network fails
         if cache_file and os.path.exists(cache_file):
             logging.warning("Using stale cache due to network error")
             try:
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-                    channels_data = data.get("channels", [])
-                    return [Channel.from_api_response(ch) for ch in channels_data]
-            except (json.JSONDecodeError, IOError):
+                return _load_cached_channels(cache_file)
+            except (JSONDecodeError, IOError):
                 pass
         raise ConnectionError(f"Failed to fetch channels from {API_URL}")
 
-    # Save to cache
+    # Save to cache; written atomically so a crash cannot leave a torn file
     if cache_file:
         try:
             os.makedirs(os.path.dirname(cache_file), exist_ok=True)
-            with open(cache_file, "w") as f:
-                json.dump(data, f)
+            write_json_atomic(cache_file, data)
             logging.debug("Channels cached successfully")
         except IOError as e:
             logging.warning(f"Failed to write cache: {e}")
@@ -71,6 +95,28 @@ def fetch_channels(
     return [Channel.from_api_response(ch) for ch in channels_data]
 
 
+def load_stale_channels(
+    cache_file: str,
+    cache_max_age: int = CACHE_MAX_AGE,
+) -> Optional[List[Channel]]:
+    """Return the cached channel list if it has expired but is readable.
+
+    Lets the UI start from the old list right away while
+    fetch_channels_async() revalidates it. A fresh cache returns None too:
+    fetch_channels() serves that one without touching the network.
+
+    Returns:
+        Cached channels, or None if the cache is missing, unreadable,
+        empty or still fresh
+    """
+    try:
+        if time.time() - os.path.getmtime(cache_file) < cache_max_age:
+            return None
+        return _load_cached_channels(cache_file) or None
+    except (JSONDecodeError, OSError):
+        return None
+
+
 def fetch_channels_async(
     timeout: int = DEFAULT_TIMEOUT,
     cache_file: Optional[str] = None,
@@ -115,7 +161,7 @@ def fetch_channels_async(
             if callback:
                 callback(None)
             return None
-        except (json.JSONDecodeError, IOError) as e:
+        except (JSONDecodeError, IOError) as e:
             # Data processing errors
             logging.error(f"Error processing channel data: {type(e).__name__}: {e}")
             if callback:
@@ -144,23 +190,21 @@ def load_channel_usage(usage_file: str) -> Dict[str, int]:
         return {}
 
     try:
-        with open(usage_file, "r") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
+        return read_json(usage_file)
+    except JSONDecodeError:
         return {}
 
 
 def save_channel_usage(usage_file: str, usage: Dict[str, int]) -> None:
     """Save channel usage history."""
     try:
-        os.makedirs(os.path.dirname(usage_file), exist_ok=True)
-        with open(usage_file, "w") as f:
-            json.dump(usage, f)
+        ensure_parent_dir(usage_file)
+        write_json_atomic(usage_file, usage)
     except IOError as e:
         logging.error(f"Error saving channel usage: {e}")
 
 
-def clean_channel_usage(usage: Dict[str, int], valid_ids: Set[str]) -> Dict[str, int]:
+def clean_channel_usage(usage: Dict[str, int], valid_ids: AbstractSet[str]) -> Dict[str, int]:
     """Remove non-existent channels from history."""
     return {k: v for k, v in usage.items() if k in valid_ids}
 
@@ -179,9 +223,9 @@ def sort_channels_by_usage(channels: List[Channel], usage: Dict[str, int]) -> Li
     return sorted(channels, key=sort_key)
 
 
-def get_valid_channel_ids(channels: List[Channel]) -> Set[str]:
+def get_valid_channel_ids(channels: List[Channel]) -> FrozenSet[str]:
     """Get set of all channel IDs."""
-    return {ch.id for ch in channels}
+    return frozenset(ch.id for ch in channels)
 
 
 def filter_channels_by_query(channels: List[Channel], query: str) -> List[Channel]:
@@ -197,42 +241,135 @@ def filter_channels_by_query(channels: List[Channel], query: str) -> List[Channe
     ]
 
 
-def load_favorites(favorites_file: str) -> Set[str]:
-    """Load favorite channels list."""
+def _bigram_signature(text: str) -> int:
+    """Return a 64-bit Bloom-style mask of the character bigrams in text."""
+    signature = 0
+    for bigram in zip(text, text[1:]):
+        signature |= 1 << (hash(bigram) & 63)
+    return signature
+
+
+class ChannelSearchIndex:
+    """Lowercased channel text kept in parallel lists for fast filtering.
+
+    Built once per channel list, so each search keystroke only runs
+    substring tests against precomputed strings. Every channel also gets a
+    bigram signature: a channel can only contain the query if its signature
+    has all of the query's bits set, which rules out most channels with a
+    single AND.
+
+    The indices matched by the last query are remembered: when the next
+    query extends it (the usual case while typing), only those channels
+    are tested again, and repeating the last query returns the same list
+    object.
+    """
+
+    def __init__(self, channels: List[Channel]):
+        self.channels = channels
+        self._last_query = ""
+        self._last_matches: List[int] = []
+        self._last_result: List[Channel] = channels
+        self._titles = [ch.title.lower() for ch in channels]
+        self._descriptions = [(ch.description or "").lower() for ch in channels]
+        self._signatures = array(
+            "Q",
+            (
+                _bigram_signature(title) | _bigram_signature(description)
+                for title, description in zip(self._titles, self._descriptions)
+            ),
+        )
+
+    def filter(self, query: str) -> List[Channel]:
+        """Filter channels by search query (same rules as filter_channels_by_query)."""
+        if not query:
+            return self.channels
+
+        query_lower = query.lower()
+        if query_lower == self._last_query:
+            return self._last_result
+        if self._last_query and query_lower.startswith(self._last_query):
+            candidates: Iterable[int] = self._last_matches
+        else:
+            candidates = range(len(self.channels))
+
+        query_signature = _bigram_signature(query_lower)
+        titles = self._titles
+        descriptions = self._descriptions
+        signatures = self._signatures
+        matches = [
+            i for i in candidates
+            if signatures[i] & query_signature == query_signature
+            and (query_lower in titles[i] or query_lower in descriptions[i])
+        ]
+        self._last_query = query_lower
+        self._last_matches = matches
+        channels = self.channels
+        self._last_result = [channels[i] for i in matches]
+        return self._last_result
+
+
+def load_favorites(favorites_file: str) -> FrozenSet[str]:
+    """Load favorite channels list.
+
+    Returned as a frozenset: it is shared with the UI, which hashes it on
+    every frame, and a frozenset only computes its hash once.
+    """
     if not os.path.exists(favorites_file):
-        return set()
+        return frozenset()
 
     try:
-        with open(favorites_file, "r") as f:
-            return set(json.load(f))
-    except json.JSONDecodeError:
-        return set()
+        return frozenset(read_json(favorites_file))
+    except JSONDecodeError:
+        return frozenset()
+
 
+def save_favorites(
+    favorites_file: str,
+    favorites: AbstractSet[str],
+    writer: Optional[BackgroundJsonWriter] = None,
+) -> None:
+    """Save favorite channels list.
 
-def save_favorites(favorites_file: str, favorites: Set[str]) -> None:
-    """Save favorite channels list."""
+    Args:
+        writer: Hand the write to this background writer instead of
+            writing inline
+    """
+    if writer is not None:
+        writer.submit(favorites_file, list(favorites))
+        return
     try:
-        os.makedirs(os.path.dirname(favorites_file), exist_ok=True)
-        with open(favorites_file, "w") as f:
-            json.dump(list(favorites), f)
+        ensure_parent_dir(favorites_file)
+        write_json_atomic(favorites_file, list(favorites))
     except IOError as e:
         logging.error(f"Error saving favorites: {e}")
 
 
-def toggle_favorite(channel_id: str, favorites_file: str) -> Set[str]:
-    """Toggle channel favorite status."""
-    favorites = load_favorites(favorites_file)
+def toggle_favorite(
+    channel_id: str,
+    favorites_file: str,
+    favorites: Optional[AbstractSet[str]] = None,
+    writer: Optional[BackgroundJsonWriter] = None,
+) -> FrozenSet[str]:
+    """Toggle channel favorite status.
 
-    if channel_id in favorites:
-        favorites.remove(channel_id)
-    else:
-        favorites.add(channel_id)
+    Args:
+        favorites: Favorites already loaded from favorites_file; not
+            modified
+        writer: Background writer to save with (see save_favorites)
+
+    Returns:
+        New frozenset of favorite channel IDs
+    """
+    if favorites is None:
+        favorites = load_favorites(favorites_file)
+
+    favorites = frozenset(favorites) ^ {channel_id}
 
-    save_favorites(favorites_file, favorites)
+    save_favorites(favorites_file, favorites, writer)
     return favorites
 
 
-def update_channel_usage(channel_id: str, usage_file: str, valid_ids: Set[str]) -> Dict[str, int]:
+def update_channel_usage(channel_id: str, usage_file: str, valid_ids: AbstractSet[str]) -> Dict[str, int]:
     """Update channel last usage time."""
     import time
 
@@ -257,7 +394,7 @@ class FavoriteTrack:
     title: str
     channel_id: str
     channel_name: str
-    added_at: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    added_at: str = field(default_factory=lambda: time.strftime("%Y-%m-%d %H:%M:%S"))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -287,19 +424,29 @@ def load_favorite_tracks(tracks_file: str) -> List[FavoriteTrack]:
         return []
 
     try:
-        with open(tracks_file, "r") as f:
-            data = json.load(f)
-            return [FavoriteTrack.from_dict(item) for item in data]
-    except (json.JSONDecodeError, IOError):
+        data = read_json(tracks_file)
+        return [FavoriteTrack.from_dict(item) for item in data]
+    except (JSONDecodeError, IOError):
         return []
 
 
-def save_favorite_tracks(tracks_file: str, tracks: List[FavoriteTrack]) -> None:
-    """Save favorite tracks list."""
+def save_favorite_tracks(
+    tracks_file: str,
+    tracks: List[FavoriteTrack],
+    writer: Optional[BackgroundJsonWriter] = None,
+) -> None:
+    """Save favorite tracks list.
+
+    Args:
+        writer: Hand the write to this background writer instead of
+            writing inline
+    """
+    if writer is not None:
+        writer.submit(tracks_file, [track.to_dict() for track in tracks], indent=True)
+        return
     try:
-        os.makedirs(os.path.dirname(tracks_file), exist_ok=True)
-        with open(tracks_file, "w") as f:
-            json.dump([track.to_dict() for track in tracks], f, indent=2)
+        ensure_parent_dir(tracks_file)
+        write_json_atomic(tracks_file, [track.to_dict() for track in tracks], indent=True)
     except IOError as e:
         logging.error(f"Error saving favorite tracks: {e}")
 
@@ -310,9 +457,18 @@ def add_favorite_track(
     title: str,
     channel_id: str,
     channel_name: str,
+    tracks: Optional[List[FavoriteTrack]] = None,
+    writer: Optional[BackgroundJsonWriter] = None,
 ) -> List[FavoriteTrack]:
-    """Add a track to favorites."""
-    tracks = load_favorite_tracks(tracks_file)
+    """Add a track to favorites.
+
+    Args:
+        tracks: Favorites already loaded from tracks_file; updated in place
+            instead of reading the file again
+        writer: Background writer to save with (see save_favorite_tracks)
+    """
+    if tracks is None:
+        tracks = load_favorite_tracks(tracks_file)
 
     # Check if track already exists
     for track in tracks:
@@ -327,7 +483,7 @@ def add_favorite_track(
         channel_name=channel_name,
     )
     tracks.insert(0, new_track)  # Add to beginning
-    save_favorite_tracks(tracks_file, tracks)
+    save_favorite_tracks(tracks_file, tracks, writer)
     return tracks
 
 
@@ -1,6 +1,7 @@
 """Application configuration module"""
 
 import configparser
+import io
 import logging
 import os
 from typing import Any, Dict, Optional, Set
@@ -35,6 +36,9 @@ CONFIG_TYPES = {
     "show_footer": bool,
 }
 
+# String values treated as true for boolean options
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+
 # Comments for each config option
 CONFIG_COMMENTS = {
     "theme": "Color theme",
@@ -47,6 +51,13 @@ CONFIG_COMMENTS = {
     "show_footer": "Show footer instructions (true/false)",
 }
 
+# Comment block written at the top of the config file
+_CONFIG_HEADER = (
+    "# Configuration file for SomaFM TUI Player\n#\n"
+    + "".join(f"# {key}: {comment}\n" for key, comment in CONFIG_COMMENTS.items())
+    + "#\n"
+)
+
 # Validation constraints for configuration values
 CONFIG_VALIDATORS = {
     "volume": {
@@ -85,6 +96,9 @@ CONFIG_VALIDATORS = {
     },
 }
 
+# Config directories already created by ensure_config_dir()
+_created_config_dirs: Set[str] = set()
+
 # Allowed themes whitelist (loaded dynamically from themes.json)
 # This is set at runtime to prevent arbitrary theme names
 ALLOWED_THEMES: Optional[Set[str]] = None
@@ -108,8 +122,15 @@ def get_default_config() -> Dict[str, Any]:
 
 
 def ensure_config_dir() -> None:
-    """Create the configuration directory if it doesn't exist."""
+    """Create the configuration directory if it doesn't exist.
+
+    load_config()/save_config() call this every time, so the directory is
+    only created (and stat'ed) once per path and process.
+    """
+    if CONFIG_DIR in _created_config_dirs:
+        return
     os.makedirs(CONFIG_DIR, exist_ok=True)
+    _created_config_dirs.add(CONFIG_DIR)
 
 
 def load_config() -> Dict[str, Any]:
@@ -128,17 +149,19 @@ def load_config() -> Dict[str, Any]:
         parser.read(CONFIG_FILE)
 
         if parser.has_section("somafm"):
-            for key in CONFIG_TYPES:
-                if parser.has_option("somafm", key):
-                    raw_value = parser.get("somafm", key)
-                    try:
-                        # Handle boolean conversion
-                        if CONFIG_TYPES[key] == bool:
-                            config[key] = raw_value.lower() in ("true", "1", "yes", "on")
-                        else:
-                            config[key] = CONFIG_TYPES[key](raw_value)
-                    except (ValueError, TypeError):
-                        pass  # Keep default value
+            section = parser["somafm"]
+            for key, value_type in CONFIG_TYPES.items():
+                raw_value = section.get(key)
+                if raw_value is None:
+                    continue
+                try:
+                    # Handle boolean conversion
+                    if value_type == bool:
+                        config[key] = raw_value.lower() in _TRUE_STRINGS
+                    else:
+                        config[key] = value_type(raw_value)
+                except (ValueError, TypeError):
+                    pass  # Keep default value
 
     except (configparser.Error, IOError, OSError) as e:
         logging.warning(f"Error reading config file: {e}")
@@ -161,13 +184,16 @@ def save_config(config: Dict[str, Any]) -> None:
             value = str(value).lower()
         parser.set("somafm", key, str(value))
 
-    with open(CONFIG_FILE, "w") as f:
-        f.write("# Configuration file for SomaFM TUI Player\n")
-        f.write("#\n")
-        for key, comment in CONFIG_COMMENTS.items():
-            f.write(f"# {key}: {comment}\n")
-        f.write("#\n")
-        parser.write(f)
+    # Render everything first so the file is written in a single call
+    buffer = io.StringIO()
+    buffer.write(_CONFIG_HEADER)
+    parser.write(buffer)
+
+    # Replace the file atomically so a crash never leaves half a config
+    tmp_file = f"{CONFIG_FILE}.tmp"
+    with open(tmp_file, "w") as f:
+        f.write(buffer.getvalue())
+    os.replace(tmp_file, CONFIG_FILE)
 
 
 def update_config(key: str, value: Any, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -211,7 +237,7 @@ def validate_config(config: Dict[str, Any]) -> Dict[str, Any]:
                 if isinstance(value, bool):
                     validated[key] = value
                 elif isinstance(value, str):
-                    validated[key] = value.lower() in ("true", "1", "yes", "on")
+                    validated[key] = value.lower() in _TRUE_STRINGS
                 elif isinstance(value, int):
                     validated[key] = value != 0
                 else:
@@ -49,6 +49,18 @@ MAX_CURSES_COLOR_ID = 254
 TIMER_CHECK_INTERVAL = 10  # Check sleep timer every 10 seconds
 TIMER_DISPLAY_UPDATE_INTERVAL = 1  # Update display every second
 
+# Minimum time between two redraws of the interface (caps at ~30 FPS)
+MIN_FRAME_INTERVAL = 1 / 30
+
+# How long the main loop waits for a key before doing its periodic work
+INPUT_TIMEOUT_MS = 50
+
+# Upper bound on queued keys handled before the next frame is drawn
+MAX_KEYS_PER_FRAME = 64
+
+# Config changes are written once no further change came in for this long
+CONFIG_SAVE_DELAY = 0.5  # seconds
+
 # Cache configuration
 CHANNEL_CACHE_MAX_AGE = 3600  # 1 hour in seconds
 
@@ -62,6 +74,15 @@ HTTP_MAX_WORKERS = 4
 ARTWORKS_TIMEOUT = 10  # seconds
 ARTWORK_MAX_WORKERS = 2  # Limited thread pool for artwork caching
 
+# MPV stream buffering: keep the demuxer cache small so channel switches
+# start quickly and the shown track title stays close to what is heard,
+# while still leaving enough read-ahead to ride out network hiccups.
+MPV_STREAM_OPTIONS = {
+    "demuxer_max_bytes": "512KiB",
+    "demuxer_readahead_secs": 2,
+    "audio_buffer": 0.2,
+}
+
 # =============================================================================
 # File Paths
 # =============================================================================
@@ -149,20 +170,23 @@ SUCCESS_TIMER_SET = "Sleep timer: {} min"
 HELP_OVERLAY_WIDTH = 50
 HELP_OVERLAY_HEIGHT = 32
 
-# Instruction items
-INSTRUCTION_ITEMS = [
+# Instruction items shown in the footer
+INSTRUCTION_ITEMS = (
     "↑↓/jk - select",
     "Enter/l - play",
     "/ - search",
     "Space - pause",
     "h - stop",
-    "f - favorite",
+    "f - track fav",
+    "Ctrl+f - channel fav",
+    "z - only fav",
+    "x - toggle footer",
     "r - bitrate",
     "s - sleep",
     "t/y - theme",
     "PgUp/Dn - volume",
     "q - quit",
-]
+)
 
 # =============================================================================
 # Version
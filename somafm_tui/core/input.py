@@ -4,12 +4,17 @@ Handles all user input including keyboard navigation, search, and sleep timer.
 """
 
 import curses
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, Dict, Optional
 
 from .playback import PlaybackController
 from .state import StateManager
 from ..ui import UIScreen
 
+# Key groups shared by several input modes (get_wch yields str or int)
+_ESC_KEYS = frozenset((chr(27), 27))
+_BACKSPACE_KEYS = frozenset((curses.KEY_BACKSPACE, "\b", "\x7f"))
+_ENTER_KEYS = frozenset((curses.KEY_ENTER, "\n", "\r"))
+
 
 class InputHandler:
     """Handler for user input.
@@ -33,38 +38,85 @@ class InputHandler:
 
         self._stdscr: Optional[curses.window] = None
 
+        # Dispatch table for non-character keys in normal mode
+        self._special_key_handlers: Dict[int, Callable[[], None]] = {
+            curses.KEY_RESIZE: self._on_resize,
+            curses.KEY_UP: self._navigate_up,
+            curses.KEY_DOWN: self._navigate_down,
+            curses.KEY_ENTER: self._play_selected,
+            curses.KEY_PPAGE: self._volume_up,
+            curses.KEY_NPAGE: self._volume_down,
+        }
+
+        # Dispatch table for character keys in normal mode
+        self._string_key_handlers: Dict[str, Callable[[], None]] = {}
+        for keys, handler in (
+            # Search and help
+            ("/", self.state.start_search),
+            ("?", self.state.toggle_help),
+            ("zZ", self._toggle_favorites_filter),
+            ("xX", self._toggle_footer),
+            # Application control
+            ("qQ", self.state.stop),
+            (chr(27), self._close_help),
+            # Playback control
+            ("hH", self.playback.stop_playback),
+            ("\n\rl", self._play_selected),
+            (" ", self._toggle_pause),
+            # Favorites
+            ("f", self._favorite_track),
+            ("\x06", self._favorite_channel),
+            # Navigation
+            ("k", self._navigate_up),
+            ("j", self._navigate_down),
+            # Appearance
+            ("tT", self._next_theme),
+            ("yY", self._previous_theme),
+            # Volume
+            ("vV", self._volume_down),
+            ("bB", self._volume_up),
+            # Sleep timer
+            ("sS", self.state.show_sleep_overlay),
+            # Bitrate
+            ("rR", self.playback.cycle_bitrate),
+        ):
+            for key in keys:
+                self._string_key_handlers[key] = handler
+
     def set_stdscr(self, stdscr: curses.window) -> None:
         """Set curses window reference."""
         self._stdscr = stdscr
 
-    def handle_input(self, key: Any) -> None:
+    def handle_input(self, key: Any) -> bool:
         """Handle user input.
         
         Dispatches to appropriate handler based on current mode.
         
         Args:
             key: Key event from curses
+
+        Returns:
+            True if the key was bound to an action, False if it was ignored
         """
         if self.state.sleep_overlay_active:
-            self._handle_sleep_input(key)
-        elif self.state.is_searching:
-            self._handle_search_input(key)
-        else:
-            self._handle_normal_input(key)
+            return self._handle_sleep_input(key)
+        if self.state.is_searching:
+            return self._handle_search_input(key)
+        return self._handle_normal_input(key)
 
-    def _handle_sleep_input(self, key: Any) -> None:
+    def _handle_sleep_input(self, key: Any) -> bool:
         """Handle input in sleep overlay mode.
         
         Args:
             key: Key event from curses
         """
-        if key == chr(27) or key == 27:  # ESC (string or int)
+        if key in _ESC_KEYS:
             self.state.hide_sleep_overlay()
-        elif key in (curses.KEY_BACKSPACE, "\b", "\x7f"):
+        elif key in _BACKSPACE_KEYS:
             self.state.remove_sleep_input()
         elif isinstance(key, str) and key.isdigit():
             self.state.add_sleep_input(key)
-        elif key in (curses.KEY_ENTER, "\n", "\r"):
+        elif key in _ENTER_KEYS:
             # Set timer
             if self.state.sleep_input:
                 try:
@@ -77,19 +129,22 @@ class InputHandler:
                 except ValueError:
                     pass
             self.state.hide_sleep_overlay()
+        else:
+            return False
+        return True
 
-    def _handle_search_input(self, key: Any) -> None:
+    def _handle_search_input(self, key: Any) -> bool:
         """Handle input in search mode.
 
         Args:
             key: Key event from curses
         """
-        if key == chr(27) or key == 27:  # ESC (string or int)
+        if key in _ESC_KEYS:
             self.state.exit_search()
         elif key == "?":
             self.state.exit_search()
             self.state.toggle_help()
-        elif key in (curses.KEY_BACKSPACE, "\b", "\x7f"):
+        elif key in _BACKSPACE_KEYS:
             self.state.remove_search_char()
         elif isinstance(key, str) and len(key) == 1 and key.isprintable():
             self.state.add_search_char(key)
@@ -105,151 +160,141 @@ class InputHandler:
             if self.playback.is_playing:
                 self.playback.decrease_volume()
                 self._show_volume_overlay()
-        elif key in (curses.KEY_ENTER, "\n", "\r") or (isinstance(key, str) and key == "l"):
+        elif key in _ENTER_KEYS or key == "l":
             selected = self.state.get_selected_channel()
             if selected:
-                channels = self.state.get_all_channels()
                 # Find original index
-                for i, ch in enumerate(channels):
-                    if ch.id == selected.id:
-                        self.state.current_index = i
-                        break
+                index = self.state.get_channel_index(selected.id)
+                if index is not None:
+                    self.state.current_index = index
                 self.playback.play_channel(selected, self.state.current_index)
                 self.state.exit_search()
+        else:
+            return False
+        return True
 
-    def _handle_normal_input(self, key: Any) -> None:
+    def _handle_normal_input(self, key: Any) -> bool:
         """Handle input in normal mode.
         
         Args:
             key: Key event from curses
         """
         if isinstance(key, str):
-            self._handle_string_input(key)
-        else:
-            self._handle_special_key(key)
+            return self._handle_string_input(key)
+        return self._handle_special_key(key)
 
-    def _handle_string_input(self, key: str) -> None:
+    def _handle_string_input(self, key: str) -> bool:
         """Handle string input in normal mode.
         
         Args:
             key: Key character
         """
-        # Search and help
-        if key == "/":
-            self.state.start_search()
-        elif key == "?":
-            self.state.toggle_help()
-        elif key in ("z", "Z"):
-            self.state.toggle_show_only_favorites()
-            if self._stdscr:
-                # Invalidate UI cache to force full redraw when channel list changes
-                if hasattr(self.ui, 'invalidate_cache'):
-                    self.ui.invalidate_cache()
-                msg = "Only favorites" if self.state.show_only_favorites else "All channels"
-                self.ui.show_notification(self._stdscr, msg, timeout=1.0)
-        elif key in ("x", "X"):
-            self.state.toggle_show_footer()
-            if self._stdscr:
-                if hasattr(self.ui, 'invalidate_cache'):
-                    self.ui.invalidate_cache()
-                msg = "Footer shown" if self.state.show_footer else "Footer hidden"
-                self.ui.show_notification(self._stdscr, msg, timeout=1.0)
-
-        # Application control
-        elif key in ("q", "Q"):
-            self.state.stop()
-        elif key == chr(27) or key == 27:  # ESC - close help (string or int)
-            if self.state.show_help:
-                self.state.hide_help()
-
-        # Playback control
-        elif key in ("h", "H"):
-            self.playback.stop_playback()
-        elif key in ("\n", "\r", "l"):
-            selected = self.state.get_selected_channel()
-            if selected:
-                self.playback.play_channel(selected, self.state.current_index)
-        elif key == " ":
-            if self.playback.is_playing:
-                self.playback.toggle_playback()
-
-        # Favorites
-        elif key == "f":
-            # 'f' adds current track to favorites
-            success, message = self.playback.toggle_favorite_track()
-            if self._stdscr and message:
-                self.ui.show_notification(self._stdscr, message)
-        elif key == "\x06":  # Ctrl+F
-            # Ctrl+F toggles channel favorite
-            success, message = self.playback.toggle_channel_favorite()
-            if self._stdscr and message:
-                self.ui.show_notification(self._stdscr, message)
-
-        # Navigation
-        elif key == "k":
-            self.state.navigate_up()
-        elif key == "j":
-            self.state.navigate_down()
+        handler = self._string_key_handlers.get(key)
+        if handler is None:
+            return False
+        handler()
+        return True
 
-        # Appearance
-        elif key in ("t", "T"):
-            new_theme = self.state.cycle_theme()
-            if self._stdscr:
-                theme_info = self.state.get_theme_info()
-                # Показываем уведомление без блокировки
-                self.ui.show_notification(
-                    self._stdscr, f"Theme: {theme_info.get('name', new_theme)}", timeout=1.0
-                )
-        elif key in ("y", "Y"):
-            # Cycle theme in reverse order
-            new_theme = self.state.cycle_theme_reverse()
-            if self._stdscr:
-                theme_info = self.state.get_theme_info()
-                self.ui.show_notification(
-                    self._stdscr, f"Theme: {theme_info.get('name', new_theme)}", timeout=1.0
-                )
-
-        # Volume
-        elif key in ("v", "V"):
-            self.playback.decrease_volume()
-            self._show_volume_overlay()
-        elif key in ("b", "B"):
-            self.playback.increase_volume()
-            self._show_volume_overlay()
-
-        # Sleep timer
-        elif key in ("s", "S"):
-            self.state.show_sleep_overlay()
-
-        # Bitrate
-        elif key in ("r", "R"):
-            self.playback.cycle_bitrate()
-
-    def _handle_special_key(self, key: Any) -> None:
+    def _handle_special_key(self, key: Any) -> bool:
         """Handle special keys (arrows, page keys, etc.).
 
         Args:
             key: Special key code
         """
-        if key == curses.KEY_RESIZE:
-            # Handle terminal resize - invalidate UI cache to trigger full redraw
+        handler = self._special_key_handlers.get(key)
+        if handler is None:
+            return False
+        handler()
+        return True
+
+    # Normal mode actions bound to character keys
+
+    def _toggle_favorites_filter(self) -> None:
+        """Show only favorite channels, or all channels again."""
+        self.state.toggle_show_only_favorites()
+        if self._stdscr:
+            # Invalidate UI cache to force full redraw when channel list changes
             if hasattr(self.ui, 'invalidate_cache'):
                 self.ui.invalidate_cache()
-            return  # Let main loop handle redraw
-        elif key == curses.KEY_UP:
-            self.state.navigate_up()
-        elif key == curses.KEY_DOWN:
-            self.state.navigate_down()
-        elif key == curses.KEY_ENTER:
-            selected = self.state.get_selected_channel()
-            if selected:
-                self.playback.play_channel(selected, self.state.current_index)
-        elif key == curses.KEY_PPAGE:
-            self.playback.increase_volume()
-            self._show_volume_overlay()
-        elif key == curses.KEY_NPAGE:
-            self.playback.decrease_volume()
-            self._show_volume_overlay()
+            msg = "Only favorites" if self.state.show_only_favorites else "All channels"
+            self.ui.show_notification(self._stdscr, msg, timeout=1.0)
+
+    def _toggle_footer(self) -> None:
+        """Show or hide the key hints footer."""
+        self.state.toggle_show_footer()
+        if self._stdscr:
+            if hasattr(self.ui, 'invalidate_cache'):
+                self.ui.invalidate_cache()
+            msg = "Footer shown" if self.state.show_footer else "Footer hidden"
+            self.ui.show_notification(self._stdscr, msg, timeout=1.0)
+
+    def _close_help(self) -> None:
+        """Close the help overlay (ESC)."""
+        if self.state.show_help:
+            self.state.hide_help()
+
+    def _toggle_pause(self) -> None:
+        """Pause or resume playback."""
+        if self.playback.is_playing:
+            self.playback.toggle_playback()
+
+    def _favorite_track(self) -> None:
+        """Add the current track to favorites."""
+        success, message = self.playback.toggle_favorite_track()
+        if self._stdscr and message:
+            self.ui.show_notification(self._stdscr, message)
+
+    def _favorite_channel(self) -> None:
+        """Toggle the selected channel's favorite status (Ctrl+F)."""
+        success, message = self.playback.toggle_channel_favorite()
+        if self._stdscr and message:
+            self.ui.show_notification(self._stdscr, message)
+
+    def _next_theme(self) -> None:
+        """Switch to the next theme."""
+        self._show_theme(self.state.cycle_theme())
+
+    def _previous_theme(self) -> None:
+        """Switch to the previous theme."""
+        self._show_theme(self.state.cycle_theme_reverse())
+
+    def _show_theme(self, new_theme: str) -> None:
+        """Notify about a theme change."""
+        if self._stdscr:
+            theme_info = self.state.get_theme_info()
+            # Показываем уведомление без блокировки
+            self.ui.show_notification(
+                self._stdscr, f"Theme: {theme_info.get('name', new_theme)}", timeout=1.0
+            )
+
+    def _on_resize(self) -> None:
+        """Handle terminal resize - invalidate UI cache to trigger full redraw."""
+        if hasattr(self.ui, 'invalidate_cache'):
+            self.ui.invalidate_cache()
+
+    def _navigate_up(self) -> None:
+        """Move selection up."""
+        self.state.navigate_up()
+
+    def _navigate_down(self) -> None:
+        """Move selection down."""
+        self.state.navigate_down()
+
+    def _play_selected(self) -> None:
+        """Play the selected channel."""
+        selected = self.state.get_selected_channel()
+        if selected:
+            self.playback.play_channel(selected, self.state.current_index)
+
+    def _volume_up(self) -> None:
+        """Increase volume and show the indicator."""
+        self.playback.increase_volume()
+        self._show_volume_overlay()
+
+    def _volume_down(self) -> None:
+        """Decrease volume and show the indicator."""
+        self.playback.decrease_volume()
+        self._show_volume_overlay()
 
     def _show_volume_overlay(self) -> None:
         """Show volume overlay if stdscr is available."""
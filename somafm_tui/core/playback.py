@@ -6,22 +6,26 @@ Manages audio playback including play, pause, stop, volume control, and bitrate
 import json
 import logging
 import time
-from typing import Any, Dict, List, Optional, Callable, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Callable, Tuple
 
+from ..json_utils import BackgroundJsonWriter
 from ..models import Channel, TrackMetadata
-from ..mpris_service import MPRISService
 from ..ui import UIScreen
 from ..channels import (
+    FavoriteTrack,
     load_channel_usage,
     save_channel_usage,
     clean_channel_usage,
-    load_favorite_tracks,
+    get_valid_channel_ids,
     add_favorite_track,
-    is_track_favorite,
     toggle_favorite,
 )
 from .state import StateManager
 
+if TYPE_CHECKING:
+    # dbus_next is only loaded when MPRIS is actually enabled
+    from ..mpris_service import MPRISService
+
 
 class PlaybackController:
     """Controller for audio playback management.
@@ -45,6 +49,8 @@ class PlaybackController:
         channel_usage_file: str,
         channel_favorites_file: str,
         track_favorites_file: str,
+        json_writer: Optional[BackgroundJsonWriter] = None,
+        channel_usage: Optional[Dict[str, int]] = None,
     ):
         self.player_instance = player_instance
         self.player = mpv_player
@@ -55,8 +61,16 @@ class PlaybackController:
         self.channel_usage_file = channel_usage_file
         self.channel_favorites_file = channel_favorites_file
         self.track_favorites_file = track_favorites_file
+        # Writes are handed to this writer when given, else done inline
+        self.json_writer = json_writer
+
+        # Channel usage kept in memory; loaded on first play unless the
+        # caller already has a cleaned copy
+        self._usage: Optional[Dict[str, int]] = channel_usage
+        # Favorite tracks, loaded on first use and kept in memory
+        self._favorite_tracks: Optional[List[FavoriteTrack]] = None
 
-        self.mpris_service: Optional[MPRISService] = None
+        self.mpris_service: Optional["MPRISService"] = None
         self.current_channel: Optional[Channel] = None
         self.current_metadata = TrackMetadata()
         self.current_bitrate = ""
@@ -65,7 +79,25 @@ class PlaybackController:
 
         self._on_playback_change: Optional[Callable] = None
 
-    def set_mpris_service(self, mpris_service: Optional[MPRISService]) -> None:
+    def _record_channel_usage(self, channel_id: str) -> None:
+        """Store the play time for a channel and persist the usage map.
+
+        The usage file is read and cleaned once; afterwards the in-memory
+        copy is updated and written out (in the background if a writer was
+        provided).
+        """
+        if self._usage is None:
+            usage = load_channel_usage(self.channel_usage_file)
+            channels = getattr(self.player_instance, 'channels', [])
+            self._usage = clean_channel_usage(usage, get_valid_channel_ids(channels))
+
+        self._usage[channel_id] = int(time.time())
+        if self.json_writer is not None:
+            self.json_writer.submit(self.channel_usage_file, dict(self._usage))
+        else:
+            save_channel_usage(self.channel_usage_file, self._usage)
+
+    def set_mpris_service(self, mpris_service: Optional["MPRISService"]) -> None:
         """Set MPRIS service reference."""
         self.mpris_service = mpris_service
 
@@ -82,13 +114,7 @@ class PlaybackController:
         """
         try:
             # Update usage
-            now = int(time.time())
-            usage = load_channel_usage(self.channel_usage_file)
-            channels = getattr(self.player_instance, 'channels', [])
-            valid_ids = {ch.id for ch in channels}
-            usage[channel.id] = now
-            usage = clean_channel_usage(usage, valid_ids)
-            save_channel_usage(self.channel_usage_file, usage)
+            self._record_channel_usage(channel.id)
 
             # Get stream URL
             stream_url = channel.get_stream_url()
@@ -106,9 +132,10 @@ class PlaybackController:
                 and self.current_metadata.artist not in ("Loading...", "Unknown", "")
                 and self.current_metadata.title not in ("Loading...", "Unknown", "")
             ):
-                if self.current_metadata.channel_name is None:
-                    self.current_metadata.channel_name = self.current_channel.title
-                self.ui_screen.add_to_history(self.current_metadata)
+                archived = self.current_metadata
+                if archived.channel_name is None:
+                    archived = archived.with_channel(self.current_channel.title)
+                self.ui_screen.add_to_history(archived)
 
             # Start playback
             self.player.pause = False
@@ -198,9 +225,10 @@ class PlaybackController:
             and self.current_metadata.artist not in ("Loading...", "Unknown", "")
             and self.current_metadata.title not in ("Loading...", "Unknown", "")
         ):
-            if self.current_metadata.channel_name is None:
-                self.current_metadata.channel_name = self.current_channel.title
-            self.ui_screen.add_to_history(self.current_metadata)
+            archived = self.current_metadata
+            if archived.channel_name is None:
+                archived = archived.with_channel(self.current_channel.title)
+            self.ui_screen.add_to_history(archived)
 
         self.player.stop()
         self.is_playing = False
@@ -280,7 +308,13 @@ class PlaybackController:
         current_index = self.state_manager.current_index
         if current_index < len(channels):
             channel_id = channels[current_index].id
-            favorites = toggle_favorite(channel_id, self.channel_favorites_file)
+            favorites = toggle_favorite(
+                channel_id,
+                self.channel_favorites_file,
+                favorites=self.state_manager.get_channel_favorites(self.channel_favorites_file),
+                writer=self.json_writer,
+            )
+            self.state_manager.set_channel_favorites(self.channel_favorites_file, favorites)
 
             is_favorite = channel_id in favorites
             message = "Added to favorites" if is_favorite else "Removed from favorites"
@@ -312,12 +346,14 @@ class PlaybackController:
         if artist in ("Loading...", "Unknown") or title in ("Loading...", "Unknown"):
             return False, "No track metadata available"
 
-        add_favorite_track(
+        self._favorite_tracks = add_favorite_track(
             self.track_favorites_file,
             artist=artist,
             title=title,
             channel_id=self.current_channel.id,
             channel_name=self.current_channel.title,
+            tracks=self._favorite_tracks,
+            writer=self.json_writer,
         )
         return True, f"Added to favorites: {artist} - {title}"
 
@@ -327,7 +363,7 @@ class PlaybackController:
         Args:
             metadata: New track metadata
         """
-        if metadata.artist != self.current_metadata.artist or metadata.title != self.current_metadata.title:
+        if not metadata.is_same_track(self.current_metadata):
             self.ui_screen.add_to_history(self.current_metadata)
             self.current_metadata = metadata
             self.ui_screen.update_metadata(metadata)
@@ -6,20 +6,22 @@ Manages application state including navigation, search, sleep timer, and UI stat
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional, Set, Callable
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Optional, Callable, Tuple
 
 from ..models import Channel
 from ..timer import SleepTimer
 from ..themes import get_theme_names, get_color_themes
 from ..config import save_config
 from ..channels import (
-    filter_channels_by_query,
+    ChannelSearchIndex,
     load_favorites,
     sort_channels_by_usage,
     clean_channel_usage,
+    get_valid_channel_ids,
     load_channel_usage,
 )
 from ..constants import (
+    CONFIG_SAVE_DELAY,
     MAX_SEARCH_QUERY_LENGTH,
     MAX_SLEEP_TIMER_MINUTES,
     MIN_SLEEP_TIMER_MINUTES,
@@ -65,6 +67,15 @@ class StateManager:
         self.is_searching = False
         self.search_query = ""
         self.filtered_channels: List[Channel] = []
+        # Rebuilt whenever self.channels is replaced
+        self._search_index: Optional[ChannelSearchIndex] = None
+        # Channel id -> position in self.channels, for the list it was built from
+        self._channel_positions: Dict[str, int] = {}
+        self._channel_positions_for: Optional[List[Channel]] = None
+        # (channels, favorites, favorite channels) for the favorites-only view
+        self._favorites_view: Optional[
+            Tuple[List[Channel], FrozenSet[str], List[Channel]]
+        ] = None
 
         # Help state
         self.show_help = False
@@ -84,14 +95,43 @@ class StateManager:
         self._favorites_file = os.path.join(
             os.path.dirname(config_file), "channel_favorites.json"
         )
+        # Favorite channel IDs per file, loaded on first use
+        self._favorites_cache: Dict[str, FrozenSet[str]] = {}
 
         # Footer visibility state
         self.show_footer = config.get("show_footer", True)
 
+        # Monotonic time at which pending config changes get written
+        self._config_save_due: Optional[float] = None
+        # Config as last read from or written to disk
+        self._saved_config: Dict[str, Any] = dict(config)
+
         # Callbacks
         self._on_state_change: Optional[Callable] = None
         self._on_theme_change: Optional[Callable] = None
 
+    def _schedule_config_save(self) -> None:
+        """Write the config after CONFIG_SAVE_DELAY without further changes."""
+        self._config_save_due = time.monotonic() + CONFIG_SAVE_DELAY
+
+    def flush_config(self, force: bool = False) -> None:
+        """Write pending config changes once their delay has passed.
+
+        Called from the main loop; pass force=True on shutdown. Nothing is
+        written if the changes cancelled out, e.g. a theme cycled forward
+        and back again.
+
+        Args:
+            force: Write pending changes right away
+        """
+        if self._config_save_due is None:
+            return
+        if force or time.monotonic() >= self._config_save_due:
+            self._config_save_due = None
+            if self.config != self._saved_config:
+                save_config(self.config)
+                self._saved_config = dict(self.config)
+
     def set_on_state_change(self, callback: Callable) -> None:
         """Set callback for state changes."""
         self._on_state_change = callback
@@ -104,23 +144,35 @@ class StateManager:
         """Get list of channels to display based on current state.
         
         Returns filtered channels if searching, otherwise all channels.
+        The same list object is returned until the result changes, so
+        callers can detect changes by identity.
         """
         channels = self.channels
         
         # Filter by search query
         if self.is_searching:
             if self.search_query:
-                channels = filter_channels_by_query(channels, self.search_query)
+                channels = self._get_search_index().filter(self.search_query)
             return channels
         
         # Filter by favorites if enabled
         if self.show_only_favorites:
-            favorites = load_favorites(self._favorites_file)
+            favorites = self.get_channel_favorites(self._favorites_file)
             if favorites:
-                channels = [ch for ch in channels if ch.id in favorites]
+                view = self._favorites_view
+                if view is None or view[0] is not channels or view[1] is not favorites:
+                    view = (channels, favorites, [ch for ch in channels if ch.id in favorites])
+                    self._favorites_view = view
+                channels = view[2]
         
         return channels
 
+    def _get_search_index(self) -> ChannelSearchIndex:
+        """Return the search index for the current channel list."""
+        if self._search_index is None or self._search_index.channels is not self.channels:
+            self._search_index = ChannelSearchIndex(self.channels)
+        return self._search_index
+
     def navigate_up(self, step: int = 1) -> None:
         """Navigate up in channel list."""
         channels = self.get_channels_to_display()
@@ -143,27 +195,31 @@ class StateManager:
         """Navigate page down."""
         self.navigate_down(page_size)
 
-    def update_scroll_offset(self, panel_height: int) -> None:
+    def update_scroll_offset(
+        self, panel_height: int, channels: Optional[List[Channel]] = None
+    ) -> None:
         """Update scroll offset to keep current selection visible.
         
         Args:
             panel_height: Height of the channel panel in rows
+            channels: Channels being displayed, if the caller already has them
         """
-        channels = self.get_channels_to_display()
-        visible_channels = panel_height - 3
-        max_scroll = max(0, len(channels) - visible_channels)
+        if channels is None:
+            channels = self.get_channels_to_display()
+
+        # Clamp the selection first so the offset only has to be fixed once
+        if self.current_index >= len(channels):
+            self.current_index = max(0, len(channels) - 1)
 
+        visible_channels = panel_height - 3
         if self.current_index < self.scroll_offset:
             self.scroll_offset = self.current_index
         elif self.current_index >= self.scroll_offset + visible_channels:
-            self.scroll_offset = min(max_scroll, self.current_index - visible_channels + 1)
+            self.scroll_offset = self.current_index - visible_channels + 1
 
+        max_scroll = max(0, len(channels) - visible_channels)
         self.scroll_offset = max(0, min(max_scroll, self.scroll_offset))
 
-        # Ensure current selection is visible
-        if self.current_index >= len(channels):
-            self.current_index = max(0, len(channels) - 1)
-
     def start_search(self) -> None:
         """Enter search mode."""
         self.is_searching = True
@@ -210,7 +266,7 @@ class StateManager:
         """Toggle show only favorites mode."""
         self.show_only_favorites = not self.show_only_favorites
         self.config["show_only_favorites"] = self.show_only_favorites
-        save_config(self.config)
+        self._schedule_config_save()
         self.current_index = 0
         self._notify_state_change()
 
@@ -218,7 +274,7 @@ class StateManager:
         """Toggle footer visibility."""
         self.show_footer = not self.show_footer
         self.config["show_footer"] = self.show_footer
-        save_config(self.config)
+        self._schedule_config_save()
         self._notify_state_change()
 
     def hide_help(self) -> None:
@@ -355,21 +411,7 @@ class StateManager:
         Returns:
             Name of the new theme
         """
-        themes = get_theme_names()
-        try:
-            current_index = themes.index(self._current_theme)
-            next_index = (current_index + 1) % len(themes)
-        except ValueError:
-            next_index = 0
-
-        self._current_theme = themes[next_index]
-        self.config["theme"] = self._current_theme
-        save_config(self.config)
-
-        if self._on_theme_change:
-            self._on_theme_change(self._current_theme)
-
-        return self._current_theme
+        return self._step_theme(1)
 
     def cycle_theme_reverse(self) -> str:
         """Cycle to previous theme (in reverse order).
@@ -377,16 +419,22 @@ class StateManager:
         Returns:
             Name of the new theme
         """
+        return self._step_theme(-1)
+
+    def _step_theme(self, step: int) -> str:
+        """Move step positions through the sorted theme list and apply it.
+
+        An unknown current theme restarts at the first theme.
+        """
         themes = get_theme_names()
         try:
-            current_index = themes.index(self._current_theme)
-            prev_index = (current_index - 1) % len(themes)
+            new_index = (themes.index(self._current_theme) + step) % len(themes)
         except ValueError:
-            prev_index = 0
+            new_index = 0
 
-        self._current_theme = themes[prev_index]
+        self._current_theme = themes[new_index]
         self.config["theme"] = self._current_theme
-        save_config(self.config)
+        self._schedule_config_save()
 
         if self._on_theme_change:
             self._on_theme_change(self._current_theme)
@@ -406,16 +454,34 @@ class StateManager:
         """Get current theme name."""
         return self._current_theme
 
-    def get_channel_favorites(self, favorites_file: str) -> Set[str]:
-        """Load favorite channel IDs.
-        
+    def get_channel_favorites(self, favorites_file: str) -> FrozenSet[str]:
+        """Get favorite channel IDs.
+
+        The file is read once; later calls return the cached set, which is
+        kept current via set_channel_favorites().
+
         Args:
             favorites_file: Path to favorites file
-            
+
         Returns:
-            Set of favorite channel IDs
+            Frozenset of favorite channel IDs
         """
-        return load_favorites(favorites_file)
+        favorites = self._favorites_cache.get(favorites_file)
+        if favorites is None:
+            favorites = load_favorites(favorites_file)
+            self._favorites_cache[favorites_file] = favorites
+        return favorites
+
+    def set_channel_favorites(
+        self, favorites_file: str, favorites: AbstractSet[str]
+    ) -> None:
+        """Replace cached favorite channel IDs after they were saved.
+
+        Args:
+            favorites_file: Path to favorites file
+            favorites: New set of favorite channel IDs
+        """
+        self._favorites_cache[favorites_file] = frozenset(favorites)
 
     def get_selected_channel(self) -> Optional[Channel]:
         """Get currently selected channel.
@@ -436,6 +502,20 @@ class StateManager:
         """
         return self.channels
 
+    def get_channel_index(self, channel_id: str) -> Optional[int]:
+        """Get the position of a channel in the full channel list.
+
+        Args:
+            channel_id: Channel ID to look up
+
+        Returns:
+            Index into get_all_channels(), or None if the ID is unknown
+        """
+        if self._channel_positions_for is not self.channels:
+            self._channel_positions = {ch.id: i for i, ch in enumerate(self.channels)}
+            self._channel_positions_for = self.channels
+        return self._channel_positions.get(channel_id)
+
     def stop(self) -> None:
         """Stop the application."""
         self.running = False
@@ -464,6 +544,6 @@ class StateManager:
             usage_file: Path to channel usage file
         """
         usage = load_channel_usage(usage_file)
-        valid_ids = {ch.id for ch in self.channels}
+        valid_ids = get_valid_channel_ids(self.channels)
         usage = clean_channel_usage(usage, valid_ids)
         self.channels = sort_channels_by_usage(self.channels, usage)
@@ -8,16 +8,30 @@ import logging
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Any, Dict, Optional, Callable
+from email.utils import formatdate
+from typing import Any, Dict, Optional, Callable, Union
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .json_utils import JSONDecodeError, loads
+
 DEFAULT_TIMEOUT = 10  # seconds
 DEFAULT_RETRIES = 3
 DEFAULT_BACKOFF_FACTOR = 0.5
 
+
+class NotModified:
+    """Type of NOT_MODIFIED; compare results with ``is NOT_MODIFIED``."""
+
+    def __repr__(self) -> str:
+        return "NOT_MODIFIED"
+
+
+# Returned by fetch_json() when a conditional request gets 304 Not Modified
+NOT_MODIFIED = NotModified()
+
 # Module-level singleton with thread-safe initialization
 _http_client: Optional["HttpClient"] = None
 _http_client_lock = threading.Lock()
@@ -118,17 +132,25 @@ class HttpClient:
         self,
         url: str,
         timeout: Optional[int] = None,
-    ) -> Optional[Dict[str, Any]]:
+        if_modified_since: Optional[float] = None,
+    ) -> Union[Dict[str, Any], NotModified, None]:
         """Fetch JSON data from URL.
         
         Args:
             url: URL to fetch from
             timeout: Request timeout (uses default if not specified)
+            if_modified_since: Unix time of the cached copy; makes the
+                request conditional
             
         Returns:
-            Parsed JSON data or None if request failed
+            Parsed JSON data, NOT_MODIFIED if the server reports the cached
+            copy is current, or None if request failed. Callers passing
+            if_modified_since must check for NOT_MODIFIED.
         """
-        return self._fetch_with_retry(url, timeout=timeout, parse_json=True)
+        headers = None
+        if if_modified_since is not None:
+            headers = {"If-Modified-Since": formatdate(if_modified_since, usegmt=True)}
+        return self._fetch_with_retry(url, timeout=timeout, parse_json=True, headers=headers)
     
     def fetch_bytes(
         self,
@@ -151,6 +173,7 @@ class HttpClient:
         url: str,
         timeout: Optional[int] = None,
         parse_json: bool = True,
+        headers: Optional[Dict[str, str]] = None,
     ) -> Optional[Any]:
         """Internal method for fetching with retry logic.
         
@@ -158,9 +181,11 @@ class HttpClient:
             url: URL to fetch from
             timeout: Request timeout
             parse_json: Whether to parse response as JSON
+            headers: Extra request headers
             
         Returns:
-            Response data (dict or bytes) or None if all retries failed
+            Response data (dict or bytes), NOT_MODIFIED on a 304 response
+            or None if all retries failed
         """
         last_error: Optional[Exception] = None
         session = self.get_session()
@@ -168,11 +193,17 @@ class HttpClient:
         
         for attempt in range(self.retries):
             try:
-                response = session.get(url, timeout=effective_timeout)
+                if headers:
+                    response = session.get(url, timeout=effective_timeout, headers=headers)
+                else:
+                    response = session.get(url, timeout=effective_timeout)
+                if response.status_code == 304:
+                    return NOT_MODIFIED
                 response.raise_for_status()
                 
                 if parse_json:
-                    return response.json()
+                    # json_utils uses orjson when available
+                    return loads(response.content)
                 else:
                     return response.content
                     
@@ -181,7 +212,7 @@ class HttpClient:
                 logging.warning(
                     f"Timeout fetching {url} (attempt {attempt + 1}/{self.retries})"
                 )
-            except requests.RequestException as e:
+            except (requests.RequestException, JSONDecodeError) as e:
                 last_error = e
                 logging.warning(
                     f"Error fetching {url} (attempt {attempt + 1}/{self.retries}): {e}"
@@ -273,7 +304,8 @@ def fetch_json(
     timeout: int = DEFAULT_TIMEOUT,
     retries: int = DEFAULT_RETRIES,
     backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
-) -> Optional[Dict[str, Any]]:
+    if_modified_since: Optional[float] = None,
+) -> Union[Dict[str, Any], NotModified, None]:
     """Fetch JSON data with retry logic.
 
     Uses HttpClient singleton for connection pooling.
@@ -283,16 +315,22 @@ def fetch_json(
         timeout: Request timeout
         retries: Number of retry attempts
         backoff_factor: Backoff factor for retries
+        if_modified_since: Unix time of the cached copy; makes the
+            request conditional
 
     Returns:
-        Parsed JSON data or None
+        Parsed JSON data, NOT_MODIFIED if the server reports the cached
+        copy is current, or None if request failed. Callers passing
+        if_modified_since must check for NOT_MODIFIED.
     """
     # For custom retries/backoff, create temporary client
     if retries != DEFAULT_RETRIES or backoff_factor != DEFAULT_BACKOFF_FACTOR:
         client = HttpClient(retries=retries, backoff_factor=backoff_factor, timeout=timeout)
-        return client.fetch_json(url, timeout=timeout)
+        return client.fetch_json(url, timeout=timeout, if_modified_since=if_modified_since)
 
-    return HttpClient.get_instance().fetch_json(url, timeout=timeout)
+    return HttpClient.get_instance().fetch_json(
+        url, timeout=timeout, if_modified_since=if_modified_since
+    )
 
 
 def fetch_bytes(
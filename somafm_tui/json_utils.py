@@ -0,0 +1,190 @@
+"""JSON helpers with optional orjson acceleration.
+
+orjson is used when installed (``pip install somafm-tui[fast]``); otherwise
+the standard library json module is used. Both paths work on bytes so
+callers can always open files in binary mode.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+from typing import Any, Dict, Optional, Set, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+# Directories already created by ensure_parent_dir()
+_created_dirs: Set[str] = set()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text as str or UTF-8 bytes
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def read_json(path: str) -> Any:
+    """Read and parse a JSON file.
+
+    Raises:
+        OSError: If the file cannot be read
+        JSONDecodeError: If the content is not valid JSON
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def ensure_parent_dir(path: str) -> None:
+    """Create the directory containing path if needed.
+
+    State files are saved on key presses; the directory is only created
+    (and stat'ed) once per directory and process.
+    """
+    directory = os.path.dirname(path)
+    if not directory or directory in _created_dirs:
+        return
+    os.makedirs(directory, exist_ok=True)
+    _created_dirs.add(directory)
+
+
+def write_json(path: str, obj: Any, indent: bool = False) -> None:
+    """Serialize an object and write it to a file.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    with open(path, "wb") as f:
+        f.write(dumps(obj, indent=indent))
+
+
+def write_json_atomic(path: str, obj: Any, indent: bool = False) -> None:
+    """Write a JSON file via a temporary sibling and os.replace().
+
+    Readers never see a partially written file, even if the process dies
+    in the middle of the write.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    tmp_path = f"{path}.tmp"
+    write_json(tmp_path, obj, indent=indent)
+    os.replace(tmp_path, path)
+
+
+class BackgroundJsonWriter:
+    """Writes JSON files from a single background thread.
+
+    Callers hand over a snapshot of the data with :meth:`submit` and return
+    immediately; the file I/O happens on one long-lived daemon thread that
+    is started on first use. Call :meth:`close` on shutdown to make sure
+    everything queued reaches the disk.
+
+    Snapshots queued for the same path while the thread was busy are
+    coalesced so only the newest is written, a snapshot equal to the one
+    last written to its path is skipped, and every file is replaced
+    atomically.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Optional[Tuple[str, Any, bool]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # Last (obj, indent) successfully written per path; writer thread only
+        self._written: Dict[str, Tuple[Any, bool]] = {}
+
+    def submit(self, path: str, obj: Any, indent: bool = False) -> None:
+        """Queue an object to be written to path.
+
+        Args:
+            path: Destination file
+            obj: Data to serialize; must not be mutated after submitting
+            indent: Pretty-print the output
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="json-writer", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((path, obj, indent))
+
+    def flush(self) -> None:
+        """Block until all queued writes are done."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending writes and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join()
+
+    def _run(self) -> None:
+        while True:
+            # Take everything queued so far; later snapshots of a path
+            # replace earlier ones
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            pending: Dict[str, Tuple[Any, bool]] = {}
+            stop = False
+            for item in items:
+                if item is None:
+                    stop = True
+                else:
+                    path, obj, indent = item
+                    pending[path] = (obj, indent)
+            try:
+                for path, snapshot in pending.items():
+                    if self._written.get(path) == snapshot:
+                        continue
+                    obj, indent = snapshot
+                    try:
+                        ensure_parent_dir(path)
+                        write_json_atomic(path, obj, indent=indent)
+                    except (OSError, TypeError, ValueError) as e:
+                        logging.error(f"Error writing {path}: {e}")
+                    else:
+                        self._written[path] = snapshot
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            if stop:
+                return
@@ -1,32 +1,82 @@
 """Data types module"""
 
 import logging
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import time
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Any, Tuple
 import re
 
 from .bitrate_utils import (
     extract_bitrate_from_url,
     extract_bitrate_from_playlist_filename,
-    map_bitrate_number_to_label,
     map_label_to_bitrate_numbers,
     get_bitrate_sort_key,
-    LABEL_TO_BITRATE_NUMS,
-    FORMAT_PRIORITY,
-    BITRATE_ORDER,
 )
 
 
-@dataclass
+# (epoch second, formatted "HH:MM:SS") of the last clock_hms() call
+_hms_cache = [-1, ""]
+
+
+def clock_hms() -> str:
+    """Return the current local time as "HH:MM:SS".
+
+    The formatted string is reused for calls within the same second, so
+    bursts of metadata events don't each pay for strftime().
+    """
+    now = int(time.time())
+    if now != _hms_cache[0]:
+        _hms_cache[0] = now
+        _hms_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _hms_cache[1]
+
+
+def parse_icy_title(icy_title: str) -> Optional[Tuple[str, str]]:
+    """Split an ICY StreamTitle into (artist, title).
+
+    Stations use either " - " or an en dash " – " between artist and
+    title; a plain hyphen takes precedence when both appear.
+
+    Returns:
+        (artist, title) with surrounding whitespace stripped, or None if
+        the string has no separator
+    """
+    separator = " - " if " - " in icy_title else " – "
+    artist, found, title = icy_title.partition(separator)
+    if not found:
+        return None
+    return artist.strip(), title.strip()
+
+
+@dataclass(frozen=True)
 class TrackMetadata:
-    """Current track metadata"""
+    """Current track metadata.
+
+    Instances are immutable; use :meth:`with_channel` / :meth:`with_timestamp`
+    to derive an updated copy instead of mutating a shared object.
+    """
     artist: str = "Loading..."
     title: str = "Loading..."
     duration: str = "--:--"
     timestamp: Optional[str] = None
     channel_name: Optional[str] = None
 
+    def is_same_track(self, other: "TrackMetadata") -> bool:
+        """Check whether both entries describe the same track.
+
+        Only artist and title identify a track; volatile fields such as the
+        timestamp are ignored.
+        """
+        return self.artist == other.artist and self.title == other.title
+
+    def with_channel(self, channel_name: Optional[str]) -> "TrackMetadata":
+        """Return a copy tagged with the given channel name."""
+        return replace(self, channel_name=channel_name)
+
+    def with_timestamp(self, timestamp: Optional[str]) -> "TrackMetadata":
+        """Return a copy with the given timestamp."""
+        return replace(self, timestamp=timestamp)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -224,7 +274,7 @@ class TrackHistoryEntry:
         return cls(
             artist=metadata.artist,
             title=metadata.title,
-            timestamp=metadata.timestamp or datetime.now().strftime("%H:%M:%S"),
+            timestamp=metadata.timestamp or clock_hms(),
         )
 
 
@@ -4,7 +4,6 @@ import asyncio
 import logging
 import os
 import hashlib
-import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any, Dict
 
@@ -76,21 +75,12 @@ class MediaPlayer2PlayerInterface(ServiceInterface):
 
     @method()
     def Next(self) -> None:
-        if hasattr(self.player, "channels") and self.player.channels:
-            total_channels = len(self.player.channels)
-            self.player.current_index = (self.player.current_index + 1) % total_channels
-            self.player._play_channel(self.player.channels[self.player.current_index])
-            if self.player.stdscr:
-                self.player._display_interface()
+        # Runs on the D-Bus thread: the main loop switches the channel
+        self.player._event_queue.put(("step", 1))
 
     @method()
     def Previous(self) -> None:
-        if hasattr(self.player, "channels") and self.player.channels:
-            total_channels = len(self.player.channels)
-            self.player.current_index = (self.player.current_index - 1) % total_channels
-            self.player._play_channel(self.player.channels[self.player.current_index])
-            if self.player.stdscr:
-                self.player._display_interface()
+        self.player._event_queue.put(("step", -1))
 
     @method()
     def Pause(self) -> None:
@@ -7,8 +7,10 @@ Refactored architecture with separated concerns:
 - UIScreen: Display rendering
 """
 
+import importlib.util
 import json
 import os
+import queue
 import shutil
 import sys
 import time
@@ -16,7 +18,7 @@ import logging
 import signal
 import threading
 import locale
-from typing import Optional, Any, Dict, List, Callable
+from typing import TYPE_CHECKING, Optional, Any, Dict, List, Callable, Tuple
 
 # Set locale to C for MPV compatibility
 locale.setlocale(locale.LC_NUMERIC, "C")
@@ -62,11 +64,10 @@ def check_dependencies() -> None:
         },
     }
 
-    # Check each dependency
+    # Check each dependency. find_spec() only locates the module instead of
+    # importing it, so optional packages like dbus_next are not loaded here.
     for dep_name, dep_info in install_instructions.items():
-        try:
-            __import__(dep_info["import"])
-        except ImportError:
+        if importlib.util.find_spec(dep_info["import"]) is None:
             missing_deps.append((dep_name, dep_info))
 
     # Report missing dependencies
@@ -101,18 +102,42 @@ def check_dependencies() -> None:
             input("\nPress Enter to continue...")
 
 
-# Module-level imports (after dependency check function definition)
-# These are safe to import at module level because check_dependencies() is defined above
+# Module-level imports (after dependency check function definition).
+# mpv (libmpv) and the MPRIS/D-Bus service are imported where they are first
+# used so loading them stays off the startup path.
 import curses
-import mpv
-import requests
 
 # Imports for module-level constants and functions
-from somafm_tui.config import CONFIG_DIR, CONFIG_FILE, HOME, set_allowed_themes
-from somafm_tui.themes import get_theme_names, apply_theme
-from somafm_tui.models import TrackMetadata, Channel
+from somafm_tui.config import (
+    CONFIG_DIR,
+    CONFIG_FILE,
+    HOME,
+    load_config,
+    set_allowed_themes,
+    validate_config,
+)
+from somafm_tui.channels import (
+    fetch_channels,
+    fetch_channels_async,
+    load_stale_channels,
+    load_favorites,
+    load_channel_usage,
+    save_channel_usage,
+    clean_channel_usage,
+    get_valid_channel_ids,
+    sort_channels_by_usage,
+    filter_channels_by_query,
+)
+from somafm_tui.constants import (
+    INPUT_TIMEOUT_MS,
+    MAX_KEYS_PER_FRAME,
+    MIN_FRAME_INTERVAL,
+    MPV_STREAM_OPTIONS,
+)
+from somafm_tui.json_utils import BackgroundJsonWriter
+from somafm_tui.themes import get_theme_names, apply_theme, load_themes_raw
+from somafm_tui.models import TrackMetadata, Channel, parse_icy_title
 from somafm_tui.ui import UIScreen
-from somafm_tui.timer import SleepTimer
 from somafm_tui.core import PlaybackController, StateManager, InputHandler
 from somafm_tui.cli import (
     parse_args,
@@ -122,6 +147,9 @@ from somafm_tui.cli import (
     print_themes,
 )
 
+if TYPE_CHECKING:
+    from somafm_tui.mpris_service import MPRISService
+
 
 # Constants
 TEMP_DIR = "/tmp/.somafmtmp"
@@ -135,7 +163,7 @@ TRACK_FAVORITES_FILE = os.path.join(CONFIG_DIR, "track_favorites.json")
 def ensure_directories() -> None:
     """Create required directories and migrate old config if needed."""
     os.makedirs(CONFIG_DIR, exist_ok=True)
-    os.makedirs(TEMP_DIR, exist_ok=True)
+    # CACHE_DIR lives inside TEMP_DIR, so this creates both
     os.makedirs(CACHE_DIR, exist_ok=True)
     
     # Migrate from old ~/.somafm_tui to XDG ~/.config/somafm_tui
@@ -166,8 +194,10 @@ def _migrate_old_config(old_dir: str) -> None:
 
 
 def setup_logging() -> None:
-    """Configure logging."""
-    ensure_directories()
+    """Configure logging.
+
+    Expects TEMP_DIR to exist; call ensure_directories() first.
+    """
     logging.basicConfig(
         filename=os.path.join(TEMP_DIR, "somafm.log"),
         level=logging.DEBUG,
@@ -175,6 +205,19 @@ def setup_logging() -> None:
     )
 
 
+_app_environment_ready = False
+
+
+def prepare_app_environment() -> None:
+    """Create directories and configure logging once per process."""
+    global _app_environment_ready
+    if _app_environment_ready:
+        return
+    ensure_directories()
+    setup_logging()
+    _app_environment_ready = True
+
+
 def _create_signal_handler(player_instance: "SomaFMPlayer") -> Callable[[int, Any], None]:
     """Create a signal handler closure for the given player instance.
 
@@ -219,14 +262,30 @@ class SomaFMPlayer:
         self,
         config: Optional[Dict[str, Any]] = None,
         channels: Optional[List[Channel]] = None,
+        channel_usage: Optional[Dict[str, int]] = None,
     ):
         self.had_error = False
         self._signal_received = False
         self._data_lock = threading.Lock()  # Lock for thread-safe data access
         self._prev_show_help = False  # Track help state for full redraw on close
         self._prev_sleep_overlay = False  # Track sleep overlay for ghost cleanup
-        ensure_directories()
-        setup_logging()
+        # (stdscr, theme name, raw themes) the terminal colors were last
+        # programmed for; init_colors() skips curses calls while unchanged
+        self._applied_theme_key: Optional[Tuple[Any, str, Any]] = None
+        # Set whenever the screen is out of date (keys, callbacks, mpv
+        # events); the main loop redraws once and clears it
+        self._dirty = True
+        # Last icy-title handled and the metadata it produced; lets repeated
+        # events be skipped until playback resets the current metadata
+        self._last_icy_title: Optional[str] = None
+        self._last_icy_metadata: Optional[TrackMetadata] = None
+        # Events posted by background threads (mpv observers) as
+        # (kind, payload); applied on the main thread by _drain_events()
+        self._event_queue: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        # Cleaned channel usage from startup, handed to PlaybackController
+        # so the first play doesn't read the usage file again
+        self._channel_usage = channel_usage
+        prepare_app_environment()
         self._setup_signal_handlers()
 
         # Dependencies already checked by check_dependencies() at module load
@@ -261,7 +320,14 @@ class SomaFMPlayer:
 
     def _init_mpv(self) -> None:
         """Initialize MPV player."""
-        self.player = mpv.MPV(input_default_bindings=True, input_vo_keyboard=True, osc=True)
+        import mpv
+
+        self.player = mpv.MPV(
+            input_default_bindings=True,
+            input_vo_keyboard=True,
+            osc=True,
+            **MPV_STREAM_OPTIONS,
+        )
 
     def _init_components(self) -> None:
         """Initialize core application components."""
@@ -273,6 +339,9 @@ class SomaFMPlayer:
             config_file=CONFIG_FILE,
         )
 
+        # Background writer for JSON state files
+        self.json_writer = BackgroundJsonWriter()
+
         # Playback controller
         self.playback = PlaybackController(
             player_instance=self,
@@ -284,6 +353,8 @@ class SomaFMPlayer:
             channel_usage_file=CHANNEL_USAGE_FILE,
             channel_favorites_file=CHANNEL_FAVORITES_FILE,
             track_favorites_file=TRACK_FAVORITES_FILE,
+            json_writer=self.json_writer,
+            channel_usage=self._channel_usage,
         )
 
         # Input handler
@@ -301,7 +372,7 @@ class SomaFMPlayer:
 
     def _init_mpris(self) -> None:
         """Initialize MPRIS service."""
-        self.mpris_service: Optional[MPRISService] = None
+        self.mpris_service: Optional["MPRISService"] = None
         self.mpris_thread: Optional[threading.Thread] = None
 
         if not self.config.get("dbus_allowed", False):
@@ -309,6 +380,8 @@ class SomaFMPlayer:
             return
 
         try:
+            from somafm_tui.mpris_service import MPRISService, run_mpris_loop
+
             self.mpris_service = MPRISService(self, cache_dir=CACHE_DIR)
             self.mpris_thread = threading.Thread(
                 target=run_mpris_loop, args=(self.mpris_service,), daemon=True
@@ -324,31 +397,27 @@ class SomaFMPlayer:
         except (OSError, IOError) as e:
             logging.error(f"MPRIS service I/O error: {e}")
 
-    def _fetch_channels(self, async_mode: bool = False) -> None:
-        """Fetch channel list.
-        
-        Args:
-            async_mode: If True, fetch channels asynchronously (non-blocking)
-        """
-        if async_mode:
-            self._fetch_channels_async()
-        else:
-            self._fetch_channels_sync()
+    def _fetch_channels(self) -> None:
+        """Fetch channel list synchronously (blocking).
 
-    def _fetch_channels_sync(self) -> None:
-        """Fetch channel list synchronously (blocking)."""
+        A UI started from an expired cache revalidates it in the background
+        with refresh_channels().
+        """
         try:
             channels = fetch_channels(cache_file=CHANNEL_CACHE_FILE)
 
             # Load usage and sort
             usage = load_channel_usage(CHANNEL_USAGE_FILE)
-            valid_ids = {ch.id for ch in channels}
-            usage = clean_channel_usage(usage, valid_ids)
+            valid_ids = get_valid_channel_ids(channels)
+            cleaned_usage = clean_channel_usage(usage, valid_ids)
 
             # Thread-safe update of shared data
             with self._data_lock:
-                self.channels = sort_channels_by_usage(channels, usage)
-            save_channel_usage(CHANNEL_USAGE_FILE, usage)
+                self.channels = sort_channels_by_usage(channels, cleaned_usage)
+            self._channel_usage = cleaned_usage
+            # Only rewrite the file when stale channels were dropped
+            if cleaned_usage != usage:
+                save_channel_usage(CHANNEL_USAGE_FILE, cleaned_usage)
 
         except (ConnectionError, TimeoutError) as e:
             logging.error(f"Network error fetching channels: {e}")
@@ -363,66 +432,124 @@ class SomaFMPlayer:
             print(f"Error fetching channel list: {e}")
             sys.exit(1)
 
-    def _fetch_channels_async(self) -> None:
-        """Fetch channel list asynchronously (non-blocking).
+    def _setup_metadata_observer(self) -> None:
+        """Setup MPV metadata observer.
+
+        Only the ICY stream title is observed: watching the whole
+        ``metadata`` property fires for every tag change and hands over the
+        full dict on mpv's event thread each time.
+        """
+        @self.player.property_observer("metadata/by-key/icy-title")
+        def metadata_handler(name: str, value: Any) -> None:
+            # Runs on mpv's event thread: only hand the title over
+            if value:
+                self._event_queue.put(("meta", value))
+
+    def _drain_events(self) -> bool:
+        """Apply all events queued by background threads.
+
+        Only the latest ``meta`` event of a batch is applied, so bursts of
+        title changes cost a single update. ``step`` events (MPRIS
+        Next/Previous) are summed and switch channels once.
 
-        Shows loading message and updates UI when complete.
+        Returns:
+            True if anything changed and the screen needs a redraw
         """
-        # Start with empty channels, show loading message
+        icy_title: Optional[str] = None
+        channels: Optional[List[Channel]] = None
+        step = 0
+        while True:
+            try:
+                kind, payload = self._event_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "meta":
+                icy_title = payload
+            elif kind == "channels":
+                channels = payload
+            elif kind == "step":
+                step += payload
+        changed = False
+        if channels is not None:
+            self._apply_channels(channels)
+            changed = True
+        if step:
+            self._apply_step(step)
+            changed = True
+        if icy_title is not None:
+            changed = self._apply_icy_title(icy_title) or changed
+        return changed
+
+    def refresh_channels(self) -> None:
+        """Revalidate the channel list in the background.
+
+        Used when the UI was started from an expired cache; the new list is
+        handed to the main loop through the event queue.
+        """
+        def on_loaded(channels: Optional[List[Channel]]) -> None:
+            if channels:
+                self._event_queue.put(("channels", channels))
+
+        fetch_channels_async(
+            cache_file=CHANNEL_CACHE_FILE, cache_max_age=0, callback=on_loaded
+        )
+
+    def _apply_channels(self, channels: List[Channel]) -> None:
+        """Replace the channel list with a refreshed one.
+
+        Channels keep their current order (new ones go last) and the
+        selected channel stays selected.
+        """
+        selected = self.state.get_selected_channel()
+        positions = {ch.id: i for i, ch in enumerate(self.channels)}
+        channels = sorted(channels, key=lambda ch: positions.get(ch.id, len(positions)))
+
         with self._data_lock:
-            self.channels = []
+            self.channels = channels
+        self.state.channels = channels
+
+        if selected is not None:
+            for i, ch in enumerate(self.state.get_channels_to_display()):
+                if ch.id == selected.id:
+                    self.state.current_index = i
+                    break
+
+    def _apply_step(self, step: int) -> None:
+        """Move the selection by step channels and play the selected one."""
+        if step > 0:
+            self.state.navigate_down(step)
+        else:
+            self.state.navigate_up(-step)
+        selected = self.state.get_selected_channel()
+        if selected is not None and selected is not self.playback.current_channel:
+            self.playback.play_channel(selected, self.state.current_index)
 
-        def on_channels_loaded(channels_opt: Optional[List[Channel]]):
-            """Callback when channels are loaded."""
-            if channels_opt:
-                try:
-                    # Load usage and sort
-                    usage = load_channel_usage(CHANNEL_USAGE_FILE)
-                    valid_ids = {ch.id for ch in channels_opt}
-                    usage = clean_channel_usage(usage, valid_ids)
-
-                    # Thread-safe update of shared data
-                    with self._data_lock:
-                        self.channels = sort_channels_by_usage(channels_opt, usage)
-                        save_channel_usage(CHANNEL_USAGE_FILE, usage)
-
-                        # Re-initialize components with loaded channels
-                        if hasattr(self, 'state'):
-                            self.state.channels = self.channels
-                except (json.JSONDecodeError, IOError) as e:
-                    logging.error(f"Error processing loaded channels: {e}")
-                except (OSError, ValueError) as e:
-                    logging.error(f"Channel data error: {e}")
+    def _apply_icy_title(self, value: str) -> bool:
+        """Update the current track from an ICY stream title.
 
-    def _setup_metadata_observer(self) -> None:
-        """Setup MPV metadata observer."""
-        @self.player.property_observer("metadata")
-        def metadata_handler(name: str, value: Any) -> None:
-            if value:
-                track_info = value.get("icy-title", "")
-                if track_info:
-                    for separator in [" - ", " – "]:
-                        if separator in track_info:
-                            parts = track_info.split(separator, 1)
-                            if len(parts) == 2:
-                                channel_name = (
-                                    self.playback.current_channel.title
-                                    if self.playback.current_channel
-                                    else None
-                                )
-                                metadata = TrackMetadata(
-                                    artist=parts[0].strip(),
-                                    title=parts[1].strip(),
-                                    duration="--:--",
-                                    channel_name=channel_name,
-                                )
-                                self.playback.update_metadata(metadata)
-                                if self.stdscr:
-                                    self._display_interface()
-
-                                if self.mpris_service and self.config.get("dbus_send_metadata", False):
-                                    self.mpris_service.update_metadata(metadata.to_dict())
-                                break
+        Returns:
+            True if the current metadata changed
+        """
+        if (
+            value == self._last_icy_title
+            and self.playback.current_metadata is self._last_icy_metadata
+        ):
+            return False
+        parsed = parse_icy_title(value)
+        if parsed is None:
+            return False
+        current_channel = self.playback.current_channel
+        metadata = TrackMetadata(
+            artist=parsed[0],
+            title=parsed[1],
+            duration="--:--",
+            channel_name=current_channel.title if current_channel else None,
+        )
+        # PlaybackController forwards changes to MPRIS
+        self.playback.update_metadata(metadata)
+        self._last_icy_title = value
+        self._last_icy_metadata = self.playback.current_metadata
+        return True
 
     def _setup_signal_handlers(self) -> None:
         """Set up signal handlers for graceful shutdown."""
@@ -432,11 +559,24 @@ class SomaFMPlayer:
 
     def init_colors(self) -> None:
         """Initialize colors."""
+        theme_name = self.config.get("theme", "default")
+        # load_themes_raw() returns the same dict until themes.json changes
+        key = (self.stdscr, theme_name, load_themes_raw())
+        if (
+            self._applied_theme_key is not None
+            and self._applied_theme_key[:2] == key[:2]
+            and self._applied_theme_key[2] is key[2]
+        ):
+            return
+
         curses.start_color()
         
         # Apply theme directly - this will reload themes from file and initialize colors
-        theme_name = self.config.get("theme", "default")
         apply_theme(theme_name)
+        self._applied_theme_key = key
+        self.ui_screen.init_attrs()
+        if self.stdscr:
+            self.stdscr.bkgd(" ", self.ui_screen.attr_text)
 
     def _display_interface(self) -> None:
         """Display the interface."""
@@ -447,24 +587,15 @@ class SomaFMPlayer:
         channels_to_display = self.state.get_channels_to_display()
 
         # Update scroll offset
-        max_y, max_x = self.stdscr.getmaxyx()
+        max_y, max_x = self.ui_screen.get_geometry(self.stdscr)
         panel_height = max_y - 2
-        self.state.update_scroll_offset(panel_height)
+        self.state.update_scroll_offset(panel_height, channels_to_display)
 
-        # If the sleep overlay was just closed, clear its region so it does
-        # not leave ghost artifacts. We only do this on the transition so we
-        # don't wipe the playback panel (and the track history it holds).
+        # If the sleep overlay was just closed, force a full redraw so it
+        # does not leave ghost artifacts; its erase() already blanks the
+        # overlay region. Only done on the transition so the panels are not
+        # repainted every frame.
         if self._prev_sleep_overlay and not self.state.sleep_overlay_active:
-            try:
-                overlay_width = 30
-                overlay_height = 7
-                start_y = (max_y - overlay_height) // 2
-                start_x = (max_x - overlay_width) // 2
-                for y in range(start_y, min(start_y + overlay_height, max_y)):
-                    self.stdscr.move(y, start_x)
-                    self.stdscr.clrtoeol()
-            except curses.error:
-                pass
             self.ui_screen.invalidate_cache()
         self._prev_sleep_overlay = self.state.sleep_overlay_active
 
@@ -490,10 +621,7 @@ class SomaFMPlayer:
             self.ui_screen.display_sleep_overlay(self.stdscr, self.state.sleep_input)
         else:
             # Hide cursor when overlay is not active
-            try:
-                curses.curs_set(0)
-            except curses.error:
-                pass
+            self.ui_screen.set_cursor_visible(0)
 
         # Show sleep timer countdown if active
         if self.state.sleep_timer.is_active():
@@ -501,6 +629,10 @@ class SomaFMPlayer:
                 self.stdscr, self.state.get_timer_remaining()
             )
 
+        # Flush the whole frame to the terminal in one go
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+
     def _on_state_change(self) -> None:
         """Callback for state changes."""
         if self.stdscr:
@@ -508,7 +640,7 @@ class SomaFMPlayer:
             if self._prev_show_help and not self.state.show_help:
                 self.ui_screen.invalidate_cache()
             self._prev_show_help = self.state.show_help
-            self._display_interface()
+            self._dirty = True
 
     def _on_theme_change(self, new_theme: str) -> None:
         """Callback for theme changes."""
@@ -518,33 +650,59 @@ class SomaFMPlayer:
         # Переинициализируем цвета
         self.init_colors()
 
-        if self.stdscr:
-            # Полная очистка и перерисовка с новым фоном
-            self.stdscr.clear()
-            self.stdscr.bkgd(" ", curses.color_pair(1))
-            self._display_interface()
-            self.stdscr.refresh()
+        # Полная перерисовка в главном цикле (фон уже обновлён в init_colors)
+        self._dirty = True
 
     def _cleanup(self) -> None:
         """Clean up resources."""
         if self.player:
             self.player.terminate()
 
+        # Make sure pending config changes and queued state files reach the disk
+        self.state.flush_config(force=True)
+        self.json_writer.close()
+
         # Shutdown HTTP client executor
         from somafm_tui.http_client import shutdown_http
         shutdown_http()
 
-        if not self.had_error and os.path.exists(TEMP_DIR):
+        if not self.had_error:
             try:
-                for root, dirs, files in os.walk(TEMP_DIR, topdown=False):
-                    for name in files:
-                        os.remove(os.path.join(root, name))
-                    for name in dirs:
-                        os.rmdir(os.path.join(root, name))
-                os.rmdir(TEMP_DIR)
-            except (IOError, OSError, PermissionError) as e:
+                shutil.rmtree(TEMP_DIR)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
                 logging.warning(f"Error cleaning up temp directory: {e}")
 
+    def _handle_keys(self, stdscr: curses.window, key: Any) -> None:
+        """Handle a key and every key already queued behind it.
+
+        Held keys auto-repeat faster than frames are drawn; handling the
+        whole batch first means one redraw per batch instead of per key.
+
+        Args:
+            stdscr: Main curses window
+            key: Key returned by the blocking get_wch()
+        """
+        stdscr.nodelay(True)
+        try:
+            for _ in range(MAX_KEYS_PER_FRAME):
+                # Handle terminal resize - invalidate cache and force full redraw
+                if key == curses.KEY_RESIZE:
+                    self.ui_screen.invalidate_cache()
+                    self._dirty = True
+                # Unbound keys change nothing on screen
+                if self.input_handler.handle_input(key):
+                    self._dirty = True
+                if not self.state.is_running():
+                    break
+                try:
+                    key = stdscr.get_wch()
+                except curses.error:
+                    break
+        finally:
+            stdscr.timeout(INPUT_TIMEOUT_MS)
+
     def run(self) -> None:
         """Run main application loop."""
 
@@ -556,12 +714,13 @@ class SomaFMPlayer:
 
                 stdscr.keypad(True)
                 curses.cbreak()  # Use cbreak instead of raw for proper key handling
-                stdscr.nodelay(True)
-
-                self._display_interface()
+                # get_wch() waits up to INPUT_TIMEOUT_MS, so the loop idles
+                # without sleeping and still wakes up at once on a key
+                stdscr.timeout(INPUT_TIMEOUT_MS)
 
                 # Cache time for the main loop iteration
                 _last_timer_check = 0.0
+                _last_render = 0.0
 
                 while self.state.is_running():
                     current_time = time.time()
@@ -572,40 +731,40 @@ class SomaFMPlayer:
                             break
                         _last_timer_check = current_time
 
-                    # Update timer display if needed
+                    # Write config changes once key repeats have settled
+                    self.state.flush_config()
+
+                    # Countdown ticks are drawn with the rest of the frame
                     if self.state.should_update_timer_display():
-                        self.ui_screen.display_sleep_timer(
-                            self.stdscr, self.state.get_timer_remaining()
-                        )
-                        stdscr.refresh()
-
-                    # Check volume display timeout
-                    if (
-                        self.ui_screen.volume_display is not None
-                        and current_time - self.ui_screen.volume_display_time >= 3
-                    ):
-                        self.ui_screen.volume_display = None
-                        self.ui_screen.invalidate_cache()
-                        self._display_interface()
-
-                    # Get user input
+                        self._dirty = True
+
+                    # Hide the volume indicator once it timed out
+                    if self.ui_screen.expire_volume():
+                        self._dirty = True
+
+                    # Wait for user input (raises curses.error on timeout)
                     try:
                         key = stdscr.get_wch()
+                    except curses.error:
+                        key = None
+
+                    if self._drain_events():
+                        self._dirty = True
+
+                    try:
                         if key is not None:
-                            # Handle terminal resize - invalidate cache and force full redraw
-                            if key == curses.KEY_RESIZE:
-                                self.ui_screen.invalidate_cache()
-                                self.input_handler.handle_input(key)
-                            else:
-                                self.input_handler.handle_input(key)
-                            # Redraw interface (full redraw if cache was invalidated)
-                            self._display_interface()
-                        else:
-                            # Short sleep for responsive UI (50ms = 20 FPS)
-                            time.sleep(0.05)
+                            self._handle_keys(stdscr, key)
+
+                        # Redraw only when something changed, at most once per
+                        # frame interval so bursts of mpv events coalesce.
+                        if self._dirty:
+                            now = time.monotonic()
+                            if now - _last_render >= MIN_FRAME_INTERVAL:
+                                self._dirty = False
+                                _last_render = now
+                                self._display_interface()
                     except curses.error:
-                        time.sleep(0.05)
-                        continue
+                        pass
 
             except (KeyboardInterrupt, SystemExit):
                 # Normal shutdown on user request or signal
@@ -643,22 +802,6 @@ def main() -> None:
     # Check dependencies first (before any imports that might fail)
     check_dependencies()
 
-    # Runtime imports are now at module level (after check_dependencies function)
-    # Additional imports that depend on runtime configuration
-    from somafm_tui.config import load_config, save_config, validate_config
-    from somafm_tui.themes import get_color_themes, init_custom_colors, apply_theme, load_themes_raw
-    from somafm_tui.channels import (
-        fetch_channels,
-        fetch_channels_async,
-        load_favorites,
-        load_channel_usage,
-        save_channel_usage,
-        clean_channel_usage,
-        sort_channels_by_usage,
-        filter_channels_by_query,
-    )
-    from somafm_tui.mpris_service import MPRISService, run_mpris_loop
-
     args = parse_args()
 
     if not validate_args(args):
@@ -666,14 +809,12 @@ def main() -> None:
 
     # Handle list-themes (no initialization needed)
     if args.list_themes:
-        from somafm_tui.themes import load_themes_raw
         themes = load_themes_raw()
         print_themes(themes)
         sys.exit(0)
 
     # For other commands, we need to initialize the player
-    ensure_directories()
-    setup_logging()
+    prepare_app_environment()
 
     # Load configuration
     config = validate_config(load_config())
@@ -693,11 +834,14 @@ def main() -> None:
         # Alternative config file handling
         pass
 
-    # Fetch channels
+    # Fetch channels. The interactive UI starts from an expired cache at once
+    # and refreshes it in the background; CLI listings wait for fresh data.
+    interactive = not (args.list_channels or args.search or args.favorites)
+    stale_channels = load_stale_channels(CHANNEL_CACHE_FILE) if interactive else None
     try:
-        channels = fetch_channels(cache_file=CHANNEL_CACHE_FILE)
+        channels = stale_channels or fetch_channels(cache_file=CHANNEL_CACHE_FILE)
         usage = load_channel_usage(CHANNEL_USAGE_FILE)
-        valid_ids = {ch.id for ch in channels}
+        valid_ids = get_valid_channel_ids(channels)
         usage = clean_channel_usage(usage, valid_ids)
         channels = sort_channels_by_usage(channels, usage)
     except (ConnectionError, TimeoutError) as e:
@@ -720,7 +864,6 @@ def main() -> None:
 
     # Handle search
     if args.search:
-        from somafm_tui.channels import filter_channels_by_query
         filtered = filter_channels_by_query(channels, args.search)
         if filtered:
             print(f"\nSearch results for '{args.search}':")
@@ -736,7 +879,9 @@ def main() -> None:
         sys.exit(0)
 
     # Create player with configured settings
-    player = SomaFMPlayer(config=config, channels=channels)
+    player = SomaFMPlayer(config=config, channels=channels, channel_usage=usage)
+    if stale_channels:
+        player.refresh_channels()
 
     # Handle sleep timer from CLI
     if args.sleep:
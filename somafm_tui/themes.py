@@ -4,7 +4,7 @@ import curses
 import json
 import logging
 import os
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 
 from .constants import MAX_CURSES_COLOR_ID, MIN_CURSES_COLOR_ID
 
@@ -15,10 +15,24 @@ THEMES_FILE = os.path.join(os.path.dirname(__file__), "themes.json")
 # We'll map custom colors to IDs 10-174
 _color_id_counter = MIN_CURSES_COLOR_ID
 _color_map: Dict[str, int] = {}
+# RGB (0-1000) of every assigned color ID
+_color_rgb: Dict[int, Tuple[int, int, int]] = {}
+# Theme keys holding color IDs
+_THEME_COLOR_KEYS = (
+    "bg_color", "header", "selected", "info", "metadata", "instructions", "favorite",
+)
 _theme_cache: Optional[Dict[str, Dict[str, Any]]] = None
+# Parsed themes.json keyed by its mtime, so unchanged files are not re-read
+_raw_theme_cache: Optional[Tuple[float, Dict[str, Dict[str, Any]]]] = None
+# Sorted theme names and the raw themes dict they were computed from
+_theme_names_cache: Optional[Tuple[Dict[str, Dict[str, Any]], List[str]]] = None
+# get_color_themes() result and the loaded themes dict it was built from
+_color_themes_cache: Optional[
+    Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, int]]]
+] = None
 
 
-def _hex_to_curses_color(hex_color: str) -> tuple:
+def _hex_to_curses_color(hex_color: str) -> Tuple[int, int, int]:
     """Convert hex color to RGB tuple (0-1000)"""
     hex_color = hex_color.lstrip('#')
     r = int(hex_color[0:2], 16)
@@ -29,7 +43,11 @@ def _hex_to_curses_color(hex_color: str) -> tuple:
 
 
 def _get_color_id(hex_color: str) -> int:
-    """Get or create a curses color ID for a hex color"""
+    """Get or assign a curses color ID for a hex color.
+
+    Only the ID is assigned here; the color is loaded into the terminal by
+    apply_theme() once a theme using it becomes active.
+    """
     global _color_id_counter, _color_map
 
     if hex_color in _color_map:
@@ -42,59 +60,42 @@ def _get_color_id(hex_color: str) -> int:
 
     color_id = _color_id_counter
     _color_map[hex_color] = color_id
+    _color_rgb[color_id] = _hex_to_curses_color(hex_color)
     _color_id_counter += 1
-
-    # Initialize the color
-    rgb = _hex_to_curses_color(hex_color)
-    curses.init_color(color_id, *rgb)
-
     return color_id
 
 
-def _update_color(hex_color: str) -> int:
-    """Update or create a curses color ID for a hex color.
-    
-    Unlike _get_color_id, this function updates the color even if it already exists.
-    This is useful for theme changes without restarting the application.
-    
-    Returns:
-        Color ID for the hex color
-    """
-    global _color_id_counter, _color_map
-
-    # Convert hex to RGB
-    rgb = _hex_to_curses_color(hex_color)
+def _init_theme_colors(color_ids: Iterable[int]) -> None:
+    """Load the RGB values of the given color IDs into the terminal.
 
-    if hex_color in _color_map:
-        # Update existing color
-        color_id = _color_map[hex_color]
+    IDs that were not assigned by _get_color_id() (built-in curses colors,
+    the gray fallback) are left alone.
+    """
+    for color_id in color_ids:
+        rgb = _color_rgb.get(color_id)
+        if rgb is None:
+            continue
         try:
             curses.init_color(color_id, *rgb)
-            logging.debug(f"Updated color {color_id} to {hex_color} (RGB: {rgb})")
         except curses.error as e:
-            logging.warning(f"Color update failed for {hex_color}: {e}")
-        return color_id
-
-    # Create new color (same as _get_color_id)
-    if _color_id_counter > MAX_CURSES_COLOR_ID:
-        return 8
-
-    color_id = _color_id_counter
-    _color_map[hex_color] = color_id
-    _color_id_counter += 1
-
-    curses.init_color(color_id, *rgb)
-    logging.debug(f"Created new color {color_id} for {hex_color} (RGB: {rgb})")
-    return color_id
+            logging.warning(f"Color init failed for color {color_id}: {e}")
 
 
 def load_themes_raw() -> Dict[str, Dict[str, Any]]:
     """Load themes from JSON file without curses color initialization.
     
     This is useful for CLI commands that run outside curses environment.
-    Returns themes with hex colors instead of color IDs.
+    Returns themes with hex colors instead of color IDs. The result is
+    cached and only rebuilt when the file's mtime changes; treat it as
+    read-only.
     """
+    global _raw_theme_cache
+
     try:
+        mtime = os.path.getmtime(THEMES_FILE)
+        if _raw_theme_cache is not None and _raw_theme_cache[0] == mtime:
+            return _raw_theme_cache[1]
+
         with open(THEMES_FILE, "r") as f:
             raw_themes = json.load(f)
         
@@ -112,6 +113,7 @@ def load_themes_raw() -> Dict[str, Dict[str, Any]]:
                 "favorite": theme_data.get("favorite", "#ffffff"),
                 "is_light": theme_data.get("is_light", False),
             }
+        _raw_theme_cache = (mtime, themes)
         return themes
 
     except (json.JSONDecodeError, IOError, OSError) as e:
@@ -181,34 +183,18 @@ def load_themes() -> Dict[str, Dict[str, Any]]:
             }
         }
         return _theme_cache
-    except curses.error as e:
-        logging.error(f"Curses color initialization failed: {e}")
-        # Return minimal default theme with standard curses colors
-        _theme_cache = {
-            "default": {
-                "name": "Default Dark",
-                "bg_color": curses.COLOR_BLACK,
-                "header": curses.COLOR_WHITE,
-                "selected": curses.COLOR_GREEN,
-                "info": curses.COLOR_YELLOW,
-                "metadata": curses.COLOR_MAGENTA,
-                "instructions": curses.COLOR_BLUE,
-                "favorite": curses.COLOR_RED,
-                "is_light": False,
-            }
-        }
-        return _theme_cache
 
 
 def reload_themes() -> Dict[str, Dict[str, Any]]:
-    """Reload themes from JSON file, updating colors.
+    """Reload themes from JSON file.
     
     This function clears the cache and reloads themes from the file.
-    It also updates existing colors using curses.init_color().
-    Call this function after modifying themes.json to apply changes.
+    Colors of the active theme are (re)loaded into the terminal by
+    apply_theme(). Call this function after modifying themes.json to
+    apply changes.
     
     Returns:
-        Dictionary of themes with updated color IDs
+        Dictionary of themes with color IDs
     """
     global _theme_cache
 
@@ -218,24 +204,24 @@ def reload_themes() -> Dict[str, Dict[str, Any]]:
     _theme_cache = None
     
     # Note: We don't reset _color_map and _color_id_counter to preserve
-    # existing color IDs. Instead, we use _update_color() to update them.
+    # existing color IDs; an ID always stands for the same hex color.
     
     try:
         raw_themes = load_themes_raw()
         logging.info(f"Loaded {len(raw_themes)} themes from {THEMES_FILE}")
 
-        # Convert hex colors to curses color IDs (updating existing colors)
+        # Convert hex colors to curses color IDs
         themes = {}
         for theme_id, theme_data in raw_themes.items():
             theme = {
                 "name": theme_data.get("name", theme_id),
-                "bg_color": _update_color(theme_data.get("bg_color", "#000000")),
-                "header": _update_color(theme_data.get("header", "#ffffff")),
-                "selected": _update_color(theme_data.get("selected", "#ffffff")),
-                "info": _update_color(theme_data.get("info", "#ffffff")),
-                "metadata": _update_color(theme_data.get("metadata", "#ffffff")),
-                "instructions": _update_color(theme_data.get("instructions", "#ffffff")),
-                "favorite": _update_color(theme_data.get("favorite", "#ffffff")),
+                "bg_color": _get_color_id(theme_data.get("bg_color", "#000000")),
+                "header": _get_color_id(theme_data.get("header", "#ffffff")),
+                "selected": _get_color_id(theme_data.get("selected", "#ffffff")),
+                "info": _get_color_id(theme_data.get("info", "#ffffff")),
+                "metadata": _get_color_id(theme_data.get("metadata", "#ffffff")),
+                "instructions": _get_color_id(theme_data.get("instructions", "#ffffff")),
+                "favorite": _get_color_id(theme_data.get("favorite", "#ffffff")),
                 "is_light": theme_data.get("is_light", False),
             }
             themes[theme_id] = theme
@@ -272,17 +258,30 @@ def reset_theme_cache() -> None:
     Note: This should only be called outside of curses environment or
     when you plan to reinitialize all colors.
     """
-    global _theme_cache, _color_map, _color_id_counter
+    global _theme_cache, _raw_theme_cache, _theme_names_cache, _color_themes_cache
+    global _color_map, _color_rgb, _color_id_counter
     _theme_cache = None
+    _raw_theme_cache = None
+    _theme_names_cache = None
+    _color_themes_cache = None
     _color_map = {}
+    _color_rgb = {}
     _color_id_counter = 10
 
 
 def get_color_themes() -> Dict[str, Dict[str, int]]:
-    """Returns dictionary of available color themes (for compatibility)"""
+    """Returns dictionary of available color themes (for compatibility)
+
+    The dict is only rebuilt after the themes were reloaded; treat it as
+    read-only.
+    """
+    global _color_themes_cache
+
     themes = load_themes()
+    if _color_themes_cache is not None and _color_themes_cache[0] is themes:
+        return _color_themes_cache[1]
     # Return dict with color IDs as integers
-    return {
+    color_themes = {
         theme_id: {
             "name": theme["name"],
             "bg_color": theme["bg_color"],
@@ -295,14 +294,25 @@ def get_color_themes() -> Dict[str, Dict[str, int]]:
         }
         for theme_id, theme in themes.items()
     }
+    _color_themes_cache = (themes, color_themes)
+    return color_themes
 
 
 def get_theme_names() -> List[str]:
-    """Returns list of all theme names, sorted: dark themes first, light themes last"""
+    """Returns list of all theme names, sorted: dark themes first, light themes last
+
+    The list is only re-sorted when themes.json was reloaded; treat it as
+    read-only.
+    """
+    global _theme_names_cache
+
     # Use load_themes_raw() to work without curses initialization
     themes = load_themes_raw()
-    # Sort: dark themes (is_light=False) first, then light themes (is_light=True)
-    return sorted(themes.keys(), key=lambda t: themes[t].get("is_light", False))
+    if _theme_names_cache is None or _theme_names_cache[0] is not themes:
+        # Sort: dark themes (is_light=False) first, then light themes (is_light=True)
+        names = sorted(themes.keys(), key=lambda t: themes[t].get("is_light", False))
+        _theme_names_cache = (themes, names)
+    return _theme_names_cache[1]
 
 
 def is_light_theme(theme_name: str) -> bool:
@@ -340,6 +350,12 @@ def apply_theme(theme_name: str, bg_color: Any = None) -> None:
 
     theme = themes[theme_name]
 
+    # Only the active theme's colors are loaded into the terminal
+    color_ids = [theme[key] for key in _THEME_COLOR_KEYS]
+    if bg_color is not None:
+        color_ids.append(bg_color)
+    _init_theme_colors(color_ids)
+
     # Use provided bg_color or theme's bg_color
     # If bg_color is provided as int (from old cache), we need to get hex from raw themes
     if bg_color is None:
@@ -1,20 +1,57 @@
 """User interface module"""
 
 import curses
+import functools
 import os
 import time
-from typing import Any, Dict, List, Optional, Set
+from collections import deque
+from typing import AbstractSet, Any, Deque, Dict, List, Optional, Tuple
 
-from .models import TrackMetadata, Channel
+from . import __version__
+from .models import TrackMetadata, Channel, clock_hms
 from .constants import (
     VOLUME_BAR_COLOR_PAIR,
     VOLUME_ICON_COLOR_PAIR,
     MAX_TRACK_HISTORY_ENTRIES,
-    CHANNEL_PANEL_MIN_WIDTH,
-    CHANNEL_PANEL_MAX_WIDTH,
-    INSTRUCTION_LINES,
     VOLUME_DISPLAY_TIMEOUT,
     HELP_OVERLAY_WIDTH,
+    INSTRUCTION_ITEMS,
+)
+
+# Help overlay content as (text, style) pairs
+_HELP_TEXT = (
+    (f"SomaFM TUI v{__version__} - Keyboard Shortcuts", "header"),
+    ("", ""),
+    ("Navigation", "section"),
+    ("  ↑/k  - Move up", "normal"),
+    ("  ↓/j  - Move down", "normal"),
+    ("  Enter/l - Play selected channel", "normal"),
+    ("  ?     - Toggle this help", "normal"),
+    ("", ""),
+    ("Playback", "section"),
+    ("  Space - Pause/Resume", "normal"),
+    ("  h     - Stop playback", "normal"),
+    ("  r     - Cycle bitrate", "normal"),
+    ("  v/b   - Decrease/Increase volume", "normal"),
+    ("  PgUp  - Increase volume", "normal"),
+    ("  PgDn  - Decrease volume", "normal"),
+    ("", ""),
+    ("Channels", "section"),
+    ("  /     - Search channels", "normal"),
+    ("  f     - Add current track to favorites", "normal"),
+    ("  Ctrl+F - Toggle channel favorite", "normal"),
+    ("  z     - Show only favorites", "normal"),
+    ("  x     - Toggle footer", "normal"),
+    ("", ""),
+    ("Timer", "section"),
+    ("  s     - Set sleep timer", "normal"),
+    ("", ""),
+    ("Appearance", "section"),
+    ("  t/y   - Cycle theme (forward/back)", "normal"),
+    ("", ""),
+    ("Other", "section"),
+    ("  q     - Quit", "normal"),
+    ("  ESC   - Close search/help/timer", "normal"),
 )
 
 # Emoji-capable terminals we explicitly trust. Conservative: if not in this
@@ -27,6 +64,14 @@ _EMOJI_TERM_PROGRAMS = frozenset({
 
 _EMOJI_COLORTERM = frozenset({"truecolor", "24bit"})
 
+# Volume indicator: bar cells, and (filled, empty) bar strings for every
+# possible number of filled cells, so drawing it allocates nothing
+_VOLUME_BAR_WIDTH = 20
+_VOLUME_BARS: Tuple[Tuple[str, str], ...] = tuple(
+    ("█" * i, "▁" * (_VOLUME_BAR_WIDTH - i)) for i in range(_VOLUME_BAR_WIDTH + 1)
+)
+_VOLUME_CLEAR = " " * (_VOLUME_BAR_WIDTH + 5)
+
 _emoji_enabled_cache: Optional[bool] = None
 
 
@@ -162,49 +207,206 @@ def get_favorite_icon() -> str:
     return "♥"
 
 
+@functools.lru_cache(maxsize=512)
+def _truncate(text: str, max_len: int) -> str:
+    """Shorten text to max_len characters, ending with "..." when cut.
+
+    Cached because the same titles are truncated to the same width on
+    every frame. Returns "" when there is no room at all.
+    """
+    if len(text) <= max_len:
+        return text
+    if max_len <= 0:
+        return ""
+    if max_len > 3:
+        return text[: max_len - 3] + "..."
+    return text[:max_len]
+
+
+@functools.lru_cache(maxsize=32)
+def _box_edges(width: int) -> Tuple[str, str]:
+    """Return the top and bottom border lines of a box width cells wide."""
+    inner = "─" * (width - 2)
+    return f"┌{inner}┐", f"└{inner}┘"
+
+
 class UIScreen:
     """Base UI screen class with smart redraw optimization."""
 
     def __init__(self):
         self.current_metadata = TrackMetadata()
-        self.max_history = MAX_TRACK_HISTORY_ENTRIES
-        self.track_history: List[TrackMetadata] = []
+        # Most recent first; the deque's maxlen evicts the oldest entry
+        self._history: Deque[TrackMetadata] = deque(maxlen=MAX_TRACK_HISTORY_ENTRIES)
         self.current_channel: Optional[Channel] = None
         self.player: Any = None
         self.volume_display: Optional[int] = None
+        # time.monotonic() of the last volume change
         self.volume_display_time: float = 0
-        self.volume_display_was_visible: bool = False
+        self._current_theme_name: str = "default"
+
+        # Precomputed curses attributes; filled in by init_attrs() once
+        # colors are initialized so rendering never calls color_pair().
+        self.attr_text = self.attr_header = 0
+        self.attr_accent = self.attr_accent_bold = self.attr_selected = 0
+        self.attr_info = self.attr_info_bold = 0
+        self.attr_track = self.attr_track_bold = 0
+        self.attr_hint = self.attr_hint_bold = self.attr_hint_dim = 0
+        self.attr_volume_bar = self.attr_volume_empty = self.attr_volume_text = 0
         
         # Smart redraw optimization - cache previous state
-        self._prev_channels_hash: int = 0
+        # Channel list drawn last; lists are replaced, never edited in place
+        self._prev_channels: Optional[List[Channel]] = None
         self._prev_selected_index: int = -1
         self._prev_scroll_offset: int = -1
         self._prev_favorites_hash: int = 0
         self._prev_current_channel_id: Optional[str] = None
         self._prev_is_playing: bool = False
-        self._prev_metadata_hash: int = 0
+        self._prev_metadata: Optional[TrackMetadata] = None
         self._prev_search_query: str = ""
+        self._prev_is_searching: bool = False
         self._prev_show_help: bool = False
         self._prev_bitrate: str = ""
-        self._prev_history_hash: int = 0
+        self._prev_history_version: int = -1
+        # Bumped on every history mutation so display() compares one int
+        self._history_version: int = 0
+        # Channel row strings keyed by (id, title, favorite, selected)
+        self._channel_row_cache: Dict[Tuple[str, str, bool, bool], str] = {}
+        # Footer lines keyed by (width, line count)
+        self._instruction_lines_cache: Dict[Tuple[int, int], Tuple[str, ...]] = {}
+        # Channel rows currently on screen as y -> (text, attr)
+        self._channel_rows_drawn: Dict[int, Tuple[str, int]] = {}
+        # Playback panel rows currently on screen as y -> (text, attr)
+        self._playback_rows_drawn: Dict[int, Tuple[str, int]] = {}
+        # Footer currently on screen as (max_y, lines)
+        self._footer_drawn: Optional[Tuple[int, Tuple[str, ...]]] = None
+        # Terminal size, cached until the next resize/invalidate_cache()
+        self._geometry: Optional[Tuple[int, int]] = None
+        # Last value passed to curs_set(); None until the first call
+        self._cursor_visible: Optional[int] = None
         # No forced full redraw interval - partial redraw with clrtoeol() is sufficient
 
+    @property
+    def max_history(self) -> int:
+        """Maximum number of entries kept in the track history."""
+        return self._history.maxlen
+
+    @max_history.setter
+    def max_history(self, value: int) -> None:
+        self._history = deque(self._history, maxlen=value)
+        self._history_version += 1
+
+    @property
+    def track_history(self) -> List[TrackMetadata]:
+        """Snapshot of the track history, most recent first."""
+        return list(self._history)
+
+    def init_attrs(self) -> None:
+        """Precompute color/attribute combinations used while rendering.
+
+        Must be called after the color pairs are (re)initialized, e.g. on
+        startup and on theme change.
+        """
+        self.attr_text = curses.color_pair(1)
+        self.attr_header = self.attr_text | curses.A_BOLD
+        self.attr_accent = curses.color_pair(2)
+        self.attr_accent_bold = self.attr_accent | curses.A_BOLD
+        self.attr_selected = self.attr_accent | curses.A_REVERSE
+        self.attr_info = curses.color_pair(3)
+        self.attr_info_bold = self.attr_info | curses.A_BOLD
+        self.attr_track = curses.color_pair(4)
+        self.attr_track_bold = self.attr_track | curses.A_BOLD
+        self.attr_hint = curses.color_pair(5)
+        self.attr_hint_bold = self.attr_hint | curses.A_BOLD
+        self.attr_hint_dim = self.attr_hint | curses.A_DIM
+        self.attr_volume_bar = curses.color_pair(VOLUME_BAR_COLOR_PAIR) | curses.A_BOLD
+        self.attr_volume_empty = curses.color_pair(VOLUME_BAR_COLOR_PAIR) | curses.A_DIM
+        self.attr_volume_text = curses.color_pair(VOLUME_ICON_COLOR_PAIR) | curses.A_BOLD
+
     def invalidate_cache(self) -> None:
         """Invalidate redraw cache to force full redraw.
 
         Call this when theme changes or screen is cleared.
         """
-        self._prev_channels_hash = 0
+        self._prev_channels = None
         self._prev_selected_index = -1
         self._prev_scroll_offset = -1
         self._prev_favorites_hash = 0
         self._prev_current_channel_id = None
         self._prev_is_playing = False
-        self._prev_metadata_hash = 0
+        self._prev_metadata = None
         self._prev_search_query = ""
+        self._prev_is_searching = False
         self._prev_show_help = False
         self._prev_bitrate = ""
-        self._prev_history_hash = 0
+        self._prev_history_version = -1
+        self._channel_rows_drawn.clear()
+        self._playback_rows_drawn.clear()
+        self._footer_drawn = None
+        self._geometry = None
+
+    def get_geometry(self, stdscr: curses.window) -> Tuple[int, int]:
+        """Return the cached terminal size as (max_y, max_x).
+
+        The size is only queried from curses after the cache has been
+        invalidated, e.g. on KEY_RESIZE.
+        """
+        if self._geometry is None:
+            self._geometry = stdscr.getmaxyx()
+        return self._geometry
+
+    def set_cursor_visible(self, visible: int) -> None:
+        """Show (1) or hide (0) the terminal cursor.
+
+        curs_set() writes an escape sequence every time it is called, so
+        it is only issued when the visibility actually changes.
+        """
+        if visible == self._cursor_visible:
+            return
+        try:
+            curses.curs_set(visible)
+        except curses.error:
+            return
+        self._cursor_visible = visible
+
+    def _channel_row_text(self, channel: Channel, is_favorite: bool, is_selected: bool) -> str:
+        """Return the channel list row text, building it only once."""
+        key = (channel.id, channel.title, is_favorite, is_selected)
+        text = self._channel_row_cache.get(key)
+        if text is None:
+            fav_icon = f"{get_favorite_icon()} " if is_favorite else "  "
+            text = f"{'> ' if is_selected else '  '}{fav_icon}{channel.title}"
+            self._channel_row_cache[key] = text
+        return text
+
+    def _put_channel_row(
+        self, stdscr: curses.window, y: int, x: int, width: int, text: str, attr: int
+    ) -> None:
+        """Draw a channel list row unless the same row is already on screen.
+
+        Rows outside the terminal are skipped up front, so callers don't
+        need their own try/except around every row.
+        """
+        row = (text, attr)
+        if self._channel_rows_drawn.get(y) == row:
+            return
+        max_y, max_x = self.get_geometry(stdscr)
+        n = min(width - 1, max_x - x)
+        if y >= max_y or n <= 0:
+            return
+        try:
+            # Clear only within the channel panel width so the playback
+            # panel (which holds the track history) is not wiped. Plain
+            # rows share the blank's attribute, so they are padded and
+            # written in one call; highlighted rows keep their highlight
+            # on the text only.
+            if attr == self.attr_text:
+                stdscr.addnstr(y, x, text.ljust(n), n, attr)
+            else:
+                stdscr.hline(y, x, " ", n, self.attr_text)
+                stdscr.addnstr(y, x, text, n, attr)
+        except curses.error:
+            return
+        self._channel_rows_drawn[y] = row
 
     def display(
         self,
@@ -212,7 +414,7 @@ class UIScreen:
         channels: List[Channel],
         selected_index: int,
         scroll_offset: int,
-        channel_favorites: Set[str],
+        channel_favorites: AbstractSet[str],
         current_channel: Optional[Channel] = None,
         player: Any = None,
         is_playing: bool = False,
@@ -226,60 +428,61 @@ class UIScreen:
         """Display combined interface with smart redraw optimization.
 
         Only redraws changed portions of the screen to improve performance.
+        The frame is staged with noutrefresh(); call curses.doupdate() to
+        put it on the terminal.
         Full redraw is performed when:
         - Help overlay is shown
-        - Search mode changes
-        - Channels list changes
         - Cache is invalidated (resize, theme change)
-        """
-        import hashlib
-        import time
 
+        A changed channel list or search query only redraws the channel
+        panel; rows that are already on screen are never rewritten.
+        """
         # Store current theme name for use in _display_instructions
         self._current_theme_name = theme_name
 
-        max_y, max_x = stdscr.getmaxyx()
-        current_time = time.time()
+        max_y, max_x = self.get_geometry(stdscr)
 
         # Show help overlay if enabled (always full redraw)
         if show_help:
             self._display_help(stdscr, max_y, max_x)
-            stdscr.refresh()
+            stdscr.noutrefresh()
             return
 
-        # Calculate hashes for change detection
-        channels_str = "|".join(f"{ch.id}:{ch.title}" for ch in channels)
-        channels_hash = hash(channels_str)
+        # Favorites are kept as a frozenset, so this is the same object
+        # with its hash computed once
         favorites_hash = hash(frozenset(channel_favorites))
-        metadata_hash = hash(f"{self.current_metadata.artist}:{self.current_metadata.title}")
-        history_hash = hash(
-            tuple(
-                f"{t.artist}:{t.title}:{t.channel_name}:{t.timestamp}"
-                for t in self.track_history
-            )
-        )
 
         # Detect what changed
-        channels_changed = channels_hash != self._prev_channels_hash
+        # StateManager returns the same list object until it changes
+        channels_changed = channels is not self._prev_channels
         selection_changed = selected_index != self._prev_selected_index
         scroll_changed = scroll_offset != self._prev_scroll_offset
         favorites_changed = favorites_hash != self._prev_favorites_hash
+        current_channel_id = current_channel.id if current_channel else None
         playback_changed = (
-            current_channel != self._prev_current_channel_id or
+            current_channel_id != self._prev_current_channel_id or
             is_playing != self._prev_is_playing or
             current_bitrate != self._prev_bitrate
         )
-        metadata_changed = metadata_hash != self._prev_metadata_hash
-        history_changed = history_hash != self._prev_history_hash
-        search_changed = search_query != self._prev_search_query
+        # TrackMetadata is immutable, so an unchanged object needs no compare
+        metadata = self.current_metadata
+        prev_metadata = self._prev_metadata
+        metadata_changed = metadata is not prev_metadata and (
+            prev_metadata is None or not metadata.is_same_track(prev_metadata)
+        )
+        history_changed = self._history_version != self._prev_history_version
+        search_changed = (
+            search_query != self._prev_search_query or
+            is_searching != self._prev_is_searching
+        )
         help_changed = show_help != self._prev_show_help
 
         # Cache was invalidated (e.g., after resize or theme change) - force full redraw
-        cache_invalidated = self._prev_channels_hash == 0
+        cache_invalidated = self._prev_channels is None
 
         # Determine if we need full redraw
-        needs_full_redraw = cache_invalidated or channels_changed or search_changed or help_changed
-        
+        needs_full_redraw = cache_invalidated or help_changed
+
         # Adaptive width for channels panel (25-40 chars, max 1/3 of screen)
         split_x = min(max(25, max_x // 3), 40)
         panel_height = max_y - 2
@@ -300,40 +503,46 @@ class UIScreen:
                 split_x, panel_height, max_y, max_x, is_searching, search_query,
                 show_footer,
                 selection_changed, scroll_changed, favorites_changed,
-                playback_changed, metadata_changed, history_changed
+                playback_changed, metadata_changed, history_changed,
+                channels_changed or search_changed,
             )
 
         # Display volume indicator (always)
         self._handle_volume_display(stdscr)
 
-        # Show sleep timer countdown if active (always update)
-        stdscr.refresh()
+        # Stage the frame; the caller flushes it with curses.doupdate()
+        # once any overlays have been drawn on top.
+        stdscr.noutrefresh()
 
         # Update cache
-        self._prev_channels_hash = channels_hash
+        self._prev_channels = channels
         self._prev_selected_index = selected_index
         self._prev_scroll_offset = scroll_offset
         self._prev_favorites_hash = favorites_hash
-        self._prev_current_channel_id = current_channel.id if current_channel else None
+        self._prev_current_channel_id = current_channel_id
         self._prev_is_playing = is_playing
-        self._prev_metadata_hash = metadata_hash
+        self._prev_metadata = metadata
         self._prev_search_query = search_query
+        self._prev_is_searching = is_searching
         self._prev_show_help = show_help
         self._prev_bitrate = current_bitrate
-        self._prev_history_hash = history_hash
+        self._prev_history_version = self._history_version
 
     def _full_redraw(
         self, stdscr: curses.window, channels: List[Channel],
-        selected_index: int, scroll_offset: int, channel_favorites: Set[str],
+        selected_index: int, scroll_offset: int, channel_favorites: AbstractSet[str],
         current_channel: Optional[Channel], player: Any, is_playing: bool,
         current_bitrate: str, split_x: int, panel_height: int,
         max_y: int, max_x: int, is_searching: bool, search_query: str,
         show_footer: bool = True
     ) -> None:
         """Perform full screen redraw."""
-        # Clear screen and set background
-        stdscr.clear()
-        stdscr.bkgd(" ", curses.color_pair(1))
+        # Background is set once per theme (see SomaFMPlayer.init_colors);
+        # erase() lets curses send only the cells that actually change.
+        stdscr.erase()
+        self._channel_rows_drawn.clear()
+        self._playback_rows_drawn.clear()
+        self._footer_drawn = None
 
         # Left panel: Channel list
         self._display_channels_panel(
@@ -353,22 +562,30 @@ class UIScreen:
 
     def _partial_redraw(
         self, stdscr: curses.window, channels: List[Channel],
-        selected_index: int, scroll_offset: int, channel_favorites: Set[str],
+        selected_index: int, scroll_offset: int, channel_favorites: AbstractSet[str],
         current_channel: Optional[Channel], player: Any, is_playing: bool,
         current_bitrate: str, split_x: int, panel_height: int,
         max_y: int, max_x: int, is_searching: bool, search_query: str,
         show_footer: bool = True,
         selection_changed: bool = False, scroll_changed: bool = False,
         favorites_changed: bool = False, playback_changed: bool = False,
-        metadata_changed: bool = False, history_changed: bool = False
+        metadata_changed: bool = False, history_changed: bool = False,
+        channel_list_changed: bool = False
     ) -> None:
         """Perform partial redraw - only update changed elements.
 
         Note: This does NOT update background color. For theme changes,
         use _full_redraw() instead.
         """
-        # Redraw channel list if selection, scroll, or favorites changed
-        if selection_changed or scroll_changed or favorites_changed:
+        if channel_list_changed:
+            # Filtered list or search prompt changed: redraw the channel
+            # panel only, the playback panel and footer stay as they are
+            self._display_channels_panel(
+                stdscr, channels, selected_index, scroll_offset, channel_favorites,
+                0, 0, split_x, panel_height, is_searching, search_query,
+            )
+        elif selection_changed or scroll_changed or favorites_changed:
+            # Redraw channel list if selection, scroll, or favorites changed
             self._redraw_channel_list(
                 stdscr, channels, selected_index, scroll_offset, channel_favorites,
                 split_x, panel_height,
@@ -381,8 +598,9 @@ class UIScreen:
                 current_channel, player, is_playing, current_bitrate,
             )
 
-        # Redraw search prompt if searching
-        if is_searching:
+        # Redraw search prompt if searching (the channel panel redraw
+        # above already includes it)
+        if is_searching and not channel_list_changed:
             self._redraw_search_prompt(stdscr, search_query, split_x, panel_height)
 
         # Redraw instructions if footer is shown
@@ -392,20 +610,18 @@ class UIScreen:
         # Display volume indicator (always) - needed for partial redraw
         self._handle_volume_display(stdscr)
 
-        # Refresh screen to show changes
-        stdscr.refresh()
-
     def _redraw_channel_list(
         self, stdscr: curses.window, channels: List[Channel],
-        selected_index: int, scroll_offset: int, channel_favorites: Set[str],
+        selected_index: int, scroll_offset: int, channel_favorites: AbstractSet[str],
         split_x: int, panel_height: int
     ) -> None:
         """Redraw only the channel list portion.
 
-        Only clears within the channel panel width so the playback panel
-        (which holds the track history) is not wiped on every selection move.
+        Only rows whose text or attribute changed are written, and only
+        within the channel panel width so the playback panel (which holds
+        the track history) is not wiped on every selection move.
         """
-        max_y, max_x = stdscr.getmaxyx()
+        max_y, max_x = self.get_geometry(stdscr)
         visible_channels = panel_height - 3
         start_y = 0  # Channel list always starts at y=0
 
@@ -414,47 +630,23 @@ class UIScreen:
             if display_y >= panel_height - 1 or display_y >= max_y:
                 break
 
-            # Prepare channel title
-            fav_icon = f"{get_favorite_icon()} " if channel.id in channel_favorites else "  "
-            title = channel.title
-            max_title_len = split_x - 6
-            if len(title) > max_title_len:
-                title = title[:max_title_len - 3] + "..."
-            display_title = f"{fav_icon}{title}"
+            # Row text is cached; addnstr clips it to the panel width
+            is_selected = i + scroll_offset == selected_index
+            row_text = self._channel_row_text(channel, channel.id in channel_favorites, is_selected)
 
-            try:
-                # Clear only within the channel panel (write spaces) so we
-                # don't wipe the playback panel on the right.
-                blank = " " * (split_x - 1)
-                stdscr.addstr(display_y, 0, blank[:split_x - 1], curses.color_pair(1))
-
-                if i + scroll_offset == selected_index:
-                    stdscr.addstr(display_y, 0, f"> {display_title}"[:split_x - 1],
-                        curses.color_pair(2) | curses.A_REVERSE
-                    )
-                else:
-                    stdscr.addstr(display_y, 0, f"  {display_title}"[:split_x - 1], curses.color_pair(1))
-            except curses.error:
-                continue
+            attr = self.attr_selected if is_selected else self.attr_text
+            self._put_channel_row(stdscr, display_y, 0, split_x, row_text, attr)
 
     def _redraw_playback_info(
         self, stdscr: curses.window, start_x: int, start_y: int,
         width: int, height: int, current_channel: Optional[Channel],
         player: Any, is_playing: bool, current_bitrate: str = ""
     ) -> None:
-        """Redraw only the playback info portion."""
-        max_y, max_x = stdscr.getmaxyx()
-        
-        # Clear the full playback panel area (including history below line 10)
-        # so the track history is always fully redrawn.
-        for y in range(start_y, min(start_y + height, max_y)):
-            try:
-                stdscr.move(y, start_x)
-                stdscr.clrtoeol()
-            except curses.error:
-                pass
+        """Redraw only the playback info portion.
 
-        # Redraw playback info
+        Changed rows are rewritten and rows that disappeared are cleared by
+        _put_playback_rows(), so the panel is not blanked first.
+        """
         self._display_playback_panel(
             stdscr, start_x, start_y, width, height,
             current_channel, player, is_playing, current_bitrate,
@@ -470,13 +662,11 @@ class UIScreen:
         try:
             # Clear only within the channel panel so the playback panel
             # (track history) is not wiped during search.
-            blank = " " * (split_x - 1)
-            stdscr.addstr(prompt_y, 0, blank, curses.color_pair(2))
-            stdscr.addstr(prompt_y, 0, prompt[:split_x - 1], curses.color_pair(2) | curses.A_BOLD)
-            curses.curs_set(1)
+            stdscr.hline(prompt_y, 0, " ", split_x - 1, self.attr_accent)
+            stdscr.addnstr(prompt_y, 0, prompt, split_x - 1, self.attr_accent_bold)
             stdscr.move(prompt_y, len(prompt))
         except curses.error:
-            curses.curs_set(0)
+            pass
 
     def _display_channels_panel(
         self,
@@ -484,7 +674,7 @@ class UIScreen:
         channels: List[Channel],
         selected_index: int,
         scroll_offset: int,
-        channel_favorites: Set[str],
+        channel_favorites: AbstractSet[str],
         start_x: int,
         start_y: int,
         width: int,
@@ -492,21 +682,19 @@ class UIScreen:
         is_searching: bool = False,
         search_query: str = "",
     ) -> None:
-        """Display channels panel"""
+        """Display channels panel.
+
+        Also used on its own when the filtered list changes, so nothing is
+        cleared beyond the panel width; rows left over from a longer list
+        are blanked instead of erasing the screen.
+        """
         # Header
-        try:
-            header = f"Channels ({len(channels)})"
-            if len(header) > width - 2:
-                header = header[: width - 5] + "..."
-            # Clear header line first using clrtoeol
-            stdscr.move(start_y, start_x)
-            stdscr.clrtoeol()
-            stdscr.addstr(start_y, start_x, header, curses.color_pair(1) | curses.A_BOLD)
-        except curses.error:
-            pass
+        header = f"Channels ({len(channels)})"
+        self._put_channel_row(stdscr, start_y, start_x, width, header, self.attr_header)
 
         # Visible channels
         visible_channels = height - 3
+        shown_ys = {start_y}
 
         # Display channels
         for i, channel in enumerate(channels[scroll_offset : scroll_offset + visible_channels]):
@@ -514,45 +702,33 @@ class UIScreen:
             if display_y >= height - 1:
                 break
 
-            # Prepare channel title
-            fav_icon = f"{get_favorite_icon()} " if channel.id in channel_favorites else "  "
-            title = channel.title
-            max_title_len = width - 6
-            if len(title) > max_title_len:
-                title = title[: max_title_len - 3] + "..."
-            display_title = f"{fav_icon}{title}"
+            # Row text is cached; addnstr clips it to the panel width
+            is_selected = i + scroll_offset == selected_index
+            row_text = self._channel_row_text(channel, channel.id in channel_favorites, is_selected)
 
-            try:
-                # Clear only within the channel panel width so the playback
-                # panel (which holds the track history) is not wiped.
-                blank = " " * (width - 1)
-                stdscr.addstr(display_y, start_x, blank[:width - 1], curses.color_pair(1))
-
-                if i + scroll_offset == selected_index:
-                    stdscr.addstr(
-                        display_y, start_x, f"> {display_title}"[: width - 1], curses.color_pair(2) | curses.A_REVERSE
-                    )
-                else:
-                    stdscr.addstr(display_y, start_x, f"  {display_title}"[: width - 1], curses.color_pair(1))
-            except curses.error:
-                continue
+            attr = self.attr_selected if is_selected else self.attr_text
+            self._put_channel_row(stdscr, display_y, start_x, width, row_text, attr)
+            shown_ys.add(display_y)
+
+        for y in [y for y in self._channel_rows_drawn if y not in shown_ys]:
+            self._put_channel_row(stdscr, y, start_x, width, "", self.attr_text)
+            del self._channel_rows_drawn[y]
 
         # Search prompt
-        if is_searching:
-            prompt = f"Search: {search_query}"
-            prompt_y = start_y + height - 2
-            try:
-                # Clear only within the channel panel width to avoid wiping
-                # the playback panel (track history) during search.
-                blank = " " * (width - 1)
-                stdscr.addstr(prompt_y, start_x, blank, curses.color_pair(2))
-                stdscr.addstr(prompt_y, start_x, prompt[: width - 1], curses.color_pair(2) | curses.A_BOLD)
-                curses.curs_set(1)
+        prompt_y = start_y + height - 2
+        try:
+            # Clear only within the channel panel width to avoid wiping
+            # the playback panel (track history) during search.
+            stdscr.hline(
+                prompt_y, start_x, " ", width - 1,
+                self.attr_accent if is_searching else self.attr_text,
+            )
+            if is_searching:
+                prompt = f"Search: {search_query}"
+                stdscr.addnstr(prompt_y, start_x, prompt, width - 1, self.attr_accent_bold)
                 stdscr.move(prompt_y, start_x + len(prompt))
-            except curses.error:
-                curses.curs_set(0)
-        else:
-            curses.curs_set(0)
+        except curses.error:
+            pass
 
     def _display_playback_panel(
         self,
@@ -567,62 +743,32 @@ class UIScreen:
         current_bitrate: str = "",
     ) -> None:
         """Display playback panel"""
-        max_y, max_x = stdscr.getmaxyx()
+        max_y, max_x = self.get_geometry(stdscr)
         available_width = min(width, max_x - start_x)
-
-        if not current_channel or not is_playing:
-            if available_width > 0:
-                try:
-                    # Clear line using clrtoeol
-                    stdscr.move(start_y, start_x)
-                    stdscr.clrtoeol()
-                    text = "No channel playing"
-                    if len(text) <= available_width:
-                        stdscr.addstr(start_y, start_x, text, curses.color_pair(3))
-
-                    if start_y + 2 < max_y:
-                        stdscr.move(start_y + 2, start_x)
-                        stdscr.clrtoeol()
-                        text2 = "Select a channel and press Enter to start"
-                        if len(text2) <= available_width:
-                            stdscr.addstr(start_y + 2, start_x, text2, curses.color_pair(5))
-                except curses.error:
-                    pass
-            # History is always visible, even when stopped
-            self._display_track_history(stdscr, start_x, start_y + 5, width, height)
+        if available_width <= 0:
             return
+        # Screen rows from start_y down; a row at offset n fits if n < this
+        rows_available = max_y - start_y
 
-        # Channel info - clear line first
-        if available_width > 0:
-            try:
-                stdscr.move(start_y, start_x)
-                stdscr.clrtoeol()
-                channel_title = f"{get_channel_icon(current_channel.id)} {current_channel.title}"
-                if len(channel_title) > available_width:
-                    channel_title = channel_title[: available_width - 3] + "..."
-                if len(channel_title) <= available_width:
-                    stdscr.addstr(start_y, start_x, channel_title, curses.color_pair(1) | curses.A_BOLD)
-            except curses.error:
-                pass
+        rows: List[Tuple[int, str, int]] = []
+        if not current_channel or not is_playing:
+            rows.append((start_y, "No channel playing", self.attr_info))
+            if rows_available > 2:
+                rows.append(
+                    (start_y + 2, "Select a channel and press Enter to start", self.attr_hint)
+                )
+        else:
+            # Channel info
+            channel_title = f"{get_channel_icon(current_channel.id)} {current_channel.title}"
+            rows.append((start_y, channel_title, self.attr_header))
 
-        # Channel description - clear line first
-        if available_width > 0 and start_y + 1 < max_y:
-            try:
-                stdscr.move(start_y + 1, start_x)
-                stdscr.clrtoeol()
+            # Channel description
+            if rows_available > 1:
                 description = current_channel.description or "No description"
-                if len(description) > available_width:
-                    description = description[: available_width - 3] + "..."
-                if len(description) <= available_width:
-                    stdscr.addstr(start_y + 1, start_x, description, curses.color_pair(3))
-            except curses.error:
-                pass
+                rows.append((start_y + 1, description, self.attr_info))
 
-        # Channel stats (listeners and bitrate) - clear line first
-        if available_width > 0 and start_y + 2 < max_y:
-            try:
-                stdscr.move(start_y + 2, start_x)
-                stdscr.clrtoeol()
+            # Channel stats (listeners and bitrate)
+            if rows_available > 2:
                 stats_parts = []
                 if current_channel.listeners > 0:
                     stats_parts.append(f"{get_listener_icon()} {current_channel.listeners}")
@@ -636,189 +782,200 @@ class UIScreen:
                         bitrate_label = display_bitrate
                     stats_parts.append(f"{get_bitrate_icon()} {bitrate_label}")
                 if stats_parts:
-                    stats = " | ".join(stats_parts)
-                    if len(stats) > available_width:
-                        stats = stats[: available_width - 3] + "..."
                     # Use same style as instructions for consistency
-                    stdscr.addstr(start_y + 2, start_x, stats, curses.color_pair(3))
-            except curses.error:
-                pass
+                    rows.append((start_y + 2, " | ".join(stats_parts), self.attr_info))
 
-        # Current track - clear line first
-        if available_width > 0 and start_y + 4 < max_y:
-            try:
-                stdscr.move(start_y + 3, start_x)
-                stdscr.clrtoeol()
+            # Current track
+            if rows_available > 3:
                 is_paused = player and player.pause
                 play_symbol = get_play_symbol(is_paused)
                 current_track = f"{play_symbol} {self.current_metadata.artist} - {self.current_metadata.title}"
-                if len(current_track) > available_width:
-                    current_track = current_track[: available_width - 3] + "..."
-                if len(current_track) <= available_width:
-                    stdscr.addstr(start_y + 3, start_x, current_track, curses.color_pair(4) | curses.A_BOLD)
-            except curses.error:
-                pass
+                current_track = _truncate(current_track, available_width)
+                rows.append((start_y + 3, current_track, self.attr_track_bold))
 
         # Track history (always visible, even when stopped)
-        self._display_track_history(stdscr, start_x, start_y + 5, width, height)
+        rows.extend(self._track_history_rows(start_y + 5, height, max_y))
 
-    def _display_track_history(
-        self,
-        stdscr: curses.window,
-        start_x: int,
-        start_y: int,
-        width: int,
-        height: int,
-    ) -> None:
-        """Display track history list.
+        self._put_playback_rows(stdscr, start_x, available_width, rows)
+
+    def _track_history_rows(
+        self, start_y: int, height: int, max_y: int
+    ) -> List[Tuple[int, str, int]]:
+        """Build the track history rows as (y, text, attr).
 
         Always rendered — both while playing and when stopped — so the user
         can review previously played tracks during the session.
         """
-        max_y, max_x = stdscr.getmaxyx()
-        available_width = min(width, max_x - start_x)
+        rows = []
         y = start_y
-        for track in self.track_history:
+        for track in self._history:
             if y >= height - 1 or y >= max_y:
                 break
             # Skip Loading... entries in history display
             if track.artist == "Loading..." or track.title == "Loading...":
                 continue
-            if available_width > 0:
-                try:
-                    # Clear line using clrtoeol
-                    stdscr.move(y, start_x)
-                    stdscr.clrtoeol()
-                    timestamp = f"[{track.timestamp}] " if track.timestamp else "  "
-                    channel_part = f" ({track.channel_name})" if track.channel_name else ""
-                    track_info = f"  {timestamp}{track.artist} - {track.title}{channel_part}"
-                    if len(track_info) > available_width:
-                        track_info = track_info[: available_width - 3] + "..."
-                    if len(track_info) <= available_width:
-                        stdscr.addstr(y, start_x, track_info, curses.color_pair(4))
-                    y += 1
-                except curses.error:
-                    continue
+            timestamp = f"[{track.timestamp}] " if track.timestamp else "  "
+            channel_part = f" ({track.channel_name})" if track.channel_name else ""
+            track_info = f"  {timestamp}{track.artist} - {track.title}{channel_part}"
+            rows.append((y, track_info, self.attr_track))
+            y += 1
+        return rows
+
+    def _put_playback_rows(
+        self, stdscr: curses.window, start_x: int, width: int,
+        rows: List[Tuple[int, str, int]],
+    ) -> None:
+        """Write playback panel rows, skipping those already on screen.
+
+        Rows drawn last time but absent now are cleared.
+        """
+        drawn = self._playback_rows_drawn
+        current_ys = set()
+        for y, text, attr in rows:
+            current_ys.add(y)
+            row = (text, attr)
+            if drawn.get(y) == row:
+                continue
+            try:
+                stdscr.move(y, start_x)
+                stdscr.clrtoeol()
+                stdscr.addnstr(y, start_x, text, width, attr)
+            except curses.error:
+                drawn.pop(y, None)
+                continue
+            drawn[y] = row
+
+        for y in [y for y in drawn if y not in current_ys]:
+            try:
+                stdscr.move(y, start_x)
+                stdscr.clrtoeol()
+            except curses.error:
+                pass
+            del drawn[y]
 
     def _display_instructions(self, stdscr: curses.window, max_y: int, max_x: int) -> None:
         """Display instructions at bottom of screen"""
-        try:
-            instruction_items = [
-                "↑↓/jk - select",
-                "Enter/l - play",
-                "/ - search",
-                "Space - pause",
-                "h - stop",
-                "f - track fav",
-                "Ctrl+f - channel fav",
-                "z - only fav",
-                "x - toggle footer",
-                "r - bitrate",
-                "s - sleep",
-                "t/y - theme",
-                "PgUp/Dn - volume",
-                "q - quit",
-            ]
-
-            available_width = max_x - 1
-            available_lines = 2
+        available_width = max_x - 1
+        available_lines = 2
+        lines = self._layout_instructions(available_width, available_lines)
+        if self._footer_drawn == (max_y, lines):
+            return
 
+        try:
             # First, completely clear the instruction area to prevent artifacts
             for i in range(available_lines):
                 y_pos = max_y - available_lines + i
                 stdscr.move(y_pos, 0)
                 stdscr.clrtoeol()
 
-            lines = []
-            current_line = ""
+            # Don't use A_DIM for instructions - it makes text too faint on all themes
+            # Use bold attribute instead for better visibility
+            attr = self.attr_hint_bold
+
+            for i, line in enumerate(lines):
+                y_pos = max_y - available_lines + i
+                stdscr.addstr(y_pos, 0, line, attr)
 
-            for item in instruction_items:
-                # Use space separator instead of " | "
-                separator = "  " if current_line else ""
-                test_line = current_line + separator + item
+        except curses.error:
+            self._footer_drawn = None
+            return
+        self._footer_drawn = (max_y, lines)
 
-                if len(test_line) <= available_width:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                        current_line = item
-                    else:
-                        current_line = item[: available_width - 3] + "..." if available_width > 3 else item[: available_width]
+    def _layout_instructions(self, available_width: int, available_lines: int) -> Tuple[str, ...]:
+        """Wrap the instruction items into padded footer lines.
 
-                    if len(lines) >= available_lines:
-                        break
+        The layout only depends on the terminal width, so it is computed
+        once per width and reused on every frame.
+        """
+        key = (available_width, available_lines)
+        cached = self._instruction_lines_cache.get(key)
+        if cached is not None:
+            return cached
 
-            if current_line and len(lines) < available_lines:
-                lines.append(current_line)
+        lines = []
+        current_line = ""
 
-            # Determine if current theme is light - use different attributes for better visibility
-            from .themes import is_light_theme
-            theme_name = self._current_theme_name if hasattr(self, '_current_theme_name') else 'default'
-            is_light = is_light_theme(theme_name)
-            
-            # Don't use A_DIM for instructions - it makes text too faint on all themes
-            # Use bold attribute instead for better visibility
-            attr = curses.color_pair(5) | curses.A_BOLD
+        for item in INSTRUCTION_ITEMS:
+            # Use space separator instead of " | "
+            separator = "  " if current_line else ""
+            test_line = current_line + separator + item
 
-            for i, line in enumerate(lines):
-                if i >= available_lines:
+            if len(test_line) <= available_width:
+                current_line = test_line
+            else:
+                if current_line:
+                    lines.append(current_line)
+                    current_line = item
+                else:
+                    current_line = _truncate(item, available_width)
+
+                if len(lines) >= available_lines:
                     break
-                y_pos = max_y - available_lines + i
-                padded_line = line.ljust(available_width)
-                stdscr.addstr(y_pos, 0, padded_line, attr)
 
-        except curses.error:
-            pass
+        if current_line and len(lines) < available_lines:
+            lines.append(current_line)
+
+        result = tuple(line.ljust(available_width) for line in lines[:available_lines])
+        self._instruction_lines_cache[key] = result
+        return result
 
     def _redraw_instructions(self, stdscr: curses.window, max_y: int, max_x: int) -> None:
         """Redraw only the instructions at bottom (for partial redraw)."""
         self._display_instructions(stdscr, max_y, max_x)
 
     def _handle_volume_display(self, stdscr: curses.window) -> None:
-        """Handle volume indicator display"""
-        # Always draw volume indicator if it was recently updated
+        """Handle volume indicator display.
+
+        The indicator is drawn until expire_volume() hides it.
+        """
         if self.volume_display is not None:
-            elapsed = time.time() - self.volume_display_time
-            if elapsed < VOLUME_DISPLAY_TIMEOUT:
-                # Draw directly
-                self._draw_volume_indicator(stdscr)
-            else:
-                # Time expired, clear and reset
-                self.volume_display = None
-                self.volume_display_time = 0
+            self._draw_volume_indicator(stdscr)
+
+    def expire_volume(self) -> bool:
+        """Hide the volume indicator once VOLUME_DISPLAY_TIMEOUT has passed.
+
+        Called once per main loop iteration rather than on every draw.
+
+        Returns:
+            True if the indicator was just hidden; the cache is invalidated
+            so the next frame repaints what it covered
+        """
+        if (
+            self.volume_display is None
+            or time.monotonic() - self.volume_display_time < VOLUME_DISPLAY_TIMEOUT
+        ):
+            return False
+        self.volume_display = None
+        self.volume_display_time = 0
+        self.invalidate_cache()
+        return True
 
     def _draw_volume_indicator(self, stdscr: curses.window) -> None:
         """Draw volume indicator"""
-        max_y, max_x = stdscr.getmaxyx()
-        bar_width = 20
+        max_y, max_x = self.get_geometry(stdscr)
+        bar_width = _VOLUME_BAR_WIDTH
         start_y = 1
         start_x = max_x - bar_width - 5
 
         volume = self.volume_display
-        vol_bar_color = VOLUME_BAR_COLOR_PAIR
-        vol_icon_color = VOLUME_ICON_COLOR_PAIR
 
         # Clear entire area first with spaces
-        clear_str = " " * (bar_width + 5)
         if start_x - 1 >= 0:
-            stdscr.addstr(start_y, start_x - 1, clear_str)
+            stdscr.addstr(start_y, start_x - 1, _VOLUME_CLEAR)
 
         # Draw bars
-        filled_blocks = int((volume / 100) * bar_width)
-        empty_blocks = bar_width - filled_blocks
+        filled_blocks = min(max(int((volume / 100) * bar_width), 0), bar_width)
+        filled_bar, empty_bar = _VOLUME_BARS[filled_blocks]
 
-        if filled_blocks > 0:
-            filled_bar = "█" * filled_blocks
-            stdscr.addstr(start_y, start_x, filled_bar, curses.color_pair(vol_bar_color) | curses.A_BOLD)
+        if filled_bar:
+            stdscr.addstr(start_y, start_x, filled_bar, self.attr_volume_bar)
 
-        if empty_blocks > 0:
-            empty_bar = "▁" * empty_blocks
-            stdscr.addstr(start_y, start_x + filled_blocks, empty_bar, curses.color_pair(vol_bar_color) | curses.A_DIM)
+        if empty_bar:
+            stdscr.addstr(start_y, start_x + filled_blocks, empty_bar, self.attr_volume_empty)
 
         # Draw percentage
         vol_text = f"{volume:3d}%"
-        stdscr.addstr(start_y, start_x + bar_width, vol_text, curses.color_pair(vol_icon_color) | curses.A_BOLD)
+        stdscr.addstr(start_y, start_x + bar_width, vol_text, self.attr_volume_text)
 
     def add_to_history(self, metadata: TrackMetadata) -> None:
         """Add track to history"""
@@ -826,8 +983,8 @@ class UIScreen:
         if metadata.artist in ("Loading...", "Unknown", "") or metadata.title in ("Loading...", "Unknown", ""):
             return
         # Skip duplicates with the most recent entry (same artist+title+channel)
-        if self.track_history:
-            last = self.track_history[0]
+        if self._history:
+            last = self._history[0]
             if (
                 last.artist == metadata.artist
                 and last.title == metadata.title
@@ -835,36 +992,42 @@ class UIScreen:
             ):
                 return
         if not metadata.timestamp:
-            metadata.timestamp = time.strftime("%H:%M:%S")
-        self.track_history.insert(0, metadata)
-        if len(self.track_history) > self.max_history:
-            self.track_history.pop()
+            metadata = metadata.with_timestamp(clock_hms())
+        self._history.appendleft(metadata)
+        self._history_version += 1
 
     def clear_history(self) -> None:
         """Clear track history."""
-        self.track_history.clear()
+        self._history.clear()
+        self._history_version += 1
 
     def update_metadata(self, metadata: TrackMetadata) -> None:
         """Update current track metadata"""
         # Don't allow Loading... to overwrite or be added to history
         if metadata.artist == "Loading..." or metadata.title == "Loading...":
             return
-        if metadata.artist != self.current_metadata.artist or metadata.title != self.current_metadata.title:
-            if self.current_metadata.artist not in ("Loading...", "Unknown", "") and self.current_metadata.title not in ("Loading...", "Unknown", ""):
+        if not metadata.is_same_track(self.current_metadata):
+            archived = self.current_metadata
+            if archived.artist not in ("Loading...", "Unknown", "") and archived.title not in ("Loading...", "Unknown", ""):
                 # Preserve channel name on the entry being archived
-                if self.current_metadata.channel_name is None and self.current_channel is not None:
-                    self.current_metadata.channel_name = self.current_channel.title
-                self.add_to_history(self.current_metadata)
+                if archived.channel_name is None and self.current_channel is not None:
+                    archived = archived.with_channel(self.current_channel.title)
+                self.add_to_history(archived)
             self.current_metadata = metadata
 
     def show_volume(self, stdscr: curses.window, volume: int) -> None:
         """Show volume indicator"""
         self.volume_display = volume
-        self.volume_display_time = time.time()
+        self.volume_display_time = time.monotonic()
 
     def show_notification(self, stdscr: curses.window, message: str, timeout: float = 1.5) -> None:
-        """Show notification with automatic screen refresh after closing."""
-        max_y, max_x = stdscr.getmaxyx()
+        """Show notification with automatic screen refresh after closing.
+
+        Both updates go out with a single curses.doupdate(). Closing only
+        repaints the cells the notification covered instead of clearing
+        the whole terminal.
+        """
+        max_y, max_x = self.get_geometry(stdscr)
         win_width = min(len(message) + 4, max_x)
         win_height = 3
         start_y = max_y // 2 - win_height // 2
@@ -872,26 +1035,53 @@ class UIScreen:
 
         try:
             notif_win = curses.newwin(win_height, win_width, start_y, start_x)
-            notif_win.bkgd(" ", curses.color_pair(3) | curses.A_BOLD)
+            notif_win.bkgd(" ", self.attr_info_bold)
             notif_win.box()
-            notif_win.addstr(1, 2, message[: win_width - 4])
-            notif_win.refresh()
+            notif_win.addnstr(1, 2, message, win_width - 4)
+            notif_win.noutrefresh()
+            curses.doupdate()
             curses.napms(int(timeout * 1000))
-            notif_win.clear()
-            notif_win.refresh()
-            
-            # Перерисовываем основной экран после закрытия уведомления
-            stdscr.refresh()
+
+            # Перерисовываем основной экран после закрытия уведомления:
+            # touchwin() makes doupdate() compare every line again, so the
+            # notification area is restored from stdscr
+            stdscr.touchwin()
+            stdscr.noutrefresh()
+            curses.doupdate()
         except curses.error:
             pass
 
+    def _draw_box(
+        self, stdscr: curses.window, y: int, x: int, height: int, width: int
+    ) -> None:
+        """Draw a box border on stdscr.
+
+        curses.window.box() only frames whole windows, so overlays drawn on
+        the main screen use this. Top and bottom edges are written as one
+        string each instead of cell by cell.
+
+        Raises:
+            curses.error: If the box does not fit on the screen
+        """
+        attr = self.attr_info_bold
+        top, bottom = _box_edges(width)
+        stdscr.addstr(y, x, top, attr)
+        for row in range(y + 1, y + height - 1):
+            stdscr.addstr(row, x, "│", attr)
+            stdscr.addstr(row, x + width - 1, "│", attr)
+        stdscr.addstr(y + height - 1, x, bottom, attr)
+
     def display_sleep_overlay(
         self,
         stdscr: curses.window,
         sleep_input: str,
     ) -> None:
-        """Display sleep timer input overlay - drawn on main screen for proper cleanup."""
-        max_y, max_x = stdscr.getmaxyx()
+        """Display sleep timer input overlay - drawn on main screen for proper cleanup.
+
+        Like display(), this only stages output; the caller flushes the
+        frame with curses.doupdate().
+        """
+        max_y, max_x = self.get_geometry(stdscr)
 
         # Overlay dimensions
         overlay_width = 30
@@ -900,48 +1090,30 @@ class UIScreen:
         start_x = (max_x - overlay_width) // 2
 
         try:
-            # Draw overlay box manually (curses.window.box doesn't accept coordinates)
-            stdscr.attron(curses.color_pair(3) | curses.A_BOLD)
-            
-            # Draw border
-            for x in range(overlay_width):
-                stdscr.addstr(start_y, start_x + x, "─", curses.color_pair(3) | curses.A_BOLD)
-                stdscr.addstr(start_y + overlay_height - 1, start_x + x, "─", curses.color_pair(3) | curses.A_BOLD)
-            for y in range(1, overlay_height - 1):
-                stdscr.addstr(start_y + y, start_x, "│", curses.color_pair(3) | curses.A_BOLD)
-                stdscr.addstr(start_y + y, start_x + overlay_width - 1, "│", curses.color_pair(3) | curses.A_BOLD)
-            
-            # Corners
-            stdscr.addstr(start_y, start_x, "┌", curses.color_pair(3) | curses.A_BOLD)
-            stdscr.addstr(start_y, start_x + overlay_width - 1, "┐", curses.color_pair(3) | curses.A_BOLD)
-            stdscr.addstr(start_y + overlay_height - 1, start_x, "└", curses.color_pair(3) | curses.A_BOLD)
-            stdscr.addstr(start_y + overlay_height - 1, start_x + overlay_width - 1, "┘", curses.color_pair(3) | curses.A_BOLD)
-            
-            stdscr.attroff(curses.color_pair(3) | curses.A_BOLD)
+            self._draw_box(stdscr, start_y, start_x, overlay_height, overlay_width)
 
             # Title
             title = "Sleep Timer"
             stdscr.addstr(start_y + 1, start_x + (overlay_width - len(title)) // 2,
-                         title, curses.color_pair(1) | curses.A_BOLD)
+                         title, self.attr_header)
 
             # Input field
             input_label = "Minutes: "
             input_value = sleep_input or ""
             input_display = input_label + input_value + "_"
-            stdscr.addstr(start_y + 3, start_x + 2, input_display[:overlay_width - 4],
-                         curses.color_pair(2))
+            stdscr.addnstr(start_y + 3, start_x + 2, input_display, overlay_width - 4,
+                           self.attr_accent)
 
             # Hints
             stdscr.addstr(start_y + 5, start_x + 2, "Esc: cancel",
-                         curses.color_pair(5) | curses.A_DIM)
+                         self.attr_hint_dim)
 
             # Position cursor at input
-            curses.curs_set(1)
+            self.set_cursor_visible(1)
             stdscr.move(start_y + 3, start_x + 2 + len(input_label) + len(input_value))
-            stdscr.refresh()
 
         except curses.error:
-            curses.curs_set(0)
+            self.set_cursor_visible(0)
 
     def display_sleep_timer(
         self,
@@ -952,7 +1124,7 @@ class UIScreen:
         if not remaining:
             return
 
-        max_y, max_x = stdscr.getmaxyx()
+        max_y, max_x = self.get_geometry(stdscr)
 
         # Timer format: " ⏱ MM:SS "
         timer_text = f" ⏱ {remaining} "
@@ -965,49 +1137,13 @@ class UIScreen:
             stdscr.move(start_y, start_x)
             stdscr.clrtoeol()
             # Draw timer box
-            stdscr.addstr(start_y, start_x, timer_text, curses.color_pair(3) | curses.A_BOLD)
+            stdscr.addstr(start_y, start_x, timer_text, self.attr_info_bold)
         except curses.error:
             pass
 
     def _display_help(self, stdscr: curses.window, max_y: int, max_x: int) -> None:
         """Display help screen - drawn on main screen for proper cleanup."""
-        # Get version from package
-        from . import __version__
-        
-        help_text = [
-            (f"SomaFM TUI v{__version__} - Keyboard Shortcuts", "header"),
-            ("", ""),
-            ("Navigation", "section"),
-            ("  ↑/k  - Move up", "normal"),
-            ("  ↓/j  - Move down", "normal"),
-            ("  Enter/l - Play selected channel", "normal"),
-            ("  ?     - Toggle this help", "normal"),
-            ("", ""),
-            ("Playback", "section"),
-            ("  Space - Pause/Resume", "normal"),
-            ("  h     - Stop playback", "normal"),
-            ("  r     - Cycle bitrate", "normal"),
-            ("  v/b   - Decrease/Increase volume", "normal"),
-            ("  PgUp  - Increase volume", "normal"),
-            ("  PgDn  - Decrease volume", "normal"),
-            ("", ""),
-            ("Channels", "section"),
-            ("  /     - Search channels", "normal"),
-            ("  f     - Add current track to favorites", "normal"),
-            ("  Ctrl+F - Toggle channel favorite", "normal"),
-            ("  z     - Show only favorites", "normal"),
-            ("  x     - Toggle footer", "normal"),
-            ("", ""),
-            ("Timer", "section"),
-            ("  s     - Set sleep timer", "normal"),
-            ("", ""),
-            ("Appearance", "section"),
-            ("  t/y   - Cycle theme (forward/back)", "normal"),
-            ("", ""),
-            ("Other", "section"),
-            ("  q     - Quit", "normal"),
-            ("  ESC   - Close search/help/timer", "normal"),
-        ]
+        help_text = _HELP_TEXT
 
         # Calculate box size
         box_height = len(help_text) + 2
@@ -1021,41 +1157,25 @@ class UIScreen:
                 stdscr.move(y, box_x)
                 stdscr.clrtoeol()
 
-            # Draw overlay box manually on main screen (not separate window)
-            stdscr.attron(curses.color_pair(3) | curses.A_BOLD)
-            
-            # Draw border
-            for x in range(box_width):
-                stdscr.addstr(box_y, box_x + x, "─", curses.color_pair(3) | curses.A_BOLD)
-                stdscr.addstr(box_y + box_height - 1, box_x + x, "─", curses.color_pair(3) | curses.A_BOLD)
-            for y in range(1, box_height - 1):
-                stdscr.addstr(box_y + y, box_x, "│", curses.color_pair(3) | curses.A_BOLD)
-                stdscr.addstr(box_y + y, box_x + box_width - 1, "│", curses.color_pair(3) | curses.A_BOLD)
-            
-            # Corners
-            stdscr.addstr(box_y, box_x, "┌", curses.color_pair(3) | curses.A_BOLD)
-            stdscr.addstr(box_y, box_x + box_width - 1, "┐", curses.color_pair(3) | curses.A_BOLD)
-            stdscr.addstr(box_y + box_height - 1, box_x, "└", curses.color_pair(3) | curses.A_BOLD)
-            stdscr.addstr(box_y + box_height - 1, box_x + box_width - 1, "┘", curses.color_pair(3) | curses.A_BOLD)
-            
-            stdscr.attroff(curses.color_pair(3) | curses.A_BOLD)
+            # Draw overlay box on main screen (not separate window)
+            self._draw_box(stdscr, box_y, box_x, box_height, box_width)
 
             # Draw help content
             for i, (text, style) in enumerate(help_text):
                 y = box_y + 1 + i
 
                 if style == "header":
-                    attr = curses.color_pair(1) | curses.A_BOLD
+                    attr = self.attr_header
                 elif style == "section":
-                    attr = curses.color_pair(2) | curses.A_BOLD
+                    attr = self.attr_accent_bold
                 else:
-                    attr = curses.color_pair(1)
+                    attr = self.attr_text
 
-                stdscr.addstr(y, box_x + 2, text.ljust(box_width - 4)[:box_width - 4], attr)
+                stdscr.addnstr(y, box_x + 2, text.ljust(box_width - 4), box_width - 4, attr)
 
             # Draw footer
             footer = "Press ? or ESC to close"
-            stdscr.addstr(box_y + box_height - 2, box_x + 2, footer.ljust(box_width - 4), curses.color_pair(5) | curses.A_DIM)
+            stdscr.addstr(box_y + box_height - 2, box_x + 2, footer.ljust(box_width - 4), self.attr_hint_dim)
 
         except curses.error:
             pass
@@ -10,12 +10,15 @@ from concurrent.futures import Future
 from somafm_tui.channels import (
     fetch_channels,
     fetch_channels_async,
+    load_stale_channels,
     load_channel_usage,
     save_channel_usage,
     clean_channel_usage,
     sort_channels_by_usage,
     get_valid_channel_ids,
     filter_channels_by_query,
+    ChannelSearchIndex,
+    _bigram_signature,
     load_favorites,
     save_favorites,
     toggle_favorite,
@@ -29,6 +32,7 @@ from somafm_tui.channels import (
     DEFAULT_TIMEOUT,
     CACHE_MAX_AGE,
 )
+from somafm_tui.http_client import NOT_MODIFIED
 from somafm_tui.models import Channel
 
 
@@ -152,6 +156,65 @@ class TestFetchChannels:
             channels = fetch_channels(cache_file="/tmp/cache.json")
             assert channels == []
 
+    def test_fetch_channels_revalidates_expired_cache(self, tmp_path):
+        """Should reuse an expired cache when the API reports 304."""
+        cache_file = tmp_path / "channels.json"
+        cache_file.write_text(json.dumps({"channels": [{"id": "test", "title": "Test"}]}))
+        old_mtime = time.time() - 7200
+        os.utime(cache_file, (old_mtime, old_mtime))
+
+        with patch('somafm_tui.channels.fetch_json', return_value=NOT_MODIFIED) as mock_fetch:
+            channels = fetch_channels(cache_file=str(cache_file))
+
+        assert [ch.id for ch in channels] == ["test"]
+        assert mock_fetch.call_args[1]["if_modified_since"] == pytest.approx(old_mtime)
+        assert os.path.getmtime(cache_file) > old_mtime
+
+    def test_fetch_channels_writes_cache_atomically(self, tmp_path):
+        """Should replace the cache file without leaving a temp file."""
+        cache_file = tmp_path / "cache" / "channels.json"
+        api_data = {"channels": [{"id": "test", "title": "Test"}]}
+
+        with patch('somafm_tui.channels.fetch_json', return_value=api_data):
+            fetch_channels(cache_file=str(cache_file))
+
+        assert json.loads(cache_file.read_text()) == api_data
+        assert os.listdir(cache_file.parent) == ["channels.json"]
+
+
+class TestLoadStaleChannels:
+    """Tests for load_stale_channels function."""
+
+    def _write_cache(self, tmp_path, age):
+        cache_file = tmp_path / "channels.json"
+        cache_file.write_text(json.dumps({"channels": [{"id": "groovesalad", "title": "Groove Salad"}]}))
+        mtime = time.time() - age
+        os.utime(cache_file, (mtime, mtime))
+        return str(cache_file)
+
+    def test_expired_cache_returned(self, tmp_path):
+        """Should return the channels of an expired cache."""
+        cache_file = self._write_cache(tmp_path, CACHE_MAX_AGE + 60)
+
+        channels = load_stale_channels(cache_file)
+
+        assert [ch.id for ch in channels] == ["groovesalad"]
+
+    def test_fresh_cache_ignored(self, tmp_path):
+        """Should leave a fresh cache to fetch_channels()."""
+        cache_file = self._write_cache(tmp_path, 10)
+
+        assert load_stale_channels(cache_file) is None
+
+    def test_missing_or_invalid_cache(self, tmp_path):
+        """Should return None when there is nothing usable on disk."""
+        bad_file = tmp_path / "bad.json"
+        bad_file.write_text("invalid")
+        os.utime(bad_file, (0, 0))
+
+        assert load_stale_channels(str(tmp_path / "missing.json")) is None
+        assert load_stale_channels(str(bad_file)) is None
+
 
 class TestFetchChannelsAsync:
     """Tests for fetch_channels_async function."""
@@ -260,11 +323,13 @@ class TestChannelUsage:
         usage_data = {"ch1": 100}
 
         with patch('os.makedirs'), \
+             patch('os.replace') as mock_replace, \
              patch('builtins.open', mock_open()) as mock_file:
 
             save_channel_usage("/tmp/usage.json", usage_data)
 
-            mock_file.assert_called()
+            mock_file.assert_called_once_with("/tmp/usage.json.tmp", "wb")
+            mock_replace.assert_called_once_with("/tmp/usage.json.tmp", "/tmp/usage.json")
 
     def test_save_channel_usage_io_error(self):
         """Should handle IO error on save."""
@@ -378,6 +443,54 @@ class TestChannelUsage:
         assert result == []
 
 
+class TestChannelSearchIndex:
+    """Tests for ChannelSearchIndex and its bigram prefilter."""
+
+    def test_search_index_matches_filter_function(self):
+        """ChannelSearchIndex should give the same results as the filter function."""
+        channels = [
+            Channel(id="ch1", title="Drone Zone", description="Ambient textures"),
+            Channel(id="ch2", title="Beat Blender", description=None),
+            Channel(id="ch3", title="Deep Space One", description="Deep ambient"),
+        ]
+        index = ChannelSearchIndex(channels)
+
+        for query in ("", "DRONE", "ambient", "e", "nonexistent"):
+            assert index.filter(query) == filter_channels_by_query(channels, query)
+
+    def test_search_index_incremental_queries(self):
+        """Extending or shortening the query should give the same results as a fresh filter."""
+        channels = [
+            Channel(id="ch1", title="Drone Zone", description="Ambient textures"),
+            Channel(id="ch2", title="Beat Blender", description=None),
+            Channel(id="ch3", title="Deep Space One", description="Deep ambient"),
+        ]
+        index = ChannelSearchIndex(channels)
+
+        for query in ("d", "de", "dee", "de", "d", "dr", "x", "xd"):
+            assert index.filter(query) == filter_channels_by_query(channels, query)
+
+    def test_search_index_repeated_query_returns_same_list(self):
+        """Repeating the last query should return the same list object."""
+        index = ChannelSearchIndex([Channel(id="ch1", title="Drone Zone")])
+
+        first = index.filter("drone")
+
+        assert index.filter("DRONE") is first
+        assert index.filter("zone") is not first
+
+    def test_bigram_signature_covers_substrings(self):
+        """A substring's signature must be a subset of the full text's."""
+        text = "groove salad"
+        full = _bigram_signature(text)
+
+        for start in range(len(text)):
+            for end in range(start + 1, len(text) + 1):
+                part = _bigram_signature(text[start:end])
+                assert part & full == part
+        assert _bigram_signature("g") == 0
+
+
 class TestFavorites:
     """Tests for favorites functions."""
 
@@ -398,6 +511,7 @@ class TestFavorites:
             favorites = load_favorites("/tmp/favorites.json")
 
             assert favorites == {"ch1", "ch2"}
+            assert isinstance(favorites, frozenset)
 
     def test_load_favorites_json_error(self):
         """Should return empty set on JSON error."""
@@ -413,11 +527,13 @@ class TestFavorites:
         favorites = {"ch1", "ch2"}
 
         with patch('os.makedirs'), \
+             patch('os.replace') as mock_replace, \
              patch('builtins.open', mock_open()) as mock_file:
 
             save_favorites("/tmp/favorites.json", favorites)
 
-            mock_file.assert_called()
+            mock_file.assert_called_once_with("/tmp/favorites.json.tmp", "wb")
+            mock_replace.assert_called_once_with("/tmp/favorites.json.tmp", "/tmp/favorites.json")
 
     def test_save_favorites_io_error(self):
         """Should handle IO error on save."""
@@ -447,6 +563,17 @@ class TestFavorites:
             assert "ch1" not in favorites
             mock_save.assert_called_once()
 
+    def test_toggle_favorite_keeps_given_set(self):
+        """Should return a new frozenset and leave the given one alone."""
+        current = frozenset({"ch1"})
+
+        with patch('somafm_tui.channels.save_favorites'):
+            favorites = toggle_favorite("ch2", "/tmp/favorites.json", favorites=current)
+
+        assert favorites == {"ch1", "ch2"}
+        assert isinstance(favorites, frozenset)
+        assert current == {"ch1"}
+
     def test_update_channel_usage(self):
         """Should update channel usage timestamp."""
         with patch('somafm_tui.channels.load_channel_usage', return_value={}), \
@@ -478,6 +605,17 @@ class TestFavoriteTrack:
         assert track.channel_name == "Channel"
         assert track.added_at is not None
 
+    def test_favorite_track_added_at_format(self):
+        """Should stamp new tracks with the local time as YYYY-MM-DD HH:MM:SS."""
+        track = FavoriteTrack(
+            artist="Artist",
+            title="Title",
+            channel_id="ch1",
+            channel_name="Channel",
+        )
+
+        assert time.strptime(track.added_at, "%Y-%m-%d %H:%M:%S")
+
     def test_favorite_track_to_dict(self):
         """Should convert to dictionary."""
         track = FavoriteTrack(
@@ -575,11 +713,13 @@ class TestFavoriteTracksFunctions:
         ]
 
         with patch('os.makedirs'), \
+             patch('os.replace') as mock_replace, \
              patch('builtins.open', mock_open()) as mock_file:
 
             save_favorite_tracks("/tmp/tracks.json", tracks)
 
-            mock_file.assert_called()
+            mock_file.assert_called_once_with("/tmp/tracks.json.tmp", "wb")
+            mock_replace.assert_called_once_with("/tmp/tracks.json.tmp", "/tmp/tracks.json")
 
     def test_save_favorite_tracks_io_error(self):
         """Should handle IO error on save."""
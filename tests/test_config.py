@@ -92,6 +92,17 @@ class TestEnsureConfigDir:
             # Should not raise
             ensure_config_dir()
 
+    def test_creates_directory_once(self, tmp_path):
+        """Should not call makedirs again for a directory it created."""
+        config_dir = str(tmp_path / "once_dir")
+
+        with patch('somafm_tui.config.CONFIG_DIR', config_dir), \
+             patch('os.makedirs') as mock_makedirs:
+            ensure_config_dir()
+            ensure_config_dir()
+
+        mock_makedirs.assert_called_once_with(config_dir, exist_ok=True)
+
 
 class TestValidateConfig:
     """Tests for validate_config function."""
@@ -256,6 +267,31 @@ class TestLoadAndSaveConfig:
             assert config["volume"] == 50
             assert config["dbus_allowed"] is True
 
+    def test_load_percent_value_falls_back_to_defaults(self, tmp_path):
+        """Should not crash on values configparser cannot interpolate."""
+        config_file = tmp_path / "somafm.cfg"
+        config_file.write_text("[somafm]\nvolume = 80%\n")
+
+        with patch('somafm_tui.config.CONFIG_DIR', str(tmp_path)), \
+             patch('somafm_tui.config.CONFIG_FILE', str(config_file)):
+            config = load_config()
+
+        assert config == get_default_config()
+
+    def test_load_does_not_overwrite_unreadable_config(self, tmp_path):
+        """Should keep an existing config file that cannot be read."""
+        config_file = tmp_path / "somafm.cfg"
+        config_file.write_text("[somafm]\nvolume = 20\n")
+
+        with patch('somafm_tui.config.CONFIG_DIR', str(tmp_path)), \
+             patch('somafm_tui.config.CONFIG_FILE', str(config_file)), \
+             patch('configparser.ConfigParser.read', return_value=[]), \
+             patch('somafm_tui.config.save_config') as mock_save:
+            config = load_config()
+
+        assert config == get_default_config()
+        mock_save.assert_not_called()
+
     def test_save_writes_config_file(self, tmp_path):
         """Should write configuration to file."""
         config_dir = tmp_path / ".somafm_tui"
@@ -271,3 +307,4 @@ class TestLoadAndSaveConfig:
                 content = config_file.read_text()
                 assert "volume" in content
                 assert "60" in content
+                assert sorted(os.listdir(config_dir)) == ["somafm.cfg"]
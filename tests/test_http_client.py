@@ -16,6 +16,7 @@ from somafm_tui.http_client import (
     DEFAULT_TIMEOUT,
     DEFAULT_RETRIES,
     DEFAULT_BACKOFF_FACTOR,
+    NOT_MODIFIED,
 )
 
 
@@ -136,7 +137,7 @@ class TestHttpClientFetchJson:
         """Should fetch JSON successfully."""
         client = HttpClient()
         mock_response = Mock()
-        mock_response.json.return_value = {"key": "value"}
+        mock_response.content = b'{"key": "value"}'
         mock_response.raise_for_status = Mock()
 
         with patch.object(client, 'get_session') as mock_get_session:
@@ -163,7 +164,7 @@ class TestHttpClientFetchJson:
         """Should use provided timeout."""
         client = HttpClient()
         mock_response = Mock()
-        mock_response.json.return_value = {"key": "value"}
+        mock_response.content = b'{"key": "value"}'
         mock_response.raise_for_status = Mock()
 
         with patch.object(client, 'get_session') as mock_get_session:
@@ -179,7 +180,7 @@ class TestHttpClientFetchJson:
         """Should use default timeout when not provided."""
         client = HttpClient(timeout=25)
         mock_response = Mock()
-        mock_response.json.return_value = {"key": "value"}
+        mock_response.content = b'{"key": "value"}'
         mock_response.raise_for_status = Mock()
 
         with patch.object(client, 'get_session') as mock_get_session:
@@ -190,6 +191,33 @@ class TestHttpClientFetchJson:
             call_kwargs = mock_get_session.return_value.get.call_args[1]
             assert call_kwargs['timeout'] == 25
 
+    def test_fetch_json_conditional_not_modified(self):
+        """Should send If-Modified-Since and report a 304 as NOT_MODIFIED."""
+        client = HttpClient()
+        mock_response = Mock(status_code=304)
+
+        with patch.object(client, 'get_session') as mock_get_session:
+            mock_get_session.return_value.get.return_value = mock_response
+
+            result = client.fetch_json("https://example.com/api", if_modified_since=0)
+
+            assert result is NOT_MODIFIED
+            headers = mock_get_session.return_value.get.call_args[1]['headers']
+            assert headers == {"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"}
+
+    def test_fetch_json_retries_on_invalid_json(self):
+        """Should treat an unparsable body like a failed request."""
+        client = HttpClient(retries=2, backoff_factor=0.01)
+        bad_response = Mock(content=b"<html>")
+        good_response = Mock(content=b'{"key": "value"}')
+
+        with patch.object(client, 'get_session') as mock_get_session:
+            mock_get_session.return_value.get.side_effect = [bad_response, good_response]
+
+            result = client.fetch_json("https://example.com/api")
+
+            assert result == {"key": "value"}
+
 
 class TestHttpClientFetchBytes:
     """Tests for HttpClient fetch_bytes method."""
@@ -229,7 +257,7 @@ class TestHttpClientRetry:
         import requests
         client = HttpClient(retries=3, backoff_factor=0.01)
         mock_response = Mock()
-        mock_response.json.return_value = {"key": "value"}
+        mock_response.content = b'{"key": "value"}'
         mock_response.raise_for_status = Mock()
 
         with patch.object(client, 'get_session') as mock_get_session:
@@ -262,7 +290,7 @@ class TestHttpClientRetry:
         import requests
         client = HttpClient(retries=2, backoff_factor=0.01)
         mock_response = Mock()
-        mock_response.json.return_value = {"key": "value"}
+        mock_response.content = b'{"key": "value"}'
         mock_response.raise_for_status = Mock()
 
         with patch.object(client, 'get_session') as mock_get_session:
@@ -390,7 +418,7 @@ class TestConvenienceFunctions:
         """Should use singleton client."""
         HttpClient.reset_instance()
         mock_response = Mock()
-        mock_response.json.return_value = {"key": "value"}
+        mock_response.content = b'{"key": "value"}'
         mock_response.raise_for_status = Mock()
 
         with patch.object(HttpClient, 'get_instance') as mock_get_instance:
@@ -83,6 +83,14 @@ class TestHandleInput:
 
             mock_normal.assert_called_once_with("j")
 
+    def test_handle_input_reports_bound_keys(self):
+        """Should return True for bound keys and False for unbound ones."""
+        handler = self._create_handler()
+
+        assert handler.handle_input("j") is True
+        assert handler.handle_input("%") is False
+        assert handler.handle_input(curses.KEY_F12) is False
+
     def _create_handler(self):
         """Helper to create InputHandler."""
         playback = Mock(spec=PlaybackController)
@@ -273,13 +281,14 @@ class TestHandleSearchInput:
         handler.state.is_searching = True
         selected_channel = Mock()
         handler.state.get_selected_channel.return_value = selected_channel
-        handler.state.get_all_channels.return_value = [selected_channel]
+        handler.state.get_channel_index.return_value = 3
         selected_channel.id = "test"
         handler.state.current_index = 0
 
         handler._handle_search_input(curses.KEY_ENTER)
 
-        handler.playback.play_channel.assert_called()
+        handler.state.get_channel_index.assert_called_once_with("test")
+        handler.playback.play_channel.assert_called_once_with(selected_channel, 3)
 
     def test_search_input_l_plays_channel(self):
         """Should play selected channel on 'l'.
@@ -0,0 +1,179 @@
+"""Tests for json_utils module."""
+
+import os
+
+import pytest
+from unittest.mock import patch
+
+from somafm_tui import json_utils
+from somafm_tui.json_utils import (
+    JSONDecodeError,
+    loads,
+    dumps,
+    ensure_parent_dir,
+    read_json,
+    write_json,
+    write_json_atomic,
+    BackgroundJsonWriter,
+)
+
+
+class TestLoadsDumps:
+    """Tests for loads/dumps functions."""
+
+    def test_roundtrip(self):
+        """Should preserve data through dumps/loads."""
+        data = {"ch1": 100, "ch2": [1, 2, 3], "name": "Groove Salad"}
+
+        assert loads(dumps(data)) == data
+
+    def test_dumps_returns_bytes(self):
+        """Should always return encoded bytes."""
+        assert isinstance(dumps({"a": 1}), bytes)
+
+    def test_dumps_indent(self):
+        """Should pretty-print when indent is requested."""
+        assert b"\n" in dumps({"a": 1}, indent=True)
+        assert b"\n" not in dumps({"a": 1})
+
+    def test_loads_accepts_str(self):
+        """Should parse str input as well as bytes."""
+        assert loads('["a"]') == ["a"]
+
+    def test_loads_invalid_raises_json_error(self):
+        """Should raise JSONDecodeError on invalid input."""
+        with pytest.raises(JSONDecodeError):
+            loads(b"invalid")
+
+    def test_stdlib_fallback(self):
+        """Should work without orjson installed."""
+        with patch.object(json_utils, "orjson", None):
+            assert loads(dumps({"a": [1, 2]})) == {"a": [1, 2]}
+            assert b"\n" in dumps({"a": 1}, indent=True)
+            with pytest.raises(JSONDecodeError):
+                loads("invalid")
+
+
+class TestReadWriteJson:
+    """Tests for read_json/write_json functions."""
+
+    def test_write_then_read(self, tmp_path):
+        """Should write a file that reads back identically."""
+        path = str(tmp_path / "data.json")
+
+        write_json(path, {"favorites": ["ch1"]})
+
+        assert read_json(path) == {"favorites": ["ch1"]}
+
+    def test_read_missing_file_raises(self, tmp_path):
+        """Should raise OSError for missing files."""
+        with pytest.raises(OSError):
+            read_json(str(tmp_path / "missing.json"))
+
+    def test_write_json_atomic_replaces_file(self, tmp_path):
+        """Should replace existing content and remove the temp file."""
+        path = tmp_path / "data.json"
+        path.write_text("old")
+
+        write_json_atomic(str(path), {"a": 1})
+
+        assert read_json(str(path)) == {"a": 1}
+        assert os.listdir(tmp_path) == ["data.json"]
+
+    def test_ensure_parent_dir_creates_once(self, tmp_path):
+        """Should only call makedirs the first time for a directory."""
+        path = str(tmp_path / "state" / "favorites.json")
+
+        with patch('os.makedirs') as mock_makedirs:
+            ensure_parent_dir(path)
+            ensure_parent_dir(path)
+
+        mock_makedirs.assert_called_once_with(str(tmp_path / "state"), exist_ok=True)
+
+
+class TestBackgroundJsonWriter:
+    """Tests for BackgroundJsonWriter class."""
+
+    def test_submit_writes_file(self, tmp_path):
+        """Should write submitted data in the background."""
+        path = str(tmp_path / "sub" / "usage.json")
+        writer = BackgroundJsonWriter()
+
+        writer.submit(path, {"ch1": 100})
+        writer.flush()
+
+        assert read_json(path) == {"ch1": 100}
+        writer.close()
+
+    def test_close_drains_queue(self, tmp_path):
+        """Should write everything queued before stopping."""
+        path = str(tmp_path / "usage.json")
+        writer = BackgroundJsonWriter()
+
+        for i in range(5):
+            writer.submit(path, {"ch1": i})
+        writer.close()
+
+        assert read_json(path) == {"ch1": 4}
+
+    def test_coalesces_writes_to_same_path(self, tmp_path):
+        """Should only write the newest snapshot queued while busy."""
+        import threading
+
+        path = str(tmp_path / "usage.json")
+        writer = BackgroundJsonWriter()
+        started = threading.Event()
+        release = threading.Event()
+        written = []
+
+        def slow_write(target, obj, indent=False):
+            written.append(obj)
+            started.set()
+            release.wait(5)
+
+        with patch('somafm_tui.json_utils.write_json_atomic', side_effect=slow_write):
+            writer.submit(path, {"n": 0})
+            started.wait(5)
+            for i in range(1, 5):
+                writer.submit(path, {"n": i})
+            release.set()
+            writer.close()
+
+        assert written == [{"n": 0}, {"n": 4}]
+
+    def test_skips_snapshot_equal_to_last_written(self, tmp_path):
+        """Should not rewrite a file with the data it already holds."""
+        path = str(tmp_path / "usage.json")
+        writer = BackgroundJsonWriter()
+
+        with patch('somafm_tui.json_utils.write_json_atomic') as mock_write:
+            writer.submit(path, {"ch1": 1})
+            writer.flush()
+            writer.submit(path, {"ch1": 1})
+            writer.flush()
+            writer.submit(path, {"ch1": 2})
+            writer.close()
+
+        assert [c.args[1] for c in mock_write.call_args_list] == [{"ch1": 1}, {"ch1": 2}]
+
+    def test_close_without_submit(self):
+        """Should not start a thread when nothing was written."""
+        writer = BackgroundJsonWriter()
+
+        writer.close()
+
+        assert writer._thread is None
+
+    def test_write_error_is_logged(self, tmp_path):
+        """Should keep running after a failed write."""
+        path = str(tmp_path / "usage.json")
+        writer = BackgroundJsonWriter()
+
+        with patch('somafm_tui.json_utils.write_json', side_effect=[OSError("disk full"), None]), \
+             patch('logging.error') as mock_error:
+            writer.submit(path, {})
+            writer.submit(path, {})
+            writer.flush()
+
+        mock_error.assert_called_once()
+        writer.close()
@@ -2,8 +2,12 @@
 
 import pytest
 from datetime import datetime
+from unittest.mock import patch
 
+from somafm_tui import models
 from somafm_tui.models import (
+    clock_hms,
+    parse_icy_title,
     TrackMetadata,
     Channel,
     TrackHistoryEntry,
@@ -11,6 +15,52 @@ from somafm_tui.models import (
 )
 
 
+class TestClockHms:
+    """Tests for clock_hms function."""
+
+    def test_format(self):
+        """Should return HH:MM:SS."""
+        result = clock_hms()
+
+        assert len(result) == 8
+        assert result[2] == ":" and result[5] == ":"
+
+    def test_reuses_value_within_second(self):
+        """Should format only once per second."""
+        with patch.object(models, '_hms_cache', [-1, ""]), \
+             patch('somafm_tui.models.time.time', return_value=1000.2), \
+             patch('somafm_tui.models.time.strftime', return_value="12:00:00") as mock_strftime:
+
+            clock_hms()
+            assert clock_hms() == "12:00:00"
+
+            mock_strftime.assert_called_once()
+
+
+class TestParseIcyTitle:
+    """Tests for parse_icy_title function."""
+
+    def test_hyphen_separator(self):
+        """Should split on the first hyphen separator."""
+        assert parse_icy_title("Artist - Title - Remix") == ("Artist", "Title - Remix")
+
+    def test_en_dash_separator(self):
+        """Should accept an en dash separator."""
+        assert parse_icy_title("Artist – Title") == ("Artist", "Title")
+
+    def test_hyphen_takes_precedence(self):
+        """Should prefer the hyphen when both separators appear."""
+        assert parse_icy_title("A – B - C") == ("A – B", "C")
+
+    def test_strips_whitespace(self):
+        """Should strip surrounding whitespace."""
+        assert parse_icy_title("  Artist  -  Title ") == ("Artist", "Title")
+
+    def test_no_separator(self):
+        """Should return None without a separator."""
+        assert parse_icy_title("Station ID") is None
+
+
 class TestTrackMetadata:
     """Tests for TrackMetadata dataclass."""
 
@@ -97,6 +147,25 @@ class TestTrackMetadata:
         assert restored.duration == original.duration
         assert restored.timestamp == original.timestamp
 
+    def test_is_same_track_ignores_timestamp(self):
+        """Should compare only artist and title."""
+        a = TrackMetadata(artist="Artist", title="Title", timestamp="12:00:00")
+        b = TrackMetadata(artist="Artist", title="Title", timestamp="12:00:01")
+
+        assert a.is_same_track(b)
+        assert not a.is_same_track(TrackMetadata(artist="Artist", title="Other"))
+
+    def test_immutable(self):
+        """Should reject mutation and derive copies instead."""
+        metadata = TrackMetadata(artist="Artist", title="Title")
+
+        with pytest.raises(AttributeError):
+            metadata.artist = "Other"
+
+        tagged = metadata.with_channel("Groove Salad")
+        assert tagged.channel_name == "Groove Salad"
+        assert metadata.channel_name is None
+
 
 class TestChannel:
     """Tests for Channel dataclass."""
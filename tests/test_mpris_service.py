@@ -5,15 +5,16 @@ from unittest.mock import Mock, patch, AsyncMock
 
 from somafm_tui.mpris_service import (
     MPRISService,
+    MediaPlayer2PlayerInterface,
     DBUS_NAME,
     DBUS_TITLE,
 )
 from somafm_tui.models import Channel, TrackMetadata
 
 
-# Note: MediaPlayer2Interface and MediaPlayer2PlayerInterface tests are skipped
-# because dbus_next properties require a real D-Bus connection to test properly.
-# These interfaces are tested indirectly through MPRISService tests.
+# Note: MediaPlayer2Interface and MediaPlayer2PlayerInterface properties are
+# not tested because dbus_next properties require a real D-Bus connection to
+# test properly. Plain methods are called on an interface created with __new__.
 
 
 class TestMPRISService:
@@ -131,3 +132,59 @@ class TestMPRISService:
             loop.run_until_complete(mock_stop())
         finally:
             loop.close()
+
+
+class TestPlayerInterfaceNavigation:
+    """Tests for MPRIS Next/Previous."""
+
+    def _make_player(self):
+        import queue
+        import threading
+        from somafm_tui.core import StateManager
+        from somafm_tui.player import SomaFMPlayer
+
+        channels = [Channel(id=f"ch{i}", title=f"Channel {i}") for i in range(3)]
+        player = SomaFMPlayer.__new__(SomaFMPlayer)
+        player._event_queue = queue.Queue()
+        player._data_lock = threading.Lock()
+        player._last_icy_title = None
+        player.channels = channels
+        player.state = StateManager(
+            config={}, channels=channels,
+            cache_dir="/tmp/cache", config_file="/tmp/config.cfg",
+        )
+        player.playback = Mock()
+        player.playback.current_channel = None
+        return player
+
+    def _make_interface(self, player):
+        interface = MediaPlayer2PlayerInterface.__new__(MediaPlayer2PlayerInterface)
+        interface.player = player
+        return interface
+
+    def test_next_and_previous_play_through_main_loop(self):
+        """Should queue steps that the main loop applies once."""
+        player = self._make_player()
+        interface = self._make_interface(player)
+
+        interface.Next()
+        interface.Next()
+        interface.Previous()
+        player.playback.play_channel.assert_not_called()
+
+        assert player._drain_events() is True
+
+        assert player.state.current_index == 1
+        player.playback.play_channel.assert_called_once_with(player.channels[1], 1)
+
+    def test_previous_at_first_channel_keeps_playing_channel(self):
+        """Should not restart the stream when the selection cannot move."""
+        player = self._make_player()
+        player.playback.current_channel = player.channels[0]
+        interface = self._make_interface(player)
+
+        interface.Previous()
+        player._drain_events()
+
+        assert player.state.current_index == 0
+        player.playback.play_channel.assert_not_called()
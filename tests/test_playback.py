@@ -161,6 +161,68 @@ class TestPlayChannel:
             mock_clean.assert_called_once()
             mock_save.assert_called_once()
 
+    def test_play_channel_keeps_usage_in_memory(self):
+        """Should load usage once and hand later saves to the writer."""
+        player_instance = Mock()
+        channel = Channel(id="test", title="Test", stream_url="https://test.com/stream.pls")
+        player_instance.channels = [channel]
+        writer = Mock()
+
+        controller = PlaybackController(
+            player_instance=player_instance,
+            mpv_player=Mock(),
+            ui_screen=Mock(),
+            state_manager=Mock(),
+            config={},
+            cache_dir="/tmp/cache",
+            channel_usage_file="/tmp/usage.json",
+            channel_favorites_file="/tmp/favorites.json",
+            track_favorites_file="/tmp/tracks.json",
+            json_writer=writer,
+        )
+
+        with patch('somafm_tui.core.playback.load_channel_usage', return_value={"gone": 1}) as mock_load, \
+             patch('somafm_tui.core.playback.save_channel_usage') as mock_save:
+            controller.play_channel(channel, 0)
+            controller.play_channel(channel, 0)
+
+            mock_load.assert_called_once()
+            mock_save.assert_not_called()
+
+        assert writer.submit.call_count == 2
+        path, usage = writer.submit.call_args.args
+        assert path == "/tmp/usage.json"
+        assert set(usage) == {"test"}
+
+    def test_play_channel_uses_startup_usage(self):
+        """Should not read the usage file when usage was handed over."""
+        player_instance = Mock()
+        channel = Channel(id="test", title="Test", stream_url="https://test.com/stream.pls")
+        player_instance.channels = [channel]
+        writer = Mock()
+
+        controller = PlaybackController(
+            player_instance=player_instance,
+            mpv_player=Mock(),
+            ui_screen=Mock(),
+            state_manager=Mock(),
+            config={},
+            cache_dir="/tmp/cache",
+            channel_usage_file="/tmp/usage.json",
+            channel_favorites_file="/tmp/favorites.json",
+            track_favorites_file="/tmp/tracks.json",
+            json_writer=writer,
+            channel_usage={"other": 1},
+        )
+
+        with patch('somafm_tui.core.playback.load_channel_usage') as mock_load:
+            controller.play_channel(channel, 0)
+
+            mock_load.assert_not_called()
+
+        _, usage = writer.submit.call_args.args
+        assert set(usage) == {"other", "test"}
+
     def test_play_channel_no_stream_url(self):
         """Should handle missing stream URL."""
         player_instance = Mock()
@@ -687,7 +749,8 @@ class TestToggleFavorite:
 
             assert success is True
             assert "Added" in message
-            mock_toggle.assert_called_once_with("test", controller.channel_favorites_file)
+            mock_toggle.assert_called_once()
+            assert mock_toggle.call_args.args == ("test", controller.channel_favorites_file)
             callback.assert_called_once()
 
     def test_toggle_channel_favorite_success_remove(self):
@@ -705,6 +768,25 @@ class TestToggleFavorite:
             assert success is True
             assert "Removed" in message
 
+    def test_toggle_channel_favorite_uses_writer(self):
+        """Should toggle the cached favorites and save in the background."""
+        controller = self._create_controller()
+        controller.json_writer = Mock()
+        controller.player_instance.channels = [Channel(id="test", title="Test")]
+        controller.state_manager.current_index = 0
+        cached = {"other"}
+        controller.state_manager.get_channel_favorites.return_value = cached
+
+        with patch('somafm_tui.channels.load_favorites') as mock_load:
+            success, message = controller.toggle_channel_favorite()
+
+            mock_load.assert_not_called()
+        assert success is True
+        assert cached == {"other"}
+        path, saved = controller.json_writer.submit.call_args.args
+        assert path == controller.channel_favorites_file
+        assert set(saved) == {"other", "test"}
+
     def test_toggle_channel_favorite_index_out_of_range(self):
         """Should handle index out of range."""
         controller = self._create_controller()
@@ -754,6 +836,24 @@ class TestToggleFavorite:
             assert "Added" in message
             mock_add.assert_called_once()
 
+    def test_toggle_favorite_track_reads_file_once(self):
+        """Should keep favorite tracks in memory after the first add."""
+        controller = self._create_controller()
+        controller.is_playing = True
+        controller.current_channel = Channel(id="test", title="Test Channel")
+
+        with patch('somafm_tui.channels.load_favorite_tracks', return_value=[]) as mock_load, \
+             patch('somafm_tui.channels.save_favorite_tracks') as mock_save:
+            controller.current_metadata = TrackMetadata(artist="A", title="One")
+            controller.toggle_favorite_track()
+            controller.current_metadata = TrackMetadata(artist="B", title="Two")
+            controller.toggle_favorite_track()
+
+            mock_load.assert_called_once()
+            assert mock_save.call_count == 2
+        saved = mock_save.call_args.args[1]
+        assert [track.title for track in saved] == ["Two", "One"]
+
     def _create_controller(self):
         """Helper to create controller."""
         return PlaybackController(
@@ -1,12 +1,15 @@
 """Tests for player module (SomaFMPlayer)."""
 
+import curses
 import pytest
 from unittest.mock import Mock, patch, call
 import signal
+import sys
 
 from somafm_tui.player import (
     ensure_directories,
     setup_logging,
+    prepare_app_environment,
     _create_signal_handler,
 )
 
@@ -35,6 +38,38 @@ class TestSetupLogging:
             mock_config.assert_called_once()
 
 
+class TestPrepareAppEnvironment:
+    """Tests for prepare_app_environment function."""
+
+    def test_runs_once(self):
+        """Should create directories and configure logging only once."""
+        with patch('somafm_tui.player._app_environment_ready', False), \
+             patch('somafm_tui.player.ensure_directories') as mock_dirs, \
+             patch('somafm_tui.player.setup_logging') as mock_logging:
+
+            prepare_app_environment()
+            prepare_app_environment()
+
+            mock_dirs.assert_called_once()
+            mock_logging.assert_called_once()
+
+
+class TestLazyImports:
+    """Tests for deferred imports of heavy dependencies."""
+
+    def test_mpv_imported_on_first_use(self):
+        """Should import mpv only when the player is created."""
+        from somafm_tui.player import SomaFMPlayer
+
+        fake_mpv = Mock()
+        instance = Mock()
+        with patch.dict('sys.modules', {'mpv': fake_mpv}):
+            SomaFMPlayer._init_mpv(instance)
+
+        fake_mpv.MPV.assert_called_once()
+        assert instance.player is fake_mpv.MPV.return_value
+
+
 class TestCreateSignalHandler:
     """Tests for _create_signal_handler function."""
 
@@ -71,6 +106,169 @@ class TestCreateSignalHandler:
         handler(signal.SIGTERM, None)
 
 
-# Note: SomaFMPlayer and main() tests are skipped because they require
-# extensive mocking of curses, mpv, and other system dependencies.
-# These are tested indirectly through integration tests.
+class TestMain:
+    """Tests for the main() entry point."""
+
+    def test_runs_without_dbus_next(self, capsys):
+        """Should not import dbus_next when it is missing or disabled."""
+        from somafm_tui import player
+
+        modules = {"dbus_next": None}
+        with patch.dict('sys.modules', modules), \
+             patch('sys.argv', ['somafm-tui', '--list-themes', '--no-dbus']), \
+             patch('builtins.input', return_value=""):
+            sys.modules.pop("somafm_tui.mpris_service", None)
+            with pytest.raises(SystemExit) as exc_info:
+                player.main()
+            assert "somafm_tui.mpris_service" not in sys.modules
+
+        assert exc_info.value.code == 0
+        assert "Optional dependencies are missing" in capsys.readouterr().out
+
+
+# Note: a fully initialized SomaFMPlayer and main() are not tested here
+# because they require extensive mocking of curses, mpv, and other system
+# dependencies; they are tested indirectly through integration tests. The
+# classes below build a bare player with __new__ to test single methods.
+
+
+class TestEventQueue:
+    """Tests for events posted from background threads."""
+
+    def _make_player(self):
+        import queue
+        from somafm_tui.player import SomaFMPlayer
+
+        player = SomaFMPlayer.__new__(SomaFMPlayer)
+        player._event_queue = queue.Queue()
+        player._last_icy_title = None
+        player._last_icy_metadata = None
+        player.playback = Mock()
+        player.playback.current_channel = None
+        return player
+
+    def test_drain_applies_latest_title_only(self):
+        """Should coalesce queued titles into a single update."""
+        player = self._make_player()
+        player._event_queue.put(("meta", "Artist A - Song A"))
+        player._event_queue.put(("meta", "Artist B - Song B"))
+
+        assert player._drain_events() is True
+
+        player.playback.update_metadata.assert_called_once()
+        metadata = player.playback.update_metadata.call_args[0][0]
+        assert (metadata.artist, metadata.title) == ("Artist B", "Song B")
+        assert player._event_queue.empty()
+
+    def test_drain_empty_queue(self):
+        """Should report no change when nothing was queued."""
+        player = self._make_player()
+
+        assert player._drain_events() is False
+        player.playback.update_metadata.assert_not_called()
+
+    def test_drain_applies_refreshed_channels(self):
+        """Should keep the channel order and the selected channel."""
+        import threading
+        from somafm_tui.core import StateManager
+        from somafm_tui.models import Channel
+
+        player = self._make_player()
+        player._data_lock = threading.Lock()
+        player.channels = [Channel(id="b", title="B"), Channel(id="a", title="A")]
+        player.state = StateManager(
+            config={}, channels=player.channels,
+            cache_dir="/tmp/cache", config_file="/tmp/config.cfg",
+        )
+        player.state.current_index = 1
+        refreshed = [Channel(id=i, title=i.upper()) for i in ("c", "a", "b")]
+        player._event_queue.put(("channels", refreshed))
+
+        assert player._drain_events() is True
+
+        assert [ch.id for ch in player.channels] == ["b", "a", "c"]
+        assert player.state.channels is player.channels
+        assert player.state.get_selected_channel().id == "a"
+        assert player.channels[1] is refreshed[1]
+
+
+class TestInitColors:
+    """Tests for skipping redundant color initialization."""
+
+    def _make_player(self):
+        from somafm_tui.player import SomaFMPlayer
+
+        player = SomaFMPlayer.__new__(SomaFMPlayer)
+        player._applied_theme_key = None
+        player.config = {"theme": "default"}
+        player.stdscr = Mock()
+        player.ui_screen = Mock()
+        return player
+
+    def test_skips_unchanged_theme(self):
+        """Should only program colors again when the theme changes."""
+        player = self._make_player()
+        raw_themes = {"default": {}, "ocean": {}}
+
+        with patch('somafm_tui.player.curses') as mock_curses, \
+             patch('somafm_tui.player.load_themes_raw', return_value=raw_themes), \
+             patch('somafm_tui.player.apply_theme') as mock_apply:
+            player.init_colors()
+            player.init_colors()
+            player.config["theme"] = "ocean"
+            player.init_colors()
+
+        assert [c.args[0] for c in mock_apply.call_args_list] == ["default", "ocean"]
+        assert mock_curses.start_color.call_count == 2
+
+    def test_reapplies_after_themes_file_change(self):
+        """Should apply the theme again once themes.json was reloaded."""
+        player = self._make_player()
+
+        with patch('somafm_tui.player.curses'), \
+             patch('somafm_tui.player.load_themes_raw', side_effect=[{}, {}]), \
+             patch('somafm_tui.player.apply_theme') as mock_apply:
+            player.init_colors()
+            player.init_colors()
+
+        assert mock_apply.call_count == 2
+
+
+class TestHandleKeys:
+    """Tests for batching queued key presses."""
+
+    def _make_player(self):
+        from somafm_tui.player import SomaFMPlayer
+
+        player = SomaFMPlayer.__new__(SomaFMPlayer)
+        player._dirty = False
+        player.ui_screen = Mock()
+        player.input_handler = Mock()
+        player.input_handler.handle_input.return_value = True
+        player.state = Mock()
+        player.state.is_running.return_value = True
+        return player
+
+    def test_drains_queued_keys(self):
+        """Should handle all pending keys before returning."""
+        player = self._make_player()
+        stdscr = Mock()
+        stdscr.get_wch.side_effect = ["j", "j", curses.error()]
+
+        player._handle_keys(stdscr, "j")
+
+        assert player.input_handler.handle_input.call_count == 3
+        assert player._dirty is True
+        stdscr.nodelay.assert_called_once_with(True)
+        stdscr.timeout.assert_called_once()
+
+    def test_stops_after_quit(self):
+        """Should not read further keys once the app is stopping."""
+        player = self._make_player()
+        player.state.is_running.return_value = False
+        stdscr = Mock()
+
+        player._handle_keys(stdscr, "q")
+
+        player.input_handler.handle_input.assert_called_once_with("q")
+        stdscr.get_wch.assert_not_called()
@@ -106,12 +106,28 @@ class TestGetChannelsToDisplay:
         manager.is_searching = True
         manager.search_query = "Channel 1"
 
-        with patch('somafm_tui.core.state.filter_channels_by_query') as mock_filter:
-            mock_filter.return_value = [channels[0]]
-            result = manager.get_channels_to_display()
+        result = manager.get_channels_to_display()
+
+        assert result == [channels[0]]
+
+    def test_search_index_rebuilt_when_channels_replaced(self):
+        """Should reuse the search index until the channel list changes."""
+        manager = StateManager(
+            config={},
+            channels=[Channel(id="ch1", title="Groove Salad")],
+            cache_dir="/tmp/cache",
+            config_file="/tmp/config.cfg",
+        )
+        manager.is_searching = True
+        manager.search_query = "drone"
 
-            mock_filter.assert_called_once_with(channels, "Channel 1")
-            assert result == [channels[0]]
+        assert manager.get_channels_to_display() == []
+        index = manager._search_index
+        manager.get_channels_to_display()
+        assert manager._search_index is index
+
+        manager.channels = [Channel(id="ch2", title="Drone Zone")]
+        assert [ch.id for ch in manager.get_channels_to_display()] == ["ch2"]
 
     def test_returns_all_channels_when_searching_with_empty_query(self):
         """Should return all channels when searching with empty query."""
@@ -129,6 +145,25 @@ class TestGetChannelsToDisplay:
 
         assert result == channels
 
+    def test_favorites_view_reused_until_favorites_change(self):
+        """Should return the same favorites-only list until the inputs change."""
+        channels = [Channel(id="ch1", title="Channel 1"), Channel(id="ch2", title="Channel 2")]
+        manager = StateManager(
+            config={},
+            channels=channels,
+            cache_dir="/tmp/cache",
+            config_file="/tmp/config.cfg",
+        )
+        manager.show_only_favorites = True
+        manager.set_channel_favorites(manager._favorites_file, {"ch2"})
+
+        first = manager.get_channels_to_display()
+        assert first == [channels[1]]
+        assert manager.get_channels_to_display() is first
+
+        manager.set_channel_favorites(manager._favorites_file, {"ch1", "ch2"})
+        assert manager.get_channels_to_display() == channels
+
 
 class TestNavigation:
     """Tests for navigation methods."""
@@ -310,6 +345,24 @@ class TestScrollOffset:
 
         assert manager.current_index < len(channels)
 
+    def test_update_scroll_offset_uses_given_channels(self):
+        """Should not filter channels again when the caller passes them."""
+        channels = [Channel(id=f"ch{i}", title=f"Channel {i}") for i in range(20)]
+        manager = StateManager(
+            config={},
+            channels=channels,
+            cache_dir="/tmp/cache",
+            config_file="/tmp/config.cfg",
+        )
+        manager.current_index = 30
+
+        with patch.object(manager, 'get_channels_to_display') as mock_get:
+            manager.update_scroll_offset(panel_height=12, channels=channels)
+
+            mock_get.assert_not_called()
+        assert manager.current_index == 19
+        assert manager.scroll_offset == 11
+
 
 class TestSearch:
     """Tests for search functionality."""
@@ -686,6 +739,46 @@ class TestTheme:
 
         callback.assert_called_once()
 
+    def test_cycle_theme_debounces_config_save(self):
+        """Should write the config once after a burst of theme changes."""
+        manager = self._create_manager()
+
+        with patch('somafm_tui.core.state.save_config') as mock_save, \
+             patch('somafm_tui.core.state.time.monotonic', return_value=100.0):
+            manager.cycle_theme()
+            manager.cycle_theme()
+            manager.flush_config()
+
+            mock_save.assert_not_called()
+
+        with patch('somafm_tui.core.state.save_config') as mock_save, \
+             patch('somafm_tui.core.state.time.monotonic', return_value=101.0):
+            manager.flush_config()
+            manager.flush_config()
+
+            mock_save.assert_called_once_with(manager.config)
+
+    def test_flush_config_skips_unchanged(self):
+        """Should not write when pending changes cancelled out."""
+        manager = self._create_manager()
+        manager.cycle_theme()
+        manager.cycle_theme_reverse()
+
+        with patch('somafm_tui.core.state.save_config') as mock_save:
+            manager.flush_config(force=True)
+
+            mock_save.assert_not_called()
+
+    def test_flush_config_force(self):
+        """Should write pending changes immediately when forced."""
+        manager = self._create_manager()
+        manager.cycle_theme()
+
+        with patch('somafm_tui.core.state.save_config') as mock_save:
+            manager.flush_config(force=True)
+
+            mock_save.assert_called_once_with(manager.config)
+
     def test_get_theme_info(self):
         """Should return theme information."""
         manager = self._create_manager()
@@ -705,6 +798,15 @@ class TestTheme:
 
         assert name == "monochrome"
 
+    def test_cycle_theme_reverse_wraps(self):
+        """Should step backwards and wrap around to the last theme."""
+        manager = self._create_manager()
+
+        with patch('somafm_tui.core.state.get_theme_names', return_value=["a", "b", "c"]):
+            manager._current_theme = "a"
+            assert manager.cycle_theme_reverse() == "c"
+            assert manager.cycle_theme() == "a"
+
     def test_cycle_theme_handles_invalid_current(self):
         """Should handle invalid current theme."""
         manager = self._create_manager()
@@ -739,6 +841,20 @@ class TestChannelManagement:
             mock_load.assert_called_once_with("/tmp/favorites.json")
             assert favorites == {"ch1", "ch2"}
 
+    def test_get_channel_favorites_cached(self):
+        """Should read favorites once and serve updates from memory."""
+        manager = self._create_manager()
+
+        with patch('somafm_tui.core.state.load_favorites') as mock_load:
+            mock_load.return_value = {"ch1"}
+
+            manager.get_channel_favorites("/tmp/favorites.json")
+            manager.set_channel_favorites("/tmp/favorites.json", {"ch1", "ch2"})
+            favorites = manager.get_channel_favorites("/tmp/favorites.json")
+
+            mock_load.assert_called_once()
+            assert favorites == {"ch1", "ch2"}
+
     def test_get_selected_channel(self):
         """Should return currently selected channel."""
         channels = [
@@ -802,6 +918,21 @@ class TestChannelManagement:
 
         assert result == channels
 
+    def test_get_channel_index(self):
+        """Should map channel IDs to positions, following list replacement."""
+        manager = StateManager(
+            config={},
+            channels=[Channel(id="ch1", title="Channel 1"), Channel(id="ch2", title="Channel 2")],
+            cache_dir="/tmp/cache",
+            config_file="/tmp/config.cfg",
+        )
+
+        assert manager.get_channel_index("ch2") == 1
+        assert manager.get_channel_index("missing") is None
+
+        manager.channels = [Channel(id="ch2", title="Channel 2")]
+        assert manager.get_channel_index("ch2") == 0
+
     def test_reload_channels(self):
         """Should reload and sort channels by usage."""
         channels = [
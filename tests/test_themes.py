@@ -11,6 +11,7 @@ from somafm_tui.themes import (
     get_color_themes,
     init_custom_colors,
     apply_theme,
+    reset_theme_cache,
     THEMES_FILE,
 )
 
@@ -59,12 +60,25 @@ class TestLoadThemesRaw:
 
     def test_returns_fallback_on_error(self):
         """Should return default theme on file read error."""
+        reset_theme_cache()
         with patch('somafm_tui.themes.open', side_effect=IOError("File not found")):
             themes = load_themes_raw()
             
             assert "default" in themes
             assert themes["default"]["name"] == "Default Dark"
 
+    def test_cached_until_file_changes(self):
+        """Should parse the file again only when its mtime changes."""
+        reset_theme_cache()
+        first = load_themes_raw()
+
+        with patch('somafm_tui.themes.open') as mock_open_file:
+            assert load_themes_raw() is first
+            mock_open_file.assert_not_called()
+
+        with patch('os.path.getmtime', return_value=0.0):
+            assert load_themes_raw() is not first
+
 
 class TestLoadThemes:
     """Tests for load_themes function."""
@@ -129,6 +143,10 @@ class TestGetThemeNames:
                 name = names[i]
                 assert themes.get(name, {}).get("is_light", False) is True
 
+    def test_cached_while_themes_unchanged(self):
+        """Should reuse the sorted list until the themes are reloaded."""
+        assert get_theme_names() is get_theme_names()
+
 
 class TestIsLightTheme:
     """Tests for is_light_theme function."""
@@ -178,6 +196,19 @@ class TestGetColorThemes:
             for theme_id, theme_data in themes.items():
                 assert "name" in theme_data
 
+    def test_cached_until_themes_reload(self, mock_curses):
+        """Should reuse the dict until load_themes() returns a new one."""
+        with patch('somafm_tui.themes.curses', mock_curses):
+            first = get_color_themes()
+
+            assert get_color_themes() is first
+
+            with patch('somafm_tui.themes.load_themes',
+                       return_value={"x": dict.fromkeys(
+                           ("name", "bg_color", "header", "selected", "info",
+                            "metadata", "instructions", "favorite"), 1)}):
+                assert list(get_color_themes()) == ["x"]
+
 
 class TestApplyTheme:
     """Tests for apply_theme function."""
@@ -206,6 +237,20 @@ class TestApplyTheme:
             # Should initialize color pairs
             assert mock_curses.init_pair.call_count >= 6
 
+    def test_initializes_only_active_theme_colors(self, mock_curses):
+        """Should call init_color only for the applied theme's colors."""
+        reset_theme_cache()
+        with patch('somafm_tui.themes.curses', mock_curses):
+            apply_theme("default")
+
+            themes = load_themes()
+            expected = {themes["default"][key] for key in (
+                "bg_color", "header", "selected", "info",
+                "metadata", "instructions", "favorite")}
+            initialized = {c.args[0] for c in mock_curses.init_color.call_args_list}
+            assert initialized == expected
+        reset_theme_cache()
+
 
 class TestInitCustomColors:
     """Tests for init_custom_colors function."""
@@ -14,6 +14,7 @@ from somafm_tui.ui import (
     get_music_symbol,
     get_favorite_icon,
     get_channel_icon,
+    _truncate,
 )
 from somafm_tui.models import Channel, TrackMetadata
 
@@ -131,14 +132,51 @@ class TestUIScreenInit:
     def test_invalidate_cache(self):
         """Should invalidate all cache entries."""
         screen = UIScreen()
-        screen._prev_channels_hash = 123
+        screen._prev_channels = []
         screen._prev_selected_index = 5
 
         screen.invalidate_cache()
 
-        assert screen._prev_channels_hash == 0
+        assert screen._prev_channels is None
         assert screen._prev_selected_index == -1
 
+    def test_geometry_cached_until_invalidated(self):
+        """Should query the terminal size only after invalidation."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (24, 80)
+
+        assert screen.get_geometry(mock_stdscr) == (24, 80)
+        mock_stdscr.getmaxyx.return_value = (30, 100)
+        assert screen.get_geometry(mock_stdscr) == (24, 80)
+
+        screen.invalidate_cache()
+        assert screen.get_geometry(mock_stdscr) == (30, 100)
+        assert mock_stdscr.getmaxyx.call_count == 2
+
+    def test_set_cursor_visible_skips_unchanged(self):
+        """Should only call curs_set when visibility changes."""
+        screen = UIScreen()
+
+        with patch('curses.curs_set') as mock_curs_set:
+            screen.set_cursor_visible(0)
+            screen.set_cursor_visible(0)
+            screen.set_cursor_visible(1)
+
+        assert mock_curs_set.call_args_list == [call(0), call(1)]
+
+    def test_init_attrs(self):
+        """Should precompute attributes from the color pairs."""
+        screen = UIScreen()
+
+        with patch('curses.color_pair', side_effect=lambda n: n << 8):
+            screen.init_attrs()
+
+        assert screen.attr_text == 1 << 8
+        assert screen.attr_header == (1 << 8) | curses.A_BOLD
+        assert screen.attr_selected == (2 << 8) | curses.A_REVERSE
+        assert screen.attr_hint_dim == (5 << 8) | curses.A_DIM
+
 
 class TestMetadataHistory:
     """Tests for metadata history methods."""
@@ -163,6 +201,20 @@ class TestMetadataHistory:
 
         assert len(screen.track_history) == 3
 
+    def test_history_version_tracks_mutations(self):
+        """Should bump the history version only when history changes."""
+        screen = UIScreen()
+        version = screen._history_version
+
+        screen.add_to_history(TrackMetadata(artist="Artist", title="Title"))
+        assert screen._history_version == version + 1
+
+        screen.add_to_history(TrackMetadata(artist="Artist", title="Title"))
+        assert screen._history_version == version + 1
+
+        screen.clear_history()
+        assert screen._history_version == version + 2
+
     def test_update_metadata(self):
         """Should update current metadata."""
         screen = UIScreen()
@@ -240,12 +292,212 @@ class TestChannelListRedraw:
             mock_stdscr.clrtoeol.assert_not_called()
 
             # Verify channel text was drawn
-            addstr_calls = [c.args for c in mock_stdscr.addstr.call_args_list]
+            draw_calls = [
+                c.args for c in
+                mock_stdscr.addstr.call_args_list + mock_stdscr.addnstr.call_args_list
+            ]
             channel_drawn = any(
-                len(a) >= 3 and "Ch0" in str(a[2]) for a in addstr_calls
+                len(a) >= 3 and "Ch0" in str(a[2]) for a in draw_calls
             )
             assert channel_drawn, "Channel row should be drawn"
 
+    def test_redraw_channel_list_skips_unchanged_rows(self):
+        """Should only rewrite rows whose text or selection changed."""
+        screen = UIScreen()
+        screen.attr_selected = 7
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (24, 80)
+        channels = [Channel(id=f"c{i}", title=f"Ch{i}") for i in range(5)]
+        kwargs = dict(channel_favorites=set(), split_x=30, panel_height=22)
+
+        screen._redraw_channel_list(mock_stdscr, channels, 0, 0, **kwargs)
+        assert mock_stdscr.addnstr.call_count == 5
+
+        mock_stdscr.reset_mock()
+        screen._redraw_channel_list(mock_stdscr, channels, 1, 0, **kwargs)
+        drawn_rows = [c.args[0] for c in mock_stdscr.addnstr.call_args_list]
+        assert drawn_rows == [1, 2]
+
+        mock_stdscr.reset_mock()
+        screen.invalidate_cache()
+        screen._redraw_channel_list(mock_stdscr, channels, 1, 0, **kwargs)
+        assert mock_stdscr.addnstr.call_count == 5
+
+    def test_put_channel_row_skips_rows_outside_screen(self):
+        """Should not draw (or remember) rows below the terminal."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (10, 80)
+
+        screen._put_channel_row(mock_stdscr, 12, 0, 30, "row", 0)
+
+        mock_stdscr.addnstr.assert_not_called()
+        assert 12 not in screen._channel_rows_drawn
+
+    def test_put_channel_row_swallows_curses_error(self):
+        """Should retry a row that failed to draw on the next frame."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (24, 80)
+        mock_stdscr.addnstr.side_effect = curses.error
+
+        screen._put_channel_row(mock_stdscr, 1, 0, 30, "row", 0)
+
+        assert 1 not in screen._channel_rows_drawn
+
+    def test_channel_row_text_cached(self):
+        """Should build each row string once and reuse it."""
+        screen = UIScreen()
+        channel = Channel(id="c1", title="Groove Salad")
+
+        first = screen._channel_row_text(channel, is_favorite=False, is_selected=True)
+        second = screen._channel_row_text(channel, is_favorite=False, is_selected=True)
+
+        assert first == ">   Groove Salad"
+        assert first is second
+        assert screen._channel_row_text(channel, False, False) == "    Groove Salad"
+
+    def test_search_change_redraws_only_channel_panel(self):
+        """Should not erase the screen and should blank leftover rows."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (24, 80)
+        channels = [Channel(id=f"c{i}", title=f"Ch{i}") for i in range(5)]
+
+        screen.display(mock_stdscr, channels, 0, 0, set())
+        mock_stdscr.erase.assert_called_once()
+
+        mock_stdscr.reset_mock()
+        screen.display(
+            mock_stdscr, channels[:2], 0, 0, set(),
+            is_searching=True, search_query="ch",
+        )
+
+        mock_stdscr.erase.assert_not_called()
+        mock_stdscr.clrtoeol.assert_not_called()
+        assert sorted(screen._channel_rows_drawn) == [0, 1, 2]
+        drawn = [c.args[2].rstrip() for c in mock_stdscr.addnstr.call_args_list]
+        assert "Channels (2)" in drawn
+        assert drawn.count("Search: ch") == 1
+
+    def test_plain_row_written_in_one_call(self):
+        """Should pad rows drawn with the blank's attribute instead of
+        clearing them first."""
+        screen = UIScreen()
+        screen.attr_text, screen.attr_selected = 1, 2
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (24, 80)
+
+        screen._put_channel_row(mock_stdscr, 1, 0, 10, "Ch0", 1)
+        screen._put_channel_row(mock_stdscr, 2, 0, 10, "Ch1", 2)
+
+        assert mock_stdscr.addnstr.call_args_list == [
+            call(1, 0, "Ch0      ", 9, 1),
+            call(2, 0, "Ch1", 9, 2),
+        ]
+        mock_stdscr.hline.assert_called_once_with(2, 0, " ", 9, 1)
+
+
+class TestPlaybackPanelRedraw:
+    """Tests for the playback panel row diffing."""
+
+    def test_unchanged_rows_skipped_and_stale_rows_cleared(self):
+        """Should rewrite only changed rows and clear rows that went away."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (24, 80)
+        channel = Channel(id="groovesalad", title="Groove Salad", description="Chill")
+        screen.add_to_history(TrackMetadata(artist="A", title="One"))
+        args = (mock_stdscr, 31, 0, 49, 22, channel, None, True)
+
+        screen._display_playback_panel(*args)
+        first_rows = [c.args[0] for c in mock_stdscr.addnstr.call_args_list]
+        assert 5 in first_rows
+
+        mock_stdscr.reset_mock()
+        screen._display_playback_panel(*args)
+        mock_stdscr.addnstr.assert_not_called()
+        mock_stdscr.clrtoeol.assert_not_called()
+
+        mock_stdscr.reset_mock()
+        screen.clear_history()
+        screen._display_playback_panel(*args)
+        mock_stdscr.addnstr.assert_not_called()
+        mock_stdscr.move.assert_called_once_with(5, 31)
+
+    def test_rows_limited_to_screen_height(self):
+        """Should draw every info row that fits, including the last one."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (4, 80)
+        channel = Channel(id="groovesalad", title="Groove Salad", listeners=5)
+
+        screen._display_playback_panel(mock_stdscr, 31, 0, 49, 2, channel, None, True)
+
+        drawn_rows = [c.args[0] for c in mock_stdscr.addnstr.call_args_list]
+        assert drawn_rows == [0, 1, 2, 3]
+
+    def test_unchanged_frame_skips_playback_panel(self):
+        """Should not redraw the playback panel or channel list when nothing changed."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (24, 80)
+        channels = [Channel(id="groovesalad", title="Groove Salad")]
+        favorites = frozenset()
+
+        screen.display(mock_stdscr, channels, 0, 0, favorites,
+                       current_channel=channels[0], is_playing=True)
+        with patch.object(screen, '_display_playback_panel') as mock_panel, \
+             patch.object(screen, '_display_channels_panel') as mock_channels:
+            screen.display(mock_stdscr, channels, 0, 0, favorites,
+                           current_channel=channels[0], is_playing=True)
+            mock_panel.assert_not_called()
+            mock_channels.assert_not_called()
+
+            screen.display(mock_stdscr, list(channels), 0, 0, favorites,
+                           current_channel=channels[0], is_playing=True)
+            mock_channels.assert_called_once()
+
+
+class TestInstructionLayout:
+    """Tests for the footer instruction layout."""
+
+    def test_layout_cached_per_width(self):
+        """Should compute the layout once per width and pad every line."""
+        screen = UIScreen()
+
+        first = screen._layout_instructions(79, 2)
+
+        assert first is screen._layout_instructions(79, 2)
+        assert 1 <= len(first) <= 2
+        assert all(len(line) == 79 for line in first)
+        assert screen._layout_instructions(40, 2) is not first
+
+    def test_layout_truncates_long_item(self):
+        """Should truncate an item wider than the screen with an ellipsis."""
+        screen = UIScreen()
+
+        lines = screen._layout_instructions(5, 2)
+
+        assert lines[0].endswith("...")
+        assert len(lines) <= 2
+
+    def test_footer_skipped_when_unchanged(self):
+        """Should only redraw the footer when its lines or position change."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+
+        screen._display_instructions(mock_stdscr, 24, 80)
+        assert mock_stdscr.addstr.call_count >= 1
+
+        mock_stdscr.reset_mock()
+        screen._display_instructions(mock_stdscr, 24, 80)
+        mock_stdscr.addstr.assert_not_called()
+
+        screen.invalidate_cache()
+        screen._display_instructions(mock_stdscr, 24, 80)
+        assert mock_stdscr.addstr.call_count >= 1
+
 
 class TestNotification:
     """Tests for notification methods."""
@@ -259,6 +511,24 @@ class TestNotification:
         assert screen.volume_display == 75
         assert screen.volume_display_time > 0
 
+    def test_show_notification_batches_updates(self):
+        """Should stage output and restore the screen without clearing it."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (24, 80)
+        notif_win = Mock()
+
+        with patch('curses.newwin', return_value=notif_win), \
+             patch('curses.napms'), \
+             patch('curses.doupdate') as mock_doupdate:
+            screen.show_notification(mock_stdscr, "Theme: Default", timeout=0.1)
+
+        assert mock_doupdate.call_count == 2
+        notif_win.refresh.assert_not_called()
+        notif_win.clear.assert_not_called()
+        mock_stdscr.refresh.assert_not_called()
+        mock_stdscr.touchwin.assert_called_once()
+
 
 class TestDisplayHelpers:
     """Tests for display helper methods."""
@@ -276,6 +546,55 @@ class TestDisplayHelpers:
         # Volume indicator should be cleared (method handles it)
 
 
+class TestSleepOverlay:
+    """Tests for display_sleep_overlay method."""
+
+    def test_overlay_does_not_refresh(self):
+        """Should leave flushing the frame to the caller."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (24, 80)
+
+        with patch('curses.curs_set'):
+            screen.display_sleep_overlay(mock_stdscr, "15")
+
+        mock_stdscr.refresh.assert_not_called()
+        mock_stdscr.addnstr.assert_called_once()
+
+    def test_box_edges_drawn_as_whole_lines(self):
+        """Should write each horizontal border with a single call."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+
+        screen._draw_box(mock_stdscr, 2, 4, 4, 6)
+
+        drawn = [c.args[:3] for c in mock_stdscr.addstr.call_args_list]
+        assert drawn[0] == (2, 4, "┌────┐")
+        assert drawn[-1] == (5, 4, "└────┘")
+        assert len(drawn) == 6
+
+
+class TestTruncate:
+    """Tests for _truncate helper."""
+
+    def test_short_text_unchanged(self):
+        """Should return text that fits as is."""
+        assert _truncate("Groove Salad", 20) == "Groove Salad"
+
+    def test_long_text_gets_ellipsis(self):
+        """Should cut long text and end it with an ellipsis."""
+        assert _truncate("Groove Salad", 8) == "Groov..."
+
+    def test_narrow_width_has_no_ellipsis(self):
+        """Should hard-cut when there is no room for the ellipsis."""
+        assert _truncate("Groove Salad", 3) == "Gro"
+
+    def test_no_room_returns_empty(self):
+        """Should return an empty string for zero or negative widths."""
+        assert _truncate("Groove Salad", 0) == ""
+        assert _truncate("Groove Salad", -2) == ""
+
+
 class TestVolumeBarRendering:
     """Tests for volume bar rendering fixes."""
 
@@ -331,6 +650,19 @@ class TestVolumeBarRendering:
             # Should end with percentage, not extra blocks
             assert text.strip() == '50%' or text == ' 50%', f"Expected percentage, got: {text!r}"
 
+    def test_volume_bar_uses_prebuilt_strings(self):
+        """Should draw the shared bar strings, clamped to the bar width."""
+        screen = UIScreen()
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (24, 80)
+
+        screen.show_volume(mock_stdscr, 130)
+        screen._draw_volume_indicator(mock_stdscr)
+
+        texts = [c.args[2] for c in mock_stdscr.addstr.call_args_list]
+        assert texts[1] is ui_module._VOLUME_BARS[20][0]
+        assert "▁" not in "".join(texts)
+
 
 class TestDisplayHelpers:
     """Tests for display helper methods."""
@@ -346,3 +678,18 @@ class TestDisplayHelpers:
         screen._handle_volume_display(mock_stdscr)
 
         # Volume indicator should be cleared (method handles it)
+
+    def test_expire_volume(self):
+        """Should hide the indicator only after the timeout."""
+        screen = UIScreen()
+        screen.show_volume(Mock(), 75)
+        screen._prev_channels = []
+
+        assert screen.expire_volume() is False
+        assert screen.volume_display == 75
+
+        screen.volume_display_time = 0  # Expired
+        assert screen.expire_volume() is True
+        assert screen.volume_display is None
+        assert screen._prev_channels is None
+        assert screen.expire_volume() is False